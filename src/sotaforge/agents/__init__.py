@@ -2,8 +2,8 @@
 
 __all__ = [
     "analyzer_server",
-    "db_agent",
-    "filter_agent",
+    "db_server",
+    "filter_server",
     "orchestrator",
     "parser_server",
     "search_server",
@@ -45,7 +45,7 @@ async def analyze_documents(
         "Retrieving documents from collection: %s",
         document_to_process_collection,
     )
-    documents = db_store.fetch_documents(document_to_process_collection)
+    documents = await db_store.fetch_documents_async(document_to_process_collection)
 
     if not documents:
         logger.warning(
@@ -111,7 +111,7 @@ async def analyze_documents(
     logger.info("Analysis complete: %s documents analyzed", len(analyzed_docs))
 
     # Store enriched documents automatically (full content) in destination collection
-    db_store.upsert_documents(document_processed_collection, analyzed_docs)
+    await db_store.upsert_documents_async(document_processed_collection, analyzed_docs)
 
     # Return trimmed payload to limit tokens sent back to the LLM
     return {
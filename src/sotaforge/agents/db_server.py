@@ -46,7 +46,9 @@ def _parse_documents_from_dict(
 )
 async def store_records(collection: str, items: List[Dict[str, Any]]) -> Dict[str, Any]:
     """Store or update documents in a ChromaDB collection."""
-    ids = store.upsert_documents(collection, _parse_documents_from_dict(items))
+    ids = await store.upsert_documents_async(
+        collection, _parse_documents_from_dict(items)
+    )
     return {"collection": collection, "count": len(ids), "ids": ids}
 
 
@@ -69,7 +71,7 @@ async def fetch_documents(collection: str, limit: int | None = None) -> Dict[str
         Dict with collection name, count, and list of documents as dicts
 
     """
-    documents = store.fetch_documents(collection, limit=limit)
+    documents = await store.fetch_documents_async(collection, limit=limit)
     return {
         "collection": collection,
         "count": len(documents),
@@ -201,7 +203,9 @@ async def store_tool_results(
     )
 
     logger.debug(f"Storing documents into collection: {collection}")
-    ids = store.upsert_documents(collection, _parse_documents_from_dict(items_to_store))
+    ids = await store.upsert_documents_async(
+        collection, _parse_documents_from_dict(items_to_store)
+    )
 
     logger.info(
         f"Successfully stored {len(ids)} documents in collection '{collection}'"
@@ -40,7 +40,7 @@ async def filter_results(
     """
     # Step 1: Retrieve documents from collection
     logger.info(f"Retrieving documents from collection: {collection}")
-    documents = db_store.fetch_documents(collection)
+    documents = await db_store.fetch_documents_async(collection)
 
     if not documents:
         logger.warning(f"No documents found in collection '{collection}'")
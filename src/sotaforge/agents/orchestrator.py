@@ -108,7 +108,7 @@ async def _emit_tool_progress(tool_name: str, tool_args: dict[str, Any]) -> None
                 from sotaforge.utils.db import ChromaStore
 
                 db = ChromaStore()
-                docs = db.fetch_documents(collection)
+                docs = await db.fetch_documents_async(collection)
                 await emit_progress(
                     step,
                     f"Retrieved {len(docs)} documents from collection: {collection}",
@@ -133,7 +133,7 @@ async def _emit_tool_progress(tool_name: str, tool_args: dict[str, Any]) -> None
                 from sotaforge.utils.db import ChromaStore
 
                 db = ChromaStore()
-                docs = db.fetch_documents(collection)
+                docs = await db.fetch_documents_async(collection)
                 await emit_progress(
                     step, f"Retrieved {len(docs)} documents from: {collection}", step
                 )
@@ -159,7 +159,7 @@ async def _emit_tool_progress(tool_name: str, tool_args: dict[str, Any]) -> None
                 from sotaforge.utils.db import ChromaStore
 
                 db = ChromaStore()
-                docs = db.fetch_documents(collection)
+                docs = await db.fetch_documents_async(collection)
                 await emit_progress(
                     step, f"Retrieved {len(docs)} documents from: {collection}", step
                 )
@@ -46,7 +46,7 @@ async def parse_documents(
         "Retrieving documents from collection: %s",
         document_to_process_collection,
     )
-    documents = db_store.fetch_documents(document_to_process_collection)
+    documents = await db_store.fetch_documents_async(document_to_process_collection)
 
     if not documents:
         logger.warning(
@@ -109,7 +109,7 @@ async def parse_documents(
     logger.info(f"Successfully parsed {len(parsed_docs)}/{len(documents)} documents")
 
     # Store full parsed documents in destination collection
-    db_store.upsert_documents(document_processed_collection, parsed_docs)
+    await db_store.upsert_documents_async(document_processed_collection, parsed_docs)
 
     # Return trimmed payload to reduce LLM token usage
     return {
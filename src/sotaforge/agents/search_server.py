@@ -1,14 +1,19 @@
 """Combined search server for web and papers."""
 
-import json
+import asyncio
 import os
 from typing import Any, Dict, List, Union
 
 import feedparser
-import requests
+import httpx
 from fastmcp import FastMCP
 
-from sotaforge.utils.constants import ARXIV_API, MAX_RESULTS, SERPER_URL
+from sotaforge.utils.constants import (
+    ARXIV_API,
+    MAX_RESULTS,
+    REQUEST_TIMEOUT_WEB,
+    SERPER_URL,
+)
 from sotaforge.utils.errors import ConfigurationError, SearchError
 from sotaforge.utils.logger import get_logger
 from sotaforge.utils.models import NotParsedDocument, SourceType
@@ -59,43 +64,39 @@ async def search_web(
 
     results: List[NotParsedDocument] = []
 
-    for page in range(1, num_pages + 1):
-        logger.debug(f"Fetching page {page} for query: {query}")
+    headers = {"X-API-KEY": api_key}
 
-        payload = json.dumps(
-            {
-                "q": query,
-                "page": page,
-            }
-        )
+    # One pooled async client for all result pages of this search
+    async with httpx.AsyncClient(
+        headers=headers, timeout=REQUEST_TIMEOUT_WEB
+    ) as client:
+        for page in range(1, num_pages + 1):
+            logger.debug(f"Fetching page {page} for query: {query}")
 
-        headers = {
-            "X-API-KEY": api_key,
-            "Content-Type": "application/json",
-        }
-
-        try:
-            response = requests.post(SERPER_URL, headers=headers, data=payload)
-            response.raise_for_status()
-            data = response.json()
-
-            for item in data.get("organic", []):
-                if len(results) >= max_results:
-                    break
-
-                results.append(
-                    NotParsedDocument(
-                        title=item.get("title", "No title"),
-                        url=item.get("link", ""),
-                        snippet=item.get("snippet", "No snippet available"),
-                        source_type=SourceType.WEB,
-                    )
+            try:
+                response = await client.post(
+                    SERPER_URL, json={"q": query, "page": page}
                 )
-                logger.debug(f"Found: {item.get('link', '')}")
+                response.raise_for_status()
+                data = response.json()
+
+                for item in data.get("organic", []):
+                    if len(results) >= max_results:
+                        break
+
+                    results.append(
+                        NotParsedDocument(
+                            title=item.get("title", "No title"),
+                            url=item.get("link", ""),
+                            snippet=item.get("snippet", "No snippet available"),
+                            source_type=SourceType.WEB,
+                        )
+                    )
+                    logger.debug(f"Found: {item.get('link', '')}")
 
-        except Exception as e:
-            logger.exception(f"Error during search for '{query}' page {page}: {e}")
-            continue
+            except Exception as e:
+                logger.exception(f"Error during search for '{query}' page {page}: {e}")
+                continue
 
     logger.info(f"Collected {len(results)} web results for query: {query}")
     return {"query": query, "results": [doc.to_dict() for doc in results]}
@@ -141,7 +142,8 @@ async def search_papers(
     )
 
     try:
-        feed = feedparser.parse(url)
+        # feedparser downloads the feed with blocking I/O
+        feed = await asyncio.to_thread(feedparser.parse, url)
     except Exception as e:
         logger.warning(f"Failed to query arXiv: {e}")
         return {"query": query, "results": []}
@@ -196,6 +198,4 @@ async def launch_search_server() -> None:
 
 
 if __name__ == "__main__":
-    import asyncio
-
     asyncio.run(server.run_stdio_async())
@@ -31,7 +31,7 @@ async def write_sota(collection: str) -> Dict[str, Union[str, str]]:
     llm = get_llm()
 
     # Fetch all analyzed documents from the collection
-    documents = db_store.fetch_documents(collection)
+    documents = await db_store.fetch_documents_async(collection)
     logger.info(f"Retrieved {len(documents)} documents from '{collection}'")
 
     if not documents:
@@ -71,7 +71,7 @@ async def write_sota(collection: str) -> Dict[str, Union[str, str]]:
         {"role": "system", "content": SYNTHESIZER_SYSTEM_PROMPT},
         {
             "role": "user",
-            "content": (f"{SYNTHESIZER_PROMPT} {docs_content}"),
+            "content": f"{SYNTHESIZER_PROMPT}\n{docs_content}",
         },
     ]
 
@@ -10,12 +10,16 @@ import uuid
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 from datetime import datetime
+from pathlib import Path
 from typing import Any, Dict
 
+import orjson
+from anyio import to_thread
 from dotenv import load_dotenv
-from fastapi import BackgroundTasks, FastAPI, HTTPException
+from fastapi import BackgroundTasks, FastAPI, HTTPException, Request
+from fastapi.encoders import jsonable_encoder
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel, Field
 
 from sotaforge.utils.constants import (
@@ -24,9 +28,19 @@ from sotaforge.utils.constants import (
     API_HOST,
     API_PORT,
     API_TITLE,
+    API_WORKER_THREADS,
+    CHROMA_POOL_SIZE,
+    PROGRESS_QUEUE_MAXSIZE,
+    STREAM_DISCONNECT_CHECK_INTERVAL,
+    TERMINAL_STATUSES,
 )
+from sotaforge.utils.db import CHROMA_PATH_CTX, ChromaStore
 from sotaforge.utils.logger import get_logger
 from sotaforge.utils.mail import send_email
+from sotaforge.utils.parsing import close_http_client
+from sotaforge.utils.utils import ProgressQueue
+
+__all__ = ["app", "main"]
 
 # Load environment variables from .env.secrets file
 load_dotenv(".env.secrets")
@@ -45,6 +59,11 @@ tasks: Dict[str, Dict[str, Any]] = {}
 progress_queues: Dict[str, asyncio.Queue[Any]] = {}
 cancelled_tasks: set[str] = set()  # Track cancelled tasks
 
+# Reusable per-request Chroma directories (filled at startup), kept under a
+# root created per process so workers never share them
+CHROMA_POOL_PARENT: str | None = None  # None: the system temp directory
+chroma_dir_pool: asyncio.Queue[str] = asyncio.Queue()
+
 
 class SOTARequest(BaseModel):
     """Request model for SOTA generation."""
@@ -64,12 +83,47 @@ class SOTAResponse(BaseModel):
     result: Dict[str, Any]
 
 
+# MCP agent modules, imported in dependency order (orchestrator last)
+AGENT_MODULES = (
+    "sotaforge.agents.db_server",
+    "sotaforge.agents.filter_server",
+    "sotaforge.agents.parser_server",
+    "sotaforge.agents.analyzer_server",
+    "sotaforge.agents.synthesizer_server",
+    "sotaforge.agents.orchestrator",
+)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Startup and shutdown lifecycle."""
     logger.info("SOTAforge API starting up")
+    # Sync endpoints and blocking calls (Chroma, sync HTTP) share AnyIO's
+    # default 40-thread limiter; size it explicitly so bursts of concurrent
+    # tasks queue for a thread instead of starving each other
+    to_thread.current_default_thread_limiter().total_tokens = API_WORKER_THREADS
+    # Import the agent stack once instead of on every request
+    try:
+        for name in AGENT_MODULES:
+            importlib.import_module(name)
+        app.state.orchestrator = sys.modules[AGENT_MODULES[-1]]
+    except Exception as e:
+        logger.warning(f"Deferring agent module loading to first request: {e}")
+    # Create the Chroma directories once; requests borrow and reset them
+    pool_root = Path(tempfile.mkdtemp(prefix="sotaforge_pool_", dir=CHROMA_POOL_PARENT))
+    app.state.chroma_pool_root = pool_root
+    for i in range(CHROMA_POOL_SIZE):
+        pool_dir = pool_root / str(i)
+        pool_dir.mkdir()
+        chroma_dir_pool.put_nowait(str(pool_dir))
     yield
     logger.info("SOTAforge API shutting down")
+    # Directories still borrowed are deleted by their request on release
+    app.state.chroma_pool_root = None
+    while not chroma_dir_pool.empty():
+        await asyncio.to_thread(_delete_chroma_dir, chroma_dir_pool.get_nowait())
+    shutil.rmtree(pool_root, ignore_errors=True)
+    await close_http_client()
 
 
 # Initialize FastAPI app
@@ -123,7 +177,7 @@ async def generate_sota(
 
     """
     task_id = str(uuid.uuid4())
-    progress_queues[task_id] = asyncio.Queue()
+    progress_queues[task_id] = ProgressQueue(maxsize=PROGRESS_QUEUE_MAXSIZE)
     tasks[task_id] = {
         "status": "pending",
         "topic": request.topic,
@@ -139,8 +193,153 @@ async def generate_sota(
     return {"task_id": task_id}
 
 
+def _progress(status: str, message: str, ts: str | None = None) -> Dict[str, Any]:
+    """Build a progress event for the SSE stream.
+
+    Args:
+        status: Current status, also used as the step name
+        message: Human-readable message
+        ts: Optional ISO timestamp shared by events emitted together
+
+    Returns:
+        Progress event dictionary
+
+    """
+    return {
+        "status": status,
+        "message": message,
+        "step": status,
+        "timestamp": ts or datetime.now().isoformat(),
+    }
+
+
+def _public_task(task: Dict[str, Any]) -> Dict[str, Any]:
+    """Return the task record without internal underscore-prefixed keys."""
+    return {k: v for k, v in task.items() if not k.startswith("_")}
+
+
+def _cache_task_json(task_id: str) -> None:
+    """Serialize a finished task once so repeated status polls reuse the bytes.
+
+    Args:
+        task_id: Unique task identifier
+
+    """
+    task = tasks[task_id]
+    if task.get("status") in TERMINAL_STATUSES:
+        try:
+            task["_cached_json"] = orjson.dumps(_public_task(task))
+        except TypeError as e:
+            # Leave the task to FastAPI's encoder on the uncached path
+            logger.warning(f"Not caching status JSON for task {task_id}: {e}")
+
+
+def _encode_event(progress: Dict[str, Any]) -> bytes:
+    """Serialize a progress event to JSON bytes for the SSE stream.
+
+    Args:
+        progress: Progress event dictionary
+
+    Returns:
+        JSON-encoded event, going through FastAPI's encoder for values orjson
+        rejects (e.g. sets, pydantic models or non-string keys)
+
+    """
+    try:
+        return orjson.dumps(progress)
+    except TypeError:
+        return orjson.dumps(jsonable_encoder(progress), option=orjson.OPT_NON_STR_KEYS)
+
+
+def _cancel_abandoned_task(task_id: str) -> None:
+    """Stop a running task whose progress stream was dropped by the client.
+
+    Tasks with an email recipient keep running since their results are still
+    delivered by mail.
+
+    Args:
+        task_id: Unique task identifier
+
+    """
+    task = tasks.get(task_id)
+    if not task or task.get("email") or task.get("status") in TERMINAL_STATUSES:
+        return
+
+    handle = task.get("_task")
+    if handle is not None and not handle.done():
+        logger.info(f"Client disconnected, cancelling task {task_id}")
+        handle.cancel()
+
+
+def _acquire_chroma_dir() -> str:
+    """Borrow a pooled Chroma directory, or create a temporary one if none free."""
+    try:
+        return chroma_dir_pool.get_nowait()
+    except asyncio.QueueEmpty:
+        return tempfile.mkdtemp(prefix="sotaforge_sota_")
+
+
+def _delete_chroma_dir(chroma_dir: str) -> None:
+    """Close and delete a Chroma directory (blocking).
+
+    Args:
+        chroma_dir: Directory to remove
+
+    """
+    ChromaStore.release(chroma_dir)
+    shutil.rmtree(chroma_dir, ignore_errors=True)
+
+
+async def _release_chroma_dir(chroma_dir: str) -> None:
+    """Reset and return a pooled Chroma directory, or delete a temporary one.
+
+    The SQLite and filesystem work runs in a worker thread.
+
+    Args:
+        chroma_dir: Directory obtained from _acquire_chroma_dir
+
+    """
+    pool_root = getattr(app.state, "chroma_pool_root", None)
+    if pool_root is not None and Path(chroma_dir).parent == pool_root:
+        try:
+            await asyncio.to_thread(ChromaStore(path=chroma_dir).reset)
+            chroma_dir_pool.put_nowait(chroma_dir)
+            logger.info(f"Returned Chroma DB to pool: {chroma_dir}")
+            return
+        except Exception as e:
+            logger.warning(f"Failed to reset pooled Chroma DB {chroma_dir}: {e}")
+
+    await asyncio.to_thread(_delete_chroma_dir, chroma_dir)
+    logger.info(f"Cleaned up temporary Chroma DB: {chroma_dir}")
+
+
 async def run_sota_generation(task_id: str, topic: str, email: str) -> None:
-    """Run SOTA generation and emit progress updates.
+    """Run SOTA generation in its own task and wait for it to finish.
+
+    The pipeline task handle is stored on the task record so the stream
+    endpoint can stop the generation if the client leaves, without cancelling
+    the request task that runs this background job.
+
+    Args:
+        task_id: Unique task identifier
+        topic: Research topic
+        email: User's email address for receiving results
+
+    """
+    pipeline = asyncio.create_task(_generate_sota(task_id, topic, email))
+    tasks[task_id]["_task"] = pipeline
+    try:
+        await pipeline
+    except asyncio.CancelledError:
+        current = asyncio.current_task()
+        # Cancelled from outside (e.g. server shutdown): propagate it
+        if current is not None and current.cancelling():
+            raise
+        # Only the pipeline was cancelled; its outcome is already recorded
+
+
+async def _generate_sota(task_id: str, topic: str, email: str) -> None:
+    """Run the SOTA pipeline and emit progress updates.
 
     Args:
         task_id: Unique task identifier
@@ -149,17 +348,12 @@ async def run_sota_generation(task_id: str, topic: str, email: str) -> None:
 
     """
     queue = progress_queues[task_id]
-    temp_chroma_dir = tempfile.mkdtemp(prefix="sotaforge_sota_")
-    previous_chroma_path = os.environ.get("SOTAFORGE_CHROMA_PATH")
+    temp_chroma_dir = _acquire_chroma_dir()
+    chroma_token = None
 
     try:
         await queue.put(
-            {
-                "status": "initializing",
-                "message": "Initializing SOTA generation system...",
-                "step": "initializing",
-                "timestamp": datetime.now().isoformat(),
-            }
+            _progress("initializing", "Initializing SOTA generation system...")
         )
 
         # Check if task was cancelled
@@ -169,18 +363,13 @@ async def run_sota_generation(task_id: str, topic: str, email: str) -> None:
             await queue.put({"status": "cancelled", "message": "Task cancelled"})
             return
 
-        # Set the environment variable for this specific request
-        os.environ["SOTAFORGE_CHROMA_PATH"] = temp_chroma_dir
+        # Scope the database path to this request's context only
+        chroma_token = CHROMA_PATH_CTX.set(temp_chroma_dir)
         logger.info(f"Starting SOTA generation for: {topic}")
         logger.info(f"Using temporary Chroma DB: {temp_chroma_dir}")
 
         await queue.put(
-            {
-                "status": "initializing",
-                "message": "Setting up isolated database environment...",
-                "step": "initializing",
-                "timestamp": datetime.now().isoformat(),
-            }
+            _progress("initializing", "Setting up isolated database environment...")
         )
 
         # Preflight: ensure required API keys are present
@@ -200,68 +389,35 @@ async def run_sota_generation(task_id: str, topic: str, email: str) -> None:
             tasks[task_id]["error"] = msg
             return
 
-        await queue.put(
-            {
-                "status": "loading",
-                "message": "Verifying API credentials...",
-                "step": "loading",
-                "timestamp": datetime.now().isoformat(),
-            }
-        )
-
-        await queue.put(
-            {
-                "status": "loading",
-                "message": "Loading MCP agent modules...",
-                "step": "loading",
-                "timestamp": datetime.now().isoformat(),
-            }
-        )
-
-        # Import (or reload) MCP agents after setting the env var
-        module_names = [
-            "sotaforge.agents.db_server",
-            "sotaforge.agents.filter_server",
-            "sotaforge.agents.parser_server",
-            "sotaforge.agents.analyzer_server",
-            "sotaforge.agents.synthesizer_server",
-            "sotaforge.agents.orchestrator",
-        ]
-        for name in module_names:
-            agent_name = name.split(".")[-1].replace("_", " ").title()
-            await queue.put(
-                {
-                    "status": "loading",
-                    "message": f"Loading {agent_name}...",
-                    "step": "loading",
-                    "timestamp": datetime.now().isoformat(),
-                }
-            )
-            if name in sys.modules:
-                importlib.reload(sys.modules[name])
-            else:
+        # Back-to-back events describe the same moment; share one timestamp
+        ts = datetime.now().isoformat()
+        await queue.put(_progress("loading", "Verifying API credentials...", ts))
+
+        # Agents are preloaded once at startup; only import them here when the
+        # app was started without its lifespan (e.g. direct calls in tests)
+        orchestrator: Any = getattr(app.state, "orchestrator", None)
+        if orchestrator is None:
+            await queue.put(_progress("loading", "Loading MCP agent modules...", ts))
+            for name in AGENT_MODULES:
+                agent_name = name.split(".")[-1].replace("_", " ").title()
+                await queue.put(_progress("loading", f"Loading {agent_name}..."))
                 importlib.import_module(name)
+            orchestrator = importlib.import_module(AGENT_MODULES[-1])
 
+        ts = datetime.now().isoformat()
         await queue.put(
-            {
-                "status": "loading",
-                "message": "Configuring orchestrator and injecting dependencies...",
-                "step": "loading",
-                "timestamp": datetime.now().isoformat(),
-            }
+            _progress(
+                "loading", "Configuring orchestrator and injecting dependencies...", ts
+            )
         )
 
-        orchestrator = sys.modules["sotaforge.agents.orchestrator"]
         # Inject the progress queue into orchestrator
-        orchestrator.progress_queue = queue  # type: ignore[attr-defined]
+        orchestrator.progress_queue = queue
 
         await queue.put(
-            {
-                "status": "running",
-                "message": "All systems ready. Starting SOTA generation pipeline...",
-                "step": "running",
-                "timestamp": datetime.now().isoformat(),
-            }
+            _progress(
+                "running", "All systems ready. Starting SOTA generation pipeline...", ts
+            )
         )
 
         # Call the orchestrator (now bound to the per-request DB)
@@ -272,12 +428,7 @@ async def run_sota_generation(task_id: str, topic: str, email: str) -> None:
         # Send email with the results if email was provided
         if email:
             await queue.put(
-                {
-                    "status": "sending_email",
-                    "message": "Sending results to your email...",
-                    "step": "sending_email",
-                    "timestamp": datetime.now().isoformat(),
-                }
+                _progress("sending_email", "Sending results to your email...")
             )
 
             try:
@@ -302,6 +453,11 @@ async def run_sota_generation(task_id: str, topic: str, email: str) -> None:
             }
         )
 
+    except asyncio.CancelledError:
+        logger.info(f"Task {task_id} cancelled before completion")
+        tasks[task_id]["status"] = "cancelled"
+        await queue.put({"status": "cancelled", "message": "Task cancelled"})
+        raise
     except Exception as e:
         logger.error(f"Error generating SOTA: {str(e)}", exc_info=True)
         error_msg = f"Failed to generate SOTA: {str(e)}"
@@ -309,19 +465,20 @@ async def run_sota_generation(task_id: str, topic: str, email: str) -> None:
         tasks[task_id]["error"] = error_msg
         await queue.put({"status": "failed", "message": error_msg})
     finally:
-        # Clean up the temporary directory
-        shutil.rmtree(temp_chroma_dir, ignore_errors=True)
-        logger.info(f"Cleaned up temporary Chroma DB: {temp_chroma_dir}")
+        # Hand the directory back to the pool (or delete it)
+        await _release_chroma_dir(temp_chroma_dir)
+
+        if chroma_token is not None:
+            CHROMA_PATH_CTX.reset(chroma_token)
 
-        # Restore the previous environment variable
-        if previous_chroma_path:
-            os.environ["SOTAFORGE_CHROMA_PATH"] = previous_chroma_path
-        elif "SOTAFORGE_CHROMA_PATH" in os.environ:
-            del os.environ["SOTAFORGE_CHROMA_PATH"]
+        tasks[task_id].pop("_task", None)
 
-        # Signal end of stream
+        # Signal end of stream before anything else that could fail
         await queue.put(None)
 
+        # Results no longer change once the task is finished
+        _cache_task_json(task_id)
+
         # Clean up cancelled task tracking
         if task_id in cancelled_tasks:
             cancelled_tasks.remove(task_id)
@@ -344,35 +501,42 @@ async def cancel_sota(task_id: str) -> Dict[str, str]:
     # Mark task as cancelled
     cancelled_tasks.add(task_id)
     tasks[task_id]["status"] = "cancelled"
+    tasks[task_id].pop("_cached_json", None)
 
     logger.info(f"Task {task_id} marked for cancellation")
 
     return {"status": "cancelled", "message": "Task cancellation requested"}
 
 
-@app.get("/api/sota/status/{task_id}")
-async def get_sota_status(task_id: str) -> Dict[str, Any]:
+@app.get("/api/sota/status/{task_id}", response_model=None)
+async def get_sota_status(task_id: str) -> Response | Dict[str, Any]:
     """Get the status of a SOTA generation task.
 
     Args:
         task_id: Unique identifier for the generation task
 
     Returns:
-        Task status information
+        Task status information, served from the cached JSON once the task
+        has finished
 
     """
     if task_id not in tasks:
         raise HTTPException(status_code=404, detail="Task not found")
 
-    return tasks[task_id]
+    cached = tasks[task_id].get("_cached_json")
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
+    return _public_task(tasks[task_id])
 
 
 @app.get("/api/sota/stream/{task_id}")
-async def stream_sota_progress(task_id: str) -> StreamingResponse:
+async def stream_sota_progress(task_id: str, request: Request) -> StreamingResponse:
     """Stream SOTA generation progress via Server-Sent Events.
 
     Args:
         task_id: Unique identifier for the generation task
+        request: Incoming request, polled to detect client disconnects
 
     Returns:
         StreamingResponse with SSE events
@@ -381,25 +545,37 @@ async def stream_sota_progress(task_id: str) -> StreamingResponse:
     if task_id not in progress_queues:
         raise HTTPException(status_code=404, detail="Task not found")
 
-    async def event_generator() -> AsyncGenerator[str, None]:
+    async def event_generator() -> AsyncGenerator[bytes, None]:
         """Generate SSE events from the progress queue."""
         queue = progress_queues[task_id]
+        finished = False
 
         try:
             while True:
-                # Wait for next progress update
-                progress = await queue.get()
+                # Wait for next progress update, checking for a gone client
+                # while the pipeline is quiet
+                try:
+                    progress = await asyncio.wait_for(
+                        queue.get(), timeout=STREAM_DISCONNECT_CHECK_INTERVAL
+                    )
+                except asyncio.TimeoutError:
+                    if await request.is_disconnected():
+                        break
+                    continue
 
                 # None signals end of stream
                 if progress is None:
+                    finished = True
                     break
 
-                # Send as SSE event
-                import json
-
-                yield f"data: {json.dumps(progress)}\n\n"
+                # Send as SSE event, pre-encoded to skip the str -> bytes pass
+                yield b"data: " + _encode_event(progress) + b"\n\n"
 
         finally:
+            # Nobody is listening anymore; don't keep producing for a dead queue
+            if not finished:
+                _cancel_abandoned_task(task_id)
+
             # Clean up queue when done
             if task_id in progress_queues:
                 del progress_queues[task_id]
@@ -2,10 +2,12 @@
 
 __all__ = [
     "constants",
-    "dataclasses",
     "db",
     "errors",
+    "llm",
     "logger",
+    "mail",
+    "models",
     "parsing",
     "prompts",
     "utils",
@@ -11,22 +11,31 @@ MODEL: str = "gpt-5-nano"
 PDF_PARSING_MAX_TOKENS = 65535  # Maximum tokens for PDF text extraction
 PDF_PARSING_TEMPERATURE = 0.1  # Temperature for PDF parsing
 MAX_ORCHESTRATOR_MESSAGES = 80
+LLM_MAX_CONNECTIONS = 20  # Upper bound on open connections to the LLM API
+LLM_MAX_KEEPALIVE_CONNECTIONS = 10  # Idle connections kept warm for reuse
+LLM_KEEPALIVE_EXPIRY = 30.0  # Seconds an idle LLM connection stays pooled
 
 # Search constants
 SERPER_URL = "https://google.serper.dev/search"
 ARXIV_API = "http://export.arxiv.org/api/query"
 MAX_RESULTS = 3
 CHROMA_PATH = "data/chroma"
+CHROMA_UPSERT_BATCH_SIZE = 200  # Max documents sent to Chroma per upsert call
 
 # API Configuration
 API_HOST = "0.0.0.0"
 API_PORT = 8000
 API_TITLE = "SOTAforge API"
 API_DESCRIPTION = "REST API for generating State-of-the-Art research summaries"
-ALLOWED_ORIGINS = [
+ALLOWED_ORIGINS = (
     "http://localhost:3000",  # Next.js default dev server
     os.getenv("FRONTEND_URL", "http://localhost:3000"),
-]
+)
+API_WORKER_THREADS = 64  # Threads for sync endpoints and blocking offloaded calls
+PROGRESS_QUEUE_MAXSIZE = 256  # Max pending progress events buffered per task
+TERMINAL_STATUSES = frozenset({"completed", "failed", "cancelled"})  # Final states
+STREAM_DISCONNECT_CHECK_INTERVAL = 5.0  # Seconds idle before polling for disconnect
+CHROMA_POOL_SIZE = 4  # Pre-created Chroma directories reused across requests
 
 # Pipeline tuning constants
 MAX_MESSAGE_HISTORY = 30  # Trim message history to prevent token overages
@@ -39,13 +48,25 @@ MAX_RETRIES = 3  # Maximum validation retries per pipeline step
 # Request timeouts (in seconds)
 REQUEST_TIMEOUT_WEB = 10  # Timeout for fetching web pages
 REQUEST_TIMEOUT_PDF = 30  # Timeout for fetching PDF files
+MAX_PDF_BYTES = 25 * 1024 * 1024  # Downloads larger than this are aborted
+WEB_FAST_PATH_MIN_CHARS = 500  # Min <article>/<main> text to skip trafilatura
+HTTP_MAX_CONNECTIONS = 50  # Upper bound on open connections for page/PDF fetches
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 8  # Idle fetch connections kept for reuse
+HTTP_KEEPALIVE_EXPIRY = 60.0  # Seconds an idle fetch connection stays open
 
 # Rate limiting
 MAX_CONCURRENT_PARSING_REQUESTS = 1  # Limit concurrent PDF/web parsing requests
 MAX_CONCURRENT_PDF_PAGES = 5  # Limit concurrent PDF page parsing
+MAX_CONCURRENT_DB_OPERATIONS = 4  # Limit concurrent Chroma reads/writes
+MAX_CONCURRENT_HTTP_REQUESTS = 10  # Limit in-flight page/PDF downloads overall
+MAX_CONCURRENT_REQUESTS_PER_HOST = 4  # Limit in-flight downloads per host
 
 # PDF parsing limits
 MAX_PARSED_PDF_PAGES = 10
+PDF_TAIL_PAGES = 3  # Of those, pages taken from the end (conclusions, results)
+PDF_PAGES_PER_VLM_REQUEST = 4  # Page images sent together in one VLM call
+PDF_NATIVE_TEXT_MIN_CHARS = 500  # Embedded text needed to skip the VLM for a page
+PARSE_CACHE_SIZE = 256  # Extracted texts kept in memory, keyed by URL/arXiv id
 
 
 class CollectionNames(Enum):
@@ -2,22 +2,63 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
+import logging
 import os
+from contextvars import ContextVar
 from pathlib import Path
-from typing import Any, Iterable, List
-from uuid import uuid4
+from typing import Any, ClassVar, Iterable, List
 
 import chromadb
+import orjson
+from chromadb.api import ClientAPI
 from chromadb.api.models.Collection import Collection
+from chromadb.api.shared_system_client import SharedSystemClient
 from chromadb.utils.embedding_functions import EmbeddingFunction
 
-from sotaforge.utils.constants import CHROMA_PATH
+from sotaforge.utils.constants import (
+    CHROMA_PATH,
+    CHROMA_UPSERT_BATCH_SIZE,
+    MAX_CONCURRENT_DB_OPERATIONS,
+)
 from sotaforge.utils.logger import get_logger
 from sotaforge.utils.models import Document, NotParsedDocument, ParsedDocument
 
 logger = get_logger(__name__)
 
+# Shared by every null embedding; Chroma only reads it
+_ZERO_VECTOR = [0.0] * 64
+
+# Metadata key holding every list/dict field of a document as one JSON blob
+_PACKED_KEY = "_complex"
+
+# Leading characters of per-field JSON values written by older versions
+_JSON_PREFIXES = ("[", "{")
+
+# Shared by all stores: they hit the same embedded SQLite writer
+_db_semaphore = asyncio.Semaphore(MAX_CONCURRENT_DB_OPERATIONS)
+
+# Per-request Chroma path; context-local so concurrent requests never collide
+CHROMA_PATH_CTX: ContextVar[str | None] = ContextVar("chroma_path", default=None)
+
+
+def _decode_per_field_json(doc_dict: dict[str, Any]) -> None:
+    """Decode list/dict values stored one JSON string per field, in place.
+
+    Args:
+        doc_dict: Metadata of a document written before fields were packed.
+
+    """
+    for key, value in doc_dict.items():
+        if isinstance(value, str) and value.startswith(_JSON_PREFIXES):
+            try:
+                doc_dict[key] = orjson.loads(value)
+            except orjson.JSONDecodeError:
+                # Be forgiving if stored metadata isn't valid JSON
+                logger.warning(
+                    "Failed to decode metadata key '%s'; keeping raw string", key
+                )
+
 
 class NullEmbeddingFunction(EmbeddingFunction[list[str]]):
     """Null embedding function that satisfies Chroma without real embeddings.
@@ -45,33 +86,103 @@ class NullEmbeddingFunction(EmbeddingFunction[list[str]]):
             List of zero vectors (no actual embedding).
 
         """
-        return [[0.0] * 64 for _ in input]
+        return [_ZERO_VECTOR] * len(input)
 
 
 class ChromaStore:
     """Lightweight wrapper around Chroma persistent client."""
 
+    # Bumped by reset() and release() so every store drops collection handles
+    # it cached
+    _reset_epoch: ClassVar[int] = 0
+
+    # One client per storage path, shared by every store so release() can
+    # drop it for all of them
+    _clients: ClassVar[dict[Path, ClientAPI]] = {}
+
     def __init__(self, path: str | Path | None = None) -> None:
         """Initialize ChromaStore with a persistent storage path.
 
         Args:
-            path: Path to store Chroma data. Defaults to SOTAFORGE_CHROMA_PATH
-                environment variable or CHROMA_PATH constant.
+            path: Path to store Chroma data. When omitted, the store follows
+                CHROMA_PATH_CTX, then the SOTAFORGE_CHROMA_PATH environment
+                variable (or the CHROMA_PATH constant) at call time, so
+                module-level stores pick up the per-request database without
+                being re-created.
 
         """
-        self.path = Path(path or os.getenv("SOTAFORGE_CHROMA_PATH") or CHROMA_PATH)
-        self.path.mkdir(parents=True, exist_ok=True)
-        self.client = chromadb.PersistentClient(path=str(self.path))
+        self._path = Path(path) if path else None
+        self._collections: dict[tuple[Path, str], Collection] = {}
+        self._collections_epoch = ChromaStore._reset_epoch
         self.embedder = NullEmbeddingFunction()
         logger.debug(f"Initialized ChromaStore at {self.path}")
 
-    def get_collection(self, name: str) -> Collection:
-        """Return a collection, creating it if missing."""
-        return self.client.get_or_create_collection(
-            name=name,
-            embedding_function=self.embedder,  # type: ignore[arg-type]
+    @property
+    def path(self) -> Path:
+        """Return the storage path currently in effect."""
+        return self._path or Path(
+            CHROMA_PATH_CTX.get() or os.getenv("SOTAFORGE_CHROMA_PATH") or CHROMA_PATH
         )
 
+    @property
+    def client(self) -> ClientAPI:
+        """Return the Chroma client for the current path, creating it once."""
+        path = self.path
+        client = ChromaStore._clients.get(path)
+        if client is None:
+            path.mkdir(parents=True, exist_ok=True)
+            client = chromadb.PersistentClient(path=str(path))
+            ChromaStore._clients[path] = client
+        return client
+
+    def get_collection(self, name: str) -> Collection:
+        """Return a collection, creating it if missing (cached per path)."""
+        if self._collections_epoch != ChromaStore._reset_epoch:
+            self._collections.clear()
+            self._collections_epoch = ChromaStore._reset_epoch
+        key = (self.path, name)
+        col = self._collections.get(key)
+        if col is None:
+            col = self.client.get_or_create_collection(
+                name=name,
+                embedding_function=self.embedder,  # type: ignore[arg-type]
+            )
+            self._collections[key] = col
+        return col
+
+    def reset(self) -> None:
+        """Delete every collection so the storage path can be reused empty."""
+        for col in self.client.list_collections():
+            self.client.delete_collection(col.name)
+        ChromaStore._reset_epoch += 1
+        logger.debug(f"Reset ChromaStore at {self.path}")
+
+    @classmethod
+    def release(cls, path: str | Path) -> None:
+        """Forget a storage path that is about to be deleted.
+
+        Drops the cached client and collection handles of every store for the
+        path and stops Chroma's shared system for it, closing its SQLite
+        connections.
+
+        Args:
+            path: Storage path that will no longer be used
+
+        """
+        path = Path(path)
+        if cls._clients.pop(path, None) is None:
+            return
+        cls._reset_epoch += 1
+        # Chroma has no public way to close one persistent client: its only
+        # public hook, clear_system_cache(), drops the systems of every path
+        # and breaks clients other requests are still using. Evict just this
+        # path's system from the private registry instead (chromadb is pinned
+        # below 2.0 in pyproject.toml for this reason).
+        system = SharedSystemClient._identifier_to_system.pop(str(path), None)
+        if system is not None:
+            system.stop()
+        logger.debug(f"Released ChromaStore at {path}")
+
     def upsert_documents(
         self, collection: str, documents: Iterable[Document]
     ) -> List[str]:
@@ -85,7 +196,9 @@ class ChromaStore:
             return []
 
         col = self.get_collection(collection)
-        ids = [str(uuid4()) for _ in items]
+        # One urandom call for the whole batch; 128 random bits per id
+        rand = os.urandom(16 * len(items))
+        ids = [rand[i : i + 16].hex() for i in range(0, len(rand), 16)]
         docs = []
         for d in items:
             # For ParsedDocument, use text; for NotParsedDocument, use
@@ -96,15 +209,29 @@ class ChromaStore:
                 doc_text = ""
             docs.append(doc_text)
 
-        metadatas = [
-            {
-                k: (json.dumps(v) if isinstance(v, (list, dict)) else v)
-                for k, v in d.to_dict().items()
-                if k != "text"
-            }
-            for d in items
-        ]
-        col.upsert(ids=ids, documents=docs, metadatas=metadatas)  # type: ignore[arg-type]
+        metadatas = []
+        for d in items:
+            # Scalars are stored as-is; lists/dicts go into one JSON blob
+            metadata: dict[str, Any] = {}
+            packed: dict[str, Any] = {}
+            for k, v in d.to_dict().items():
+                if k == "text":
+                    continue
+                if type(v) in (list, dict):
+                    packed[k] = v
+                else:
+                    metadata[k] = v
+            if packed:
+                metadata[_PACKED_KEY] = orjson.dumps(packed).decode()
+            metadatas.append(metadata)
+        # Chunk large upserts to keep each Chroma call bounded in size
+        for start in range(0, len(ids), CHROMA_UPSERT_BATCH_SIZE):
+            end = start + CHROMA_UPSERT_BATCH_SIZE
+            col.upsert(
+                ids=ids[start:end],
+                documents=docs[start:end],
+                metadatas=metadatas[start:end],  # type: ignore[arg-type]
+            )
         logger.debug(f"Upserted {len(ids)} documents into '{collection}'")
         return ids
 
@@ -128,45 +255,68 @@ class ChromaStore:
             logger.debug(f"No documents found in collection '{collection}'")
             return []
 
-        documents: list[Document] = []
-        for i in range(len(results["ids"])):
-            logger.debug(f"Reconstructing document {i} from fetched results")
-            logger.debug(f"Results : {results}")
-            metadatas = results.get("metadatas")
-            documents_list = results.get("documents")
-
-            metadata = metadatas[i] if metadatas else {}
-            doc_text = documents_list[i] if documents_list else ""
-
-            # Reconstruct document dict with parsed JSON fields
-            doc_dict = {}
-            for key, value in metadata.items():
-                if isinstance(value, str) and value.startswith(("[", "{")):
-                    try:
-                        doc_dict[key] = json.loads(value)
-                    except json.JSONDecodeError:
-                        # Be forgiving if stored metadata isn't valid JSON
-                        logger.warning(
-                            "Failed to decode metadata key '%s'; keeping raw string",
-                            key,
-                        )
-                        doc_dict[key] = value
-                else:
-                    doc_dict[key] = value
+        # Chroma returns parallel columns; walk them together
+        count = len(results["ids"])
+        metadatas = results.get("metadatas") or [{}] * count
+        texts = results.get("documents") or [""] * count
 
-            # Add text field if stored
-            if doc_text:
-                doc_dict["text"] = doc_text
+        documents: list[Document] = []
+        for metadata, doc_text in zip(metadatas, texts):
+            doc_dict: dict[str, Any] = dict(metadata)
+            packed = doc_dict.pop(_PACKED_KEY, None)
+            if isinstance(packed, str):
+                doc_dict.update(orjson.loads(packed))
+            else:
+                _decode_per_field_json(doc_dict)
 
             # Return ParsedDocument if has text, otherwise NotParsedDocument
-            if doc_dict.get("text") and isinstance(doc_dict.get("text"), str):
-                logger.debug(
-                    f"Document {doc_dict.get('title', 'unknown')} has text : "
-                    f"{doc_dict.get('text')[:100]}..."  # type: ignore[index]
-                )
+            if doc_text and isinstance(doc_text, str):
+                doc_dict["text"] = doc_text
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "Document %s has text : %s...",
+                        doc_dict.get("title", "unknown"),
+                        doc_text[:100],
+                    )
                 documents.append(ParsedDocument.from_dict(doc_dict))
             else:
                 documents.append(NotParsedDocument.from_dict(doc_dict))
 
         logger.debug(f"Fetched {len(documents)} documents from '{collection}'")
         return documents
+
+    async def upsert_documents_async(
+        self, collection: str, documents: Iterable[Document]
+    ) -> List[str]:
+        """Run upsert_documents in a worker thread, throttled across stores.
+
+        Args:
+            collection: Name of the ChromaDB collection to write to
+            documents: ParsedDocument or NotParsedDocument instances to store
+
+        Returns:
+            Ids assigned to the stored documents
+
+        """
+        async with _db_semaphore:
+            return await asyncio.to_thread(
+                self.upsert_documents, collection, list(documents)
+            )
+
+    async def fetch_documents_async(
+        self, collection: str, limit: int | None = None
+    ) -> List[Document]:
+        """Run fetch_documents in a worker thread, throttled across stores.
+
+        Args:
+            collection: Name of the ChromaDB collection to fetch from
+            limit: Optional limit on number of documents to retrieve
+
+        Returns:
+            List of ParsedDocument or NotParsedDocument instances
+
+        """
+        async with _db_semaphore:
+            return await asyncio.to_thread(
+                self.fetch_documents, collection, limit=limit
+            )
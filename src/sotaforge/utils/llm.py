@@ -22,11 +22,17 @@ Usage:
 import os
 from functools import lru_cache
 
-from openai import AsyncOpenAI
+import httpx
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
 from pydantic_ai.models.openai import OpenAIChatModel
 from pydantic_ai.providers.openai import OpenAIProvider
 
-from sotaforge.utils.constants import MODEL
+from sotaforge.utils.constants import (
+    LLM_KEEPALIVE_EXPIRY,
+    LLM_MAX_CONNECTIONS,
+    LLM_MAX_KEEPALIVE_CONNECTIONS,
+    MODEL,
+)
 from sotaforge.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -53,8 +59,17 @@ def get_llm() -> AsyncOpenAI:
             "Create a .env.secrets file with your API key."
         )
 
+    # Size the pool for the pipeline's concurrency; keep the SDK's timeouts
+    http_client = DefaultAsyncHttpxClient(
+        limits=httpx.Limits(
+            max_connections=LLM_MAX_CONNECTIONS,
+            max_keepalive_connections=LLM_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=LLM_KEEPALIVE_EXPIRY,
+        )
+    )
+
     logger.info("Initialized AsyncOpenAI client")
-    return AsyncOpenAI(api_key=api_key)
+    return AsyncOpenAI(api_key=api_key, http_client=http_client)
 
 
 @lru_cache(maxsize=1)
@@ -1,43 +1,83 @@
 """Configures and provides a logger for the application."""
 
+import atexit
 import logging
 import os
+import queue
 from datetime import datetime
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener
 
+_FORMATTER = logging.Formatter(
+    "%(asctime)s [%(levelname)s] %(name)s - %(message)s", "%Y-%m-%d %H:%M:%S"
+)
 
-def get_logger(name: str | None = None, log_dir: str = "logs") -> logging.Logger:
-    """Initialize and return a configured logger.
+# Records buffered before the file is written (errors flush immediately)
+_FILE_BUFFER_CAPACITY = 512
+
+# Queue handler shared by every logger writing to the same directory
+_handlers: dict[str, QueueHandler] = {}
+
+
+def _get_handler(log_dir: str) -> QueueHandler:
+    """Return the queue handler for log_dir, starting its listener once.
+
+    Records are only enqueued by the caller; a background listener thread
+    formats them and performs the file and console writes.
 
     Args:
-        name (str): Optional module name for the logger.
         log_dir (str): Directory where log files are saved.
 
     Returns:
-        logging.Logger: Configured logger instance.
+        QueueHandler: Handler feeding the background listener for log_dir.
 
     """
-    os.makedirs(log_dir, exist_ok=True)
-    log_file = os.path.join(log_dir, f"{datetime.now():%Y-%m-%d}.log")
-
-    logger = logging.getLogger(name or __name__)
-    logger.setLevel(logging.DEBUG)
-
-    if not logger.handlers:
-        formatter = logging.Formatter(
-            "%(asctime)s [%(levelname)s] %(name)s - %(message)s", "%Y-%m-%d %H:%M:%S"
-        )
+    handler = _handlers.get(log_dir)
+    if handler is None:
+        os.makedirs(log_dir, exist_ok=True)
+        log_file = os.path.join(log_dir, f"{datetime.now():%Y-%m-%d}.log")
 
         # File handler (capture everything)
         file_handler = logging.FileHandler(log_file, mode="a", encoding="utf-8")
         file_handler.setLevel(logging.DEBUG)
-        file_handler.setFormatter(formatter)
+        file_handler.setFormatter(_FORMATTER)
+        buffered_file_handler = MemoryHandler(
+            _FILE_BUFFER_CAPACITY, flushLevel=logging.ERROR, target=file_handler
+        )
 
         # Console handler (info and above only)
         console_handler = logging.StreamHandler()
         console_handler.setLevel(logging.INFO)
-        console_handler.setFormatter(formatter)
+        console_handler.setFormatter(_FORMATTER)
+
+        log_queue: queue.Queue[logging.LogRecord] = queue.Queue(-1)
+        listener = QueueListener(
+            log_queue,
+            buffered_file_handler,
+            console_handler,
+            respect_handler_level=True,
+        )
+        listener.start()
+        atexit.register(listener.stop)
 
-        logger.addHandler(file_handler)
-        logger.addHandler(console_handler)
+        handler = _handlers[log_dir] = QueueHandler(log_queue)
+    return handler
+
+
+def get_logger(name: str | None = None, log_dir: str = "logs") -> logging.Logger:
+    """Initialize and return a configured logger.
+
+    Args:
+        name (str): Optional module name for the logger.
+        log_dir (str): Directory where log files are saved.
+
+    Returns:
+        logging.Logger: Configured logger instance.
+
+    """
+    logger = logging.getLogger(name or __name__)
+    logger.setLevel(logging.DEBUG)
+
+    if not logger.handlers:
+        logger.addHandler(_get_handler(log_dir))
 
     return logger
@@ -1,8 +1,8 @@
 """Data classes for SOTAforge."""
 
-from dataclasses import asdict, dataclass, field
+from dataclasses import MISSING, dataclass, field, fields
 from enum import Enum
-from typing import Any, Dict, List, Mapping, Self, Union
+from typing import Any, Callable, Dict, List, Mapping, Self, Union, get_origin
 
 
 class SourceType(str, Enum):
@@ -13,7 +13,85 @@ class SourceType(str, Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+_SOURCE_TYPE_BY_VALUE: Dict[str, SourceType] = {st.value: st for st in SourceType}
+
+
+def _as_list(value: Any) -> List[Any]:
+    """Return value if it is already a list, else a list built from it."""
+    return value if type(value) is list else list(value or [])
+
+
+def _as_dict(value: Any) -> Dict[str, Any]:
+    """Return value if it is already a dict, else a dict built from it."""
+    return value if type(value) is dict else dict(value or {})
+
+
+def _field_reader(name: str, field_type: Any, default: Any) -> str:
+    """Return the source expression that reads one field from ``data``."""
+    origin = get_origin(field_type) or field_type
+    if field_type is SourceType:
+        return f'_parse_source_type(get("{name}", "unknown"))'
+    if origin is list:
+        return f'_as_list(get("{name}"))'
+    if origin is dict:
+        return f'_as_dict(get("{name}"))'
+    if field_type is int:
+        return f'int(get("{name}") or 0)'
+    return f'get("{name}", {default!r})'
+
+
+# Compiled from_dict readers, one per document class
+_from_dict_readers: Dict[type, Callable[[Mapping[str, Any]], Any]] = {}
+
+
+def _from_dict_reader(cls: type) -> Callable[[Mapping[str, Any]], Any]:
+    """Return the compiled from_dict reader for cls, building it once.
+
+    Args:
+        cls: Document dataclass to read.
+
+    Returns:
+        Function creating a cls instance from a mapping.
+
+    """
+    reader = _from_dict_readers.get(cls)
+    if reader is None:
+        reader = _from_dict_readers[cls] = _build_from_dict(cls)
+    return reader
+
+
+def _build_from_dict(cls: Any) -> Callable[[Mapping[str, Any]], Any]:
+    """Generate and compile a specialized from_dict for a document class.
+
+    Mirrors how ``dataclasses`` builds ``__init__``: the field list is turned
+    into straight-line source once, so each call is a single constructor call
+    with no per-field introspection.
+
+    Args:
+        cls: Document dataclass to generate the reader for.
+
+    Returns:
+        Function creating a cls instance from a mapping, filling missing
+        fields with defaults.
+
+    """
+    lines = ["def from_dict(data):", "    get = data.get", "    return cls("]
+    for f in fields(cls):
+        default = "" if f.default is MISSING else f.default
+        lines.append(f"        {f.name}={_field_reader(f.name, f.type, default)},")
+    lines.append("    )")
+
+    namespace: Dict[str, Any] = {
+        "cls": cls,
+        "_as_list": _as_list,
+        "_as_dict": _as_dict,
+        "_parse_source_type": cls._parse_source_type,
+    }
+    exec("\n".join(lines), namespace)
+    return namespace["from_dict"]
+
+
+@dataclass(slots=True)
 class Document:
     """Base document class with common fields across pipeline stages."""
 
@@ -32,44 +110,38 @@ class Document:
     metadata: Dict[str, Union[str, int, List[str]]] = field(default_factory=dict)
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to JSON-serializable dict."""
-        return asdict(self)
+        """Convert to JSON-serializable dict (shallow copies, no deepcopy)."""
+        return {
+            "title": self.title,
+            "url": self.url,
+            "source_type": self.source_type,
+            "snippet": self.snippet,
+            "abstract": self.abstract,
+            "authors": list(self.authors),
+            "year": self.year,
+            "venue": self.venue,
+            "metadata": dict(self.metadata),
+        }
 
     @classmethod
     def _parse_source_type(cls, source_type_str: str) -> SourceType:
         """Parse source type string to enum, defaulting to UNKNOWN."""
-        return (
-            SourceType(source_type_str)
-            if source_type_str in {st.value for st in SourceType}
-            else SourceType.UNKNOWN
-        )
+        return _SOURCE_TYPE_BY_VALUE.get(source_type_str, SourceType.UNKNOWN)
 
     @classmethod
     def from_dict(cls, data: Mapping[str, Any]) -> Self:
         """Create from a mapping, filling missing fields with defaults."""
-        source_type_str = data.get("source_type", "unknown")
-        source_type = cls._parse_source_type(source_type_str)
-        return cls(
-            title=data.get("title", ""),
-            url=data.get("url", ""),
-            source_type=source_type,
-            snippet=data.get("snippet", ""),
-            abstract=data.get("abstract", ""),
-            authors=list(data.get("authors", []) or []),
-            year=int(data.get("year", 0) or 0),
-            venue=data.get("venue", ""),
-            metadata=dict(data.get("metadata", {}) or {}),
-        )
+        return _from_dict_reader(cls)(data)
 
 
-@dataclass
+@dataclass(slots=True)
 class NotParsedDocument(Document):
     """Document before parsing - contains metadata but no extracted text."""
 
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedDocument(Document):
     """Fully parsed document that evolved through the pipeline."""
 
@@ -80,38 +152,36 @@ class ParsedDocument(Document):
     themes: List[str] = field(default_factory=list)
     insights: List[str] = field(default_factory=list)
 
-    def to_dict_with_text_limit(self, char_limit: int) -> Dict[str, Any]:
-        """Convert to dict, limiting text field to char_limit characters."""
-        doc_dict = self.to_dict()
-        if len(self.text) > char_limit:
-            doc_dict["text"] = self.text[:char_limit] + "...[truncated]"
+    def _to_dict_with_text(self, text: str) -> Dict[str, Any]:
+        """Convert to dict, using the given text for the text field."""
+        doc_dict = Document.to_dict(self)
+        doc_dict["text"] = text
+        doc_dict["themes"] = list(self.themes)
+        doc_dict["insights"] = list(self.insights)
         return doc_dict
 
-    @classmethod
-    def from_dict(cls, data: Mapping[str, Any]) -> "ParsedDocument":
-        """Create a ParsedDocument from a mapping, filling missing with defaults."""
-        source_type_str = data.get("source_type", "unknown")
-        source_type = cls._parse_source_type(source_type_str)
-        return cls(
-            title=data.get("title", ""),
-            url=data.get("url", ""),
-            source_type=source_type,
-            snippet=data.get("snippet", ""),
-            abstract=data.get("abstract", ""),
-            authors=list(data.get("authors", []) or []),
-            year=int(data.get("year", 0) or 0),
-            venue=data.get("venue", ""),
-            text=data.get("text", ""),
-            themes=list(data.get("themes", []) or []),
-            insights=list(data.get("insights", []) or []),
-            metadata=dict(data.get("metadata", {}) or {}),
-        )
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to JSON-serializable dict, including parse/analysis fields."""
+        return self._to_dict_with_text(self.text)
+
+    def to_dict_with_text_limit(self, char_limit: int) -> Dict[str, Any]:
+        """Convert to dict, limiting text field to char_limit characters."""
+        text = self.text
+        if len(text) > char_limit:
+            text = text[:char_limit] + "...[truncated]"
+        return self._to_dict_with_text(text)
 
     @classmethod
     def from_not_parsed(
         cls, not_parsed: NotParsedDocument, **updates: Any
     ) -> "ParsedDocument":
         """Create a ParsedDocument from a NotParsedDocument, adding fields."""
+        extra_metadata = updates.get("metadata")
+        metadata = (
+            {**not_parsed.metadata, **extra_metadata}
+            if extra_metadata
+            else not_parsed.metadata
+        )
         return cls(
             title=not_parsed.title,
             url=not_parsed.url,
@@ -124,11 +194,11 @@ class ParsedDocument(Document):
             text=updates.get("text", ""),
             themes=updates.get("themes", []),
             insights=updates.get("insights", []),
-            metadata={**not_parsed.metadata, **updates.get("metadata", {})},
+            metadata=metadata,
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ThemesAndInsights:
     """Extracted themes and insights (for Pydantic AI output format)."""
 
@@ -136,7 +206,7 @@ class ThemesAndInsights:
     insights: List[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class DocumentScore:
     """Scores for a document on multiple criteria."""
 
@@ -147,4 +217,9 @@ class DocumentScore:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to JSON-serializable dict."""
-        return asdict(self)
+        return {
+            "title": self.title,
+            "scores": dict(self.scores),
+            "mean_score": self.mean_score,
+            "keep": self.keep,
+        }
@@ -2,21 +2,44 @@
 
 import asyncio
 import base64
-import tempfile
+import codecs
+import copy
+import mmap
+import re
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Iterator
+from contextlib import ExitStack, asynccontextmanager, contextmanager
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
+from urllib.parse import urlsplit
 
 import fitz  # PyMuPDF
-import requests
+import httpx
+import lxml.html
+import orjson
 import trafilatura
+from lxml import etree
+from openai.types.chat import ChatCompletion
 
 from sotaforge.utils.constants import (
+    HTTP_KEEPALIVE_EXPIRY,
+    HTTP_MAX_CONNECTIONS,
+    HTTP_MAX_KEEPALIVE_CONNECTIONS,
+    MAX_CONCURRENT_HTTP_REQUESTS,
     MAX_CONCURRENT_PDF_PAGES,
+    MAX_CONCURRENT_REQUESTS_PER_HOST,
     MAX_PARSED_PDF_PAGES,
+    MAX_PDF_BYTES,
     MODEL,
+    PARSE_CACHE_SIZE,
+    PDF_NATIVE_TEXT_MIN_CHARS,
+    PDF_PAGES_PER_VLM_REQUEST,
     PDF_PARSING_MAX_TOKENS,
+    PDF_TAIL_PAGES,
     REQUEST_TIMEOUT_PDF,
     REQUEST_TIMEOUT_WEB,
+    WEB_FAST_PATH_MIN_CHARS,
 )
 from sotaforge.utils.llm import get_llm
 from sotaforge.utils.logger import get_logger
@@ -28,116 +51,609 @@ logger = get_logger(__name__)
 # Semaphore to limit concurrent PDF page parsing
 _pdf_page_semaphore = asyncio.Semaphore(MAX_CONCURRENT_PDF_PAGES)
 
+# Semaphores to limit downloads overall and per host (e.g. arxiv.org); host
+# entries only live while a download for that host is running or waiting
+_http_semaphore = asyncio.Semaphore(MAX_CONCURRENT_HTTP_REQUESTS)
+_host_semaphores: dict[str, asyncio.Semaphore] = {}
+_host_users: dict[str, int] = {}
 
-async def parse_single_page_with_vlm(page_image_b64: str, **kwargs: Any) -> str:
-    """Parse a single PDF page using GPT-5 nano vision model.
+# Extracted full texts of already-parsed documents (LRU order)
+_parse_cache: OrderedDict[str, str] = OrderedDict()
+
+# arXiv abs/pdf/html URLs, for new-style (2401.12345) and old-style
+# (hep-th/9901001, math.GT/0309136) identifiers with an optional version suffix
+_ARXIV_URL = re.compile(
+    r"arxiv\.org/(?:abs|pdf|html)/"
+    r"(?P<id>\d{4}\.\d{4,5}|[a-z][a-z.-]*(?:\.[A-Z]{2})?/\d{7})(?P<version>v\d+)?"
+)
+
+# Image URL swapped for each page's base64 data when a VLM request is encoded
+_IMAGE_URL_PLACEHOLDER = "\x00page-image\x00"
+_IMAGE_URL_PLACEHOLDER_JSON = orjson.dumps(_IMAGE_URL_PLACEHOLDER)[1:-1]
+_PNG_DATA_URL_PREFIX = b"data:image/png;base64,"
+
+# Numbered bibliography entries, e.g. "[12] A. Author, ..."
+_REFERENCE_ENTRY = re.compile(r"^\s*\[\d+\]", re.MULTILINE)
+
+# Shared HTTP client for page/PDF downloads, bound to the loop that created it
+_http_client: httpx.AsyncClient | None = None
+_http_client_loop: asyncio.AbstractEventLoop | None = None
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Return the pooled HTTP client, creating it for the running loop."""
+    global _http_client, _http_client_loop
+    loop = asyncio.get_running_loop()
+    if _http_client is None or _http_client.is_closed or _http_client_loop is not loop:
+        _http_client = httpx.AsyncClient(
+            headers={"User-Agent": "Mozilla/5.0 (SOTAforge)"},
+            follow_redirects=True,
+            limits=httpx.Limits(
+                max_connections=HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                # Outlive the gaps between a run's fetches to the same host so
+                # they skip the DNS lookup and TLS handshake
+                keepalive_expiry=HTTP_KEEPALIVE_EXPIRY,
+            ),
+        )
+        _http_client_loop = loop
+    return _http_client
+
+
+@asynccontextmanager
+async def _download_slot(url: str) -> AsyncIterator[None]:
+    """Hold a download slot for the URL's host, then a global one.
+
+    The host slot is taken first so downloads queued behind a busy host never
+    sit on global slots that other hosts could use.
 
     Args:
-        page_image_b64: Base64-encoded PNG image of the page
+        url: URL about to be downloaded
+
+    """
+    host = urlsplit(url).netloc
+    semaphore = _host_semaphores.get(host)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS_PER_HOST)
+        _host_semaphores[host] = semaphore
+    _host_users[host] = _host_users.get(host, 0) + 1
+    try:
+        async with semaphore, _http_semaphore:
+            yield
+    finally:
+        _host_users[host] -= 1
+        if not _host_users[host]:
+            del _host_users[host], _host_semaphores[host]
+
+
+async def _fetch(url: str, timeout: float) -> httpx.Response:
+    """GET a URL through the shared client within the concurrency limits.
+
+    Args:
+        url: URL to download
+        timeout: Request timeout in seconds
+
+    Returns:
+        The HTTP response
+
+    """
+    async with _download_slot(url):
+        return await _get_http_client().get(url, timeout=timeout)
+
+
+async def _fetch_pdf(url: str, timeout: float) -> bytes | None:
+    """Download a PDF, transferring the body only when the URL serves one.
+
+    The response is streamed: its headers arrive before the body, so pages
+    that turn out not to be PDFs are dropped unread and oversized files are
+    aborted after MAX_PDF_BYTES.
+
+    Args:
+        url: URL to download
+        timeout: Request timeout in seconds
+
+    Returns:
+        The PDF content, or None when the response is not a PDF
+
+    Raises:
+        ValueError: If the PDF is larger than MAX_PDF_BYTES
+
+    """
+    async with _download_slot(url):
+        async with _get_http_client().stream("GET", url, timeout=timeout) as response:
+            response.raise_for_status()
+
+            content_type = response.headers.get("content-type", "").lower()
+            if "pdf" not in content_type:
+                logger.warning(
+                    f"Non-PDF content type: {content_type} - using abstract only"
+                )
+                return None
+
+            if int(response.headers.get("content-length") or 0) > MAX_PDF_BYTES:
+                raise ValueError(f"PDF at {url} exceeds {MAX_PDF_BYTES} bytes")
+            chunks: list[bytes] = []
+            size = 0
+            async for chunk in response.aiter_bytes():
+                size += len(chunk)
+                if size > MAX_PDF_BYTES:
+                    raise ValueError(f"PDF at {url} exceeds {MAX_PDF_BYTES} bytes")
+                chunks.append(chunk)
+    return b"".join(chunks)
+
+
+def _parse_cache_key(url: str) -> str:
+    """Return the parse cache key for a URL (arXiv versions share one key)."""
+    match = _ARXIV_URL.search(url)
+    if match:
+        return "arxiv:" + match["id"]
+    return url
+
+
+def _get_cached_text(key: str) -> str | None:
+    """Return the cached extracted text for key, if any."""
+    text = _parse_cache.get(key)
+    if text is not None:
+        _parse_cache.move_to_end(key)
+    return text
+
+
+def _cache_text(key: str, text: str) -> None:
+    """Cache extracted text for key, evicting the least recently used entry."""
+    _parse_cache[key] = text
+    _parse_cache.move_to_end(key)
+    if len(_parse_cache) > PARSE_CACHE_SIZE:
+        _parse_cache.popitem(last=False)
+
+
+async def close_http_client() -> None:
+    """Close the pooled HTTP client, if one was created."""
+    global _http_client, _http_client_loop
+    if _http_client is not None:
+        await _http_client.aclose()
+    _http_client = None
+    _http_client_loop = None
+
+
+def _vlm_request_body(page_images_b64: list[bytes]) -> bytes:
+    """Serialize a VLM request for the given page images.
+
+    The request is encoded around a placeholder image URL and the base64
+    images are spliced into the JSON in one join, so the multi-megabyte
+    payloads are never decoded to str, copied into data URLs or scanned by
+    the JSON encoder (base64 needs no escaping).
+
+    Args:
+        page_images_b64: Base64-encoded PNG images of the pages, in order
+
+    Returns:
+        The JSON request body
+
+    """
+    image_part = {
+        "type": "image_url",
+        "image_url": {"url": _IMAGE_URL_PLACEHOLDER, "detail": "high"},
+    }
+    content: list[dict[str, Any]] = [{"type": "text", "text": PDF_PARSING_PROMPT}]
+    content.extend(image_part for _ in page_images_b64)
+    payload = {
+        "model": MODEL,
+        "messages": [{"role": "user", "content": content}],
+        "max_completion_tokens": PDF_PARSING_MAX_TOKENS,
+    }
+
+    head, *tails = orjson.dumps(payload).split(_IMAGE_URL_PLACEHOLDER_JSON)
+    parts = [head]
+    for page_image_b64, tail in zip(page_images_b64, tails, strict=True):
+        parts += (_PNG_DATA_URL_PREFIX, page_image_b64, tail)
+    return b"".join(parts)
+
+
+async def parse_pages_with_vlm(page_images_b64: list[bytes], **kwargs: Any) -> str:
+    """Parse consecutive PDF pages in one GPT-5 nano vision model request.
+
+    Args:
+        page_images_b64: Base64-encoded PNG images of the pages, in order
         kwargs: Additional context (e.g. pdf_path, page_num)
 
     Returns:
-        Extracted text from the page
+        Extracted text from the pages
 
     """
+    # Per-page debug logs use %-style arguments so that nothing is formatted
+    # unless debug logging is enabled
     logger.debug(
-        f"Calling VLM for page {kwargs.get('page_num')} "
-        f"from PDF {kwargs.get('pdf_path')}"
+        "Calling VLM for page %s from PDF %s",
+        kwargs.get("page_num"),
+        kwargs.get("pdf_path"),
     )
 
-    content: list[dict[str, Any]] = [
-        {"type": "text", "text": PDF_PARSING_PROMPT},
-        {
-            "type": "image_url",
-            "image_url": {
-                "url": f"data:image/png;base64,{page_image_b64}",
-                "detail": "high",
-            },
-        },
-    ]
-
+    # Post the pre-serialized body as-is, skipping the SDK's param transform
+    # and json encoder
     llm = get_llm()
-    response = await llm.chat.completions.create(
-        model=MODEL,
-        messages=[{"role": "user", "content": content}],  # type: ignore[misc,list-item]
-        max_completion_tokens=PDF_PARSING_MAX_TOKENS,
+    response = await llm.post(
+        "/chat/completions",
+        cast_to=ChatCompletion,
+        body=_vlm_request_body(page_images_b64),
     )
 
     extracted_text = response.choices[0].message.content or ""
     logger.debug(
-        f"VLM extracted {len(extracted_text)} characters"
-        f" from page {kwargs.get('page_num')}"
-        f" of PDF {kwargs.get('pdf_path')}"
+        "VLM extracted %d characters from page %s of PDF %s",
+        len(extracted_text),
+        kwargs.get("page_num"),
+        kwargs.get("pdf_path"),
     )
 
     return extracted_text.strip()
 
 
-async def parse_pdf_with_vlm(pdf_path: Path) -> str:
-    """Parse a PDF using GPT-5 nano vision model with parallel page processing.
+async def parse_single_page_with_vlm(page_image_b64: str, **kwargs: Any) -> str:
+    """Parse a single PDF page using GPT-5 nano vision model.
 
     Args:
-        pdf_path: Path to the PDF file
+        page_image_b64: Base64-encoded PNG image of the page
+        kwargs: Additional context (e.g. pdf_path, page_num)
 
     Returns:
-        Extracted text from the PDF
+        Extracted text from the page
+
+    """
+    return await parse_pages_with_vlm([page_image_b64.encode("ascii")], **kwargs)
+
+
+def _render_page(page: Any) -> bytes:
+    """Render one PDF page to a base64-encoded PNG image.
+
+    Args:
+        page: Loaded PyMuPDF page
+
+    Returns:
+        Base64-encoded PNG image of the page
 
     """
-    import asyncio
+    pix = page.get_pixmap(dpi=150)
+    # Encode to PNG natively (no PIL round-trip), then to base64
+    return base64.b64encode(pix.tobytes("png"))
 
-    logger.debug(f"Converting PDF to images: {pdf_path}")
 
-    # Open PDF with PyMuPDF
-    pdf_document = fitz.open(pdf_path)
+def _text_looks_clean(text: str) -> bool:
+    """Return whether a page's embedded text layer is readable as-is.
 
-    # Limit to first 10 pages for token efficiency
-    page_count = min(len(pdf_document), MAX_PARSED_PDF_PAGES)
-    logger.debug(f"Processing {page_count} pages from PDF")
+    Rejects text layers with broken font encodings, which come out as
+    replacement characters or mostly non-letter symbols.
 
-    # Convert pages to base64-encoded images
-    page_images = []
+    Args:
+        text: Text extracted from the page's text layer
 
-    for page_num in range(page_count):
-        page = pdf_document[page_num]
+    Returns:
+        True when the text can be used instead of the VLM output
 
-        # Render page to image (pixmap)
-        pix = page.get_pixmap(dpi=150)
+    """
+    if text.count("\ufffd") * 100 > len(text):
+        return False
+    letters = sum(char.isalpha() for char in text)
+    return letters * 2 > len(text) - text.count(" ") - text.count("\n")
 
-        # Convert to PNG bytes
-        img_bytes = pix.pil_tobytes(format="PNG")
 
-        # Encode to base64
-        base64_image = base64.b64encode(img_bytes).decode("utf-8")
-        page_images.append(base64_image)
+def _native_page_text(page: Any) -> str | None:
+    """Return a page's embedded text when it makes the VLM call unnecessary.
 
-        logger.debug(f"Processed page {page_num + 1}/{page_count}")
+    Args:
+        page: Loaded PyMuPDF page
 
-    pdf_document.close()
+    Returns:
+        The page text, an empty string for a references page that can be
+        dropped, or None when the page has to be read by the VLM
 
-    # Parse pages in controlled batches using semaphore
+    """
+    text = page.get_text("text").strip()
+    if len(text) < PDF_NATIVE_TEXT_MIN_CHARS or not _text_looks_clean(text):
+        return None
+    # A page made mostly of numbered bibliography entries adds no content
+    if len(_REFERENCE_ENTRY.findall(text)) * 5 > text.count("\n") + 1:
+        return ""
+    return text
 
-    async def parse_with_semaphore(page_img: str, page_num: int) -> str:
-        async with _pdf_page_semaphore:
-            return await parse_single_page_with_vlm(
-                page_img, page_num=page_num, pdf_path=pdf_path
-            )
 
-    tasks = [
-        parse_with_semaphore(page_img, page_num + 1)
-        for page_num, page_img in enumerate(page_images)
-    ]
+def _load_page(pdf_document: Any, page_num: int) -> tuple[str | None, bytes | None]:
+    """Read a page's embedded text, rendering the page only when it is needed.
 
-    page_texts = await asyncio.gather(*tasks)
+    Args:
+        pdf_document: Open PyMuPDF document
+        page_num: Zero-based index of the page
+
+    Returns:
+        (native text, None) for pages with usable text, else (None, image)
+
+    """
+    # Load the page once for both the text layer and the rendering
+    page = pdf_document[page_num]
+    native_text = _native_page_text(page)
+    if native_text is not None:
+        return native_text, None
+    return None, _render_page(page)
+
+
+def _select_pages(total_pages: int) -> list[int]:
+    """Pick the pages of a PDF worth parsing, within MAX_PARSED_PDF_PAGES.
+
+    Long documents keep their opening pages (abstract, introduction) and
+    their last PDF_TAIL_PAGES (conclusions, results) instead of only the
+    first pages.
+
+    Args:
+        total_pages: Number of pages in the PDF
+
+    Returns:
+        Zero-based page indices, in order
+
+    """
+    if total_pages <= MAX_PARSED_PDF_PAGES:
+        return list(range(total_pages))
+    head_pages = MAX_PARSED_PDF_PAGES - PDF_TAIL_PAGES
+    return [*range(head_pages), *range(total_pages - PDF_TAIL_PAGES, total_pages)]
+
+
+@contextmanager
+def _open_pdf(pdf_path: Path | str, pdf_bytes: bytes | None) -> Iterator[Any]:
+    """Open a PDF with PyMuPDF for the duration of the context.
+
+    In-memory content is opened directly; files are memory-mapped, so pages
+    are read from the page cache instead of through buffered file reads.
+
+    Args:
+        pdf_path: Path to the PDF file, used when pdf_bytes is None
+        pdf_bytes: In-memory PDF content
+
+    Yields:
+        The open PyMuPDF document
+
+    """
+    with ExitStack() as stack:
+        if pdf_bytes is not None:
+            stream: bytes | memoryview = pdf_bytes
+        else:
+            with open(pdf_path, "rb") as pdf_file:
+                mapped = stack.enter_context(
+                    mmap.mmap(pdf_file.fileno(), 0, access=mmap.ACCESS_READ)
+                )
+            stream = stack.enter_context(memoryview(mapped))
+        pdf_document = fitz.open(stream=stream, filetype="pdf")
+        try:
+            yield pdf_document
+        finally:
+            pdf_document.close()
+
+
+async def parse_pdf_with_vlm(
+    pdf_path: Path | str, pdf_bytes: bytes | None = None
+) -> str:
+    """Parse a PDF using GPT-5 nano vision model with parallel page processing.
+
+    Args:
+        pdf_path: Path to the PDF file, or its source URL when pdf_bytes is given
+        pdf_bytes: In-memory PDF content; opened directly instead of pdf_path
+
+    Returns:
+        Extracted text from the PDF
+
+    """
+    logger.debug("Converting PDF to images: %s", pdf_path)
+
+    with _open_pdf(pdf_path, pdf_bytes) as pdf_document:
+        page_nums = _select_pages(len(pdf_document))
+        page_count = len(page_nums)
+        logger.debug("Processing %d pages from PDF", page_count)
+
+        async def parse_with_semaphore(page_imgs: list[bytes], first_page: int) -> str:
+            last_page = first_page + len(page_imgs) - 1
+            async with _pdf_page_semaphore:
+                return await parse_pages_with_vlm(
+                    page_imgs, page_num=f"{first_page}-{last_page}", pdf_path=pdf_path
+                )
+
+        # Pages with a usable text layer (most born-digital papers) keep their
+        # embedded text; the rest are rendered and batched for the VLM. Loading
+        # runs off the event loop, one page at a time (a PyMuPDF document must not
+        # be shared across threads), and each batch is sent as soon as it is
+        # complete so rendering overlaps the network round-trips
+        tasks: list[asyncio.Task[str]] = []
+        parts: list[str | asyncio.Task[str]] = []
+        batch: list[bytes] = []
+        batch_first_page = 1
+
+        def submit_batch() -> None:
+            nonlocal batch
+            if batch:
+                task = asyncio.create_task(
+                    parse_with_semaphore(batch, batch_first_page)
+                )
+                tasks.append(task)
+                parts.append(task)
+                batch = []
+
+        try:
+            for page_num in page_nums:
+                native_text, page_image = await asyncio.to_thread(
+                    _load_page, pdf_document, page_num
+                )
+                logger.debug("Processed page %d/%d", page_num + 1, len(pdf_document))
+                # Keep batches to consecutive pages so texts stay in order
+                next_batch_page = batch_first_page - 1 + len(batch)
+                if page_image is None or page_num != next_batch_page:
+                    submit_batch()
+                if page_image is None:
+                    if native_text:
+                        parts.append(native_text)
+                    continue
+                if not batch:
+                    batch_first_page = page_num + 1
+                batch.append(page_image)
+                if len(batch) == PDF_PAGES_PER_VLM_REQUEST:
+                    submit_batch()
+            submit_batch()
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+
+    vlm_texts = iter(await asyncio.gather(*tasks))
+    page_texts = [
+        next(vlm_texts) if isinstance(part, asyncio.Task) else part for part in parts
+    ]
+    logger.debug("Sent %d VLM requests for %d pages", len(tasks), page_count)
 
     # Combine all page texts
     extracted_text = "\n\n".join(page_texts)
     logger.debug(
-        f"VLM extracted total {len(extracted_text)} characters from {page_count} pages"
+        "VLM extracted total %d characters from %d pages",
+        len(extracted_text),
+        page_count,
     )
 
     return extracted_text.strip()
 
 
+# Elements that start a new line when a page's text is flattened
+_BLOCK_TAGS = (
+    "p",
+    "div",
+    "section",
+    "li",
+    "tr",
+    "br",
+    "pre",
+    "blockquote",
+    "figcaption",
+    "h1",
+    "h2",
+    "h3",
+    "h4",
+    "h5",
+    "h6",
+)
+
+
+def _charset_name(charset: str | None) -> str | None:
+    """Return the canonical codec name of a response charset.
+
+    Args:
+        charset: Charset from the Content-Type header, if any
+
+    Returns:
+        Normalized codec name, or None when the charset is missing or unknown
+
+    """
+    if not charset:
+        return None
+    try:
+        return codecs.lookup(charset).name
+    except LookupError:
+        return None
+
+
+@lru_cache(maxsize=16)
+def _html_parser(encoding: str | None) -> lxml.html.HTMLParser:
+    """Return an HTML parser decoding with the response's declared charset.
+
+    Args:
+        encoding: Normalized codec name from _charset_name, if any
+
+    Returns:
+        Parser for that charset; without one (or when libxml2 does not know
+        it) lxml detects the encoding from the BOM or <meta charset>
+
+    """
+    if encoding:
+        # libxml2 spells some codecs with hyphens (euc-jp, not euc_jp)
+        for name in (encoding, encoding.replace("_", "-")):
+            try:
+                return lxml.html.HTMLParser(encoding=name)
+            except LookupError:
+                continue
+    return lxml.html.HTMLParser()
+
+
+def _extract_main_text(tree: Any) -> str | None:
+    """Return the text of a page's main content element, if it has enough.
+
+    Fast path ahead of trafilatura for pages that mark their content with
+    <article>, <main> or role="main".
+
+    Args:
+        tree: Parsed lxml HTML tree of the page
+
+    Returns:
+        Main content text, or None when the page needs full extraction
+
+    """
+    main = tree.find(".//article")
+    if main is None:
+        main = tree.find(".//main")
+    if main is None:
+        candidates = tree.xpath("//*[@role='main']")
+        main = candidates[0] if candidates else None
+    if main is None:
+        return None
+
+    # Edit a copy: the page tree goes to trafilatura if the fast path fails
+    main = copy.deepcopy(main)
+    etree.strip_elements(main, "script", "style", "noscript", with_tail=False)
+    # Keep block elements on their own lines once text is flattened
+    for element in main.iter(*_BLOCK_TAGS):
+        element.tail = "\n" + (element.tail or "")
+    lines = (line.strip() for line in main.text_content().splitlines())
+    text = "\n".join(line for line in lines if line)
+    return text if len(text) >= WEB_FAST_PATH_MIN_CHARS else None
+
+
+def _extract_html_text(response: httpx.Response) -> str | None:
+    """Extract the main text of a fetched HTML page.
+
+    Args:
+        response: Response holding the page
+
+    Returns:
+        Extracted text, or None when nothing could be extracted
+
+    """
+    # Parse the raw bytes once (libxml2 decodes them, no Python str is
+    # built), then try the main content element, else hand the tree over
+    tree = lxml.html.fromstring(
+        response.content,
+        parser=_html_parser(_charset_name(response.charset_encoding)),
+    )
+    return _extract_main_text(tree) or trafilatura.extract(
+        tree,
+        include_comments=False,
+        include_tables=False,
+    )
+
+
+async def _fetch_arxiv_html_text(arxiv_id: str) -> str | None:
+    """Return the text of an arXiv paper's HTML version, if it has one.
+
+    Args:
+        arxiv_id: arXiv identifier, optionally with a version suffix
+
+    Returns:
+        Extracted text, or None when no usable HTML version exists
+
+    """
+    html_url = f"https://arxiv.org/html/{arxiv_id}"
+    try:
+        response = await _fetch(html_url, REQUEST_TIMEOUT_WEB)
+        if response.status_code == httpx.codes.NOT_FOUND:
+            logger.debug(f"No HTML version at {html_url}")
+            return None
+        response.raise_for_status()
+        return _extract_html_text(response)
+    except Exception as e:
+        logger.warning(f"Failed to fetch/parse HTML version {html_url}: {e}")
+        return None
+
+
 async def parse_web_result(result: NotParsedDocument) -> ParsedDocument:
     """Parse a web result and extract full text content.
 
@@ -150,25 +666,26 @@ async def parse_web_result(result: NotParsedDocument) -> ParsedDocument:
     """
     logger.debug(f"Parsing web result: {result.url}")
 
+    cache_key = _parse_cache_key(result.url)
+    cached = _get_cached_text(cache_key)
+    if cached is not None:
+        logger.debug(f"Using cached text for {result.url}")
+        return ParsedDocument.from_not_parsed(
+            result, text=cached, summary=result.snippet
+        )
+
     text = result.snippet
 
     # Try to fetch and extract main content using trafilatura
     try:
-        response = requests.get(
-            result.url,
-            timeout=REQUEST_TIMEOUT_WEB,
-            headers={"User-Agent": "Mozilla/5.0 (SOTAforge)"},
-        )
+        response = await _fetch(result.url, REQUEST_TIMEOUT_WEB)
         response.raise_for_status()
 
-        extracted = trafilatura.extract(
-            response.text,
-            include_comments=False,
-            include_tables=False,
-        )
+        extracted = _extract_html_text(response)
 
         if extracted:
             text = extracted.strip()
+            _cache_text(cache_key, text)
             logger.debug(
                 f"Trafilatura extracted {len(text)} characters from {result.url}"
             )
@@ -200,72 +717,55 @@ async def parse_paper_result(result: NotParsedDocument) -> ParsedDocument:
     """
     logger.debug(f"Parsing paper result: {result.title}")
 
+    cache_key = _parse_cache_key(result.url)
+    cached = _get_cached_text(cache_key)
+    if cached is not None:
+        logger.debug(f"Using cached text for {result.url}")
+        return ParsedDocument.from_not_parsed(
+            result, text=cached, summary=result.abstract
+        )
+
     # Start with abstract as the text content
     text = result.abstract
 
     # Try to fetch full paper content from URL
     try:
         # Check if it's an arXiv paper
-        if "arxiv.org" in result.url:
-            # Extract arXiv ID and construct PDF URL
-            arxiv_id = result.url.split("/")[-1]
-            pdf_url = f"https://arxiv.org/pdf/{arxiv_id}.pdf"
+        arxiv_match = _ARXIV_URL.search(result.url)
+        if arxiv_match:
+            arxiv_id = arxiv_match["id"] + (arxiv_match["version"] or "")
+
+            # Most recent papers have an HTML version: extracting it is far
+            # cheaper than rendering the PDF for the VLM
+            html_text = await _fetch_arxiv_html_text(arxiv_id)
+            if html_text and len(html_text.strip()) > len(text):
+                text = html_text.strip()
+                _cache_text(cache_key, text)
+                logger.debug(f"Extracted {len(text)} characters from HTML version")
+                return ParsedDocument.from_not_parsed(
+                    result, text=text, summary=result.abstract
+                )
 
+            # Construct the PDF URL from the arXiv ID (and version, if any)
+            pdf_url = f"https://arxiv.org/pdf/{arxiv_id}.pdf"
+            timeout = REQUEST_TIMEOUT_PDF
             logger.debug(f"Fetching arXiv paper: {pdf_url}")
-
-            # Download PDF to temporary file
-            response = requests.get(
-                pdf_url,
-                timeout=REQUEST_TIMEOUT_PDF,
-                headers={"User-Agent": "Mozilla/5.0 (SOTAforge)"},
-            )
-            response.raise_for_status()
-
-            # Save to temporary file and parse with VLM
-            with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as tmp:
-                tmp.write(response.content)
-                tmp_path = Path(tmp.name)
-
-            try:
-                extracted_text = await parse_pdf_with_vlm(tmp_path)
-
-                if extracted_text and len(extracted_text.strip()) > len(text):
-                    text = extracted_text.strip()
-                    logger.debug(f"VLM extracted {len(text)} characters from PDF")
-                else:
-                    logger.warning("VLM extraction yielded less content than abstract")
-            finally:
-                # Clean up temporary file
-                tmp_path.unlink(missing_ok=True)
         else:
             # Try to fetch from the URL
-            response = requests.get(
-                result.url,
-                timeout=REQUEST_TIMEOUT_WEB,
-                headers={"User-Agent": "Mozilla/5.0 (SOTAforge)"},
-            )
-            response.raise_for_status()
-
-            # Check content type
-            content_type = response.headers.get("content-type", "").lower()
-            if "pdf" in content_type:
-                # Parse PDF with VLM
-                with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as tmp:
-                    tmp.write(response.content)
-                    tmp_path = Path(tmp.name)
-
-                try:
-                    extracted_text = await parse_pdf_with_vlm(tmp_path)
-
-                    if extracted_text and len(extracted_text.strip()) > len(text):
-                        text = extracted_text.strip()
-                        logger.debug(f"VLM extracted {len(text)} characters from PDF")
-                finally:
-                    tmp_path.unlink(missing_ok=True)
+            pdf_url = result.url
+            timeout = REQUEST_TIMEOUT_WEB
+
+        # Download the PDF (if the URL serves one) and parse it from memory
+        pdf_bytes = await _fetch_pdf(pdf_url, timeout)
+        if pdf_bytes is not None:
+            extracted_text = await parse_pdf_with_vlm(pdf_url, pdf_bytes=pdf_bytes)
+
+            if extracted_text and len(extracted_text.strip()) > len(text):
+                text = extracted_text.strip()
+                _cache_text(cache_key, text)
+                logger.debug(f"VLM extracted {len(text)} characters from PDF")
             else:
-                logger.warning(
-                    f"Non-PDF content type: {content_type} - using abstract only"
-                )
+                logger.warning("VLM extraction yielded less content than abstract")
 
     except Exception as e:
         logger.warning(f"Failed to fetch/parse full paper from {result.url}: {e}")
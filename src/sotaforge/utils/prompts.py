@@ -1,7 +1,8 @@
 """Prompt definitions for orchestrator pipeline steps and validations."""
 
 PDF_PARSING_PROMPT = """You are a text extraction assistant.
-Extract all the text content from the PDF page image.
+Extract all the text content from the PDF page image(s).
+When several images are given they are consecutive pages: extract them in order.
 
 Focus on:
 - Main body text (paragraphs, sections)
@@ -17,21 +18,20 @@ Ignore:
 - Watermarks
 - Decorative elements
 
-Format the extracted text in a clear, readable markdown format. 
+Format the extracted text in a clear, readable markdown format.
 Preserve the logical structure and flow of the document.
 Maintain continuity between pages when combining text.
 Prioritize the main content over sidebars or supplementary information.
 
-RETURN ONLY THE EXTRACTED TEXT, DO NOT RETURN ANY EXTRA COMMENTS OR FORMATTING.
-"""
+RETURN ONLY THE EXTRACTED TEXT, DO NOT RETURN ANY EXTRA COMMENTS OR FORMATTING."""
 
 ORCHESTRATOR_SYSTEM_PROMPT = (
     "You validate individual pipeline steps. Python runs the fixed workflow. "
     "Only use tools to perform the current step. Be concise."
 )
 
-ANALYZER_SYSTEM_PROMPT = """
-You are an expert research analyst specializing in extracting 
+ANALYZER_SYSTEM_PROMPT = """\
+You are an expert research analyst specializing in extracting
 key insights from academic and technical documents.
 
 Your task is to analyze documents and identify:
@@ -41,16 +41,15 @@ Your task is to analyze documents and identify:
 - Methodological approaches
 - Important findings and contributions
 
-Provide clear, concise themes formatted as "Category: Description" where 
-category is one of: Trend, Challenge, Opportunity, Method, Finding.
-"""
+Provide clear, concise themes formatted as "Category: Description" where
+category is one of: Trend, Challenge, Opportunity, Method, Finding."""
 
-SYNTHESIZER_SYSTEM_PROMPT = """
-You are an expert technical writer specializing in state-of-the-art reviews.
-"""
+SYNTHESIZER_SYSTEM_PROMPT = (
+    "You are an expert technical writer specializing in state-of-the-art reviews."
+)
 
-SYNTHESIZER_PROMPT = """
-You are an expert technical writer specializing in state-of-the-art reviews. 
+SYNTHESIZER_PROMPT = """\
+You are an expert technical writer specializing in state-of-the-art reviews.
 Generate a comprehensive, well-structured SOTA document.
 
 Structure your response with these sections:
@@ -81,11 +80,10 @@ Use the following format for references:
 ## 8. Conclusion
 Summary and outlook for the field.
 
-Format the response in Markdown. 
+Format the response in Markdown.
 Include specific technologies, frameworks, and tools mentioned in the source materials.
 
-Here are the analyzed documents to base your synthesis on:
-"""
+Here are the analyzed documents to base your synthesis on:"""
 
 VALIDATION_PROMPT = (
     "You are reviewing the result of the last pipeline step. "
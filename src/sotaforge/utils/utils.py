@@ -1,9 +1,54 @@
 """Utility functions for SOTAforge."""
 
-from typing import Iterable, List, Optional
+import asyncio
+from typing import Any, Dict, Iterable, Optional
 
 from fastmcp import FastMCP
 
+from sotaforge.utils.constants import TERMINAL_STATUSES
+
+
+class ProgressQueue(asyncio.Queue[Any]):
+    """Bounded progress queue that drops old progress instead of blocking.
+
+    Producers are pipeline steps that must not stall when no client is reading
+    the stream, so once the queue is full the oldest pending progress event is
+    discarded to make room for the newest one. Terminal events (those whose
+    status is completed, failed or cancelled, which carry the result or error)
+    and end-of-stream markers are never evicted.
+    """
+
+    async def put(self, item: Any) -> None:
+        """Enqueue an item, evicting the oldest progress event if full."""
+        if self.full():
+            pending = self._queue  # type: ignore[attr-defined]
+            for index, queued in enumerate(pending):
+                if not _is_final_event(queued):
+                    del pending[index]
+                    break
+        await super().put(item)
+
+
+def _is_final_event(item: Any) -> bool:
+    """Return whether a queued item is an end-of-stream or terminal event."""
+    return item is None or (
+        isinstance(item, dict) and item.get("status") in TERMINAL_STATUSES
+    )
+
+
+def _to_openai_tool(tool_name: str, tool: Any) -> Dict[str, Any]:
+    """Convert one MCP tool to the OpenAI function tool format."""
+    return {
+        "type": "function",
+        "function": {
+            "name": tool_name.replace(".", "_"),
+            "description": tool.description or "No description provided",
+            "parameters": tool.parameters
+            if tool.parameters
+            else {"type": "object", "properties": {}, "required": []},
+        },
+    }
+
 
 async def get_tools_for_openai(
     server: FastMCP, allowed_prefixes: Optional[Iterable[str]] = None
@@ -18,22 +63,10 @@ async def get_tools_for_openai(
 
     """
     tools = await server.get_tools()
-    allowed_list: List[str] = list(allowed_prefixes) if allowed_prefixes else []
-
-    openai_tools = []
-    for tool_name, tool in tools.items():
-        if allowed_list and not any(tool_name.startswith(p) for p in allowed_list):
-            continue
-        openai_tools.append(
-            {
-                "type": "function",
-                "function": {
-                    "name": tool_name.replace(".", "_"),
-                    "description": tool.description or "No description provided",
-                    "parameters": tool.parameters
-                    if tool.parameters
-                    else {"type": "object", "properties": {}, "required": []},
-                },
-            }
-        )
-    return openai_tools
+    # str.startswith checks a whole tuple of prefixes in one call
+    prefixes = tuple(allowed_prefixes) if allowed_prefixes else ()
+    return [
+        _to_openai_tool(tool_name, tool)
+        for tool_name, tool in tools.items()
+        if not prefixes or tool_name.startswith(prefixes)
+    ]
@@ -4,6 +4,7 @@ Test Markers:
     @pytest.mark.online - Tests requiring internet connectivity
     @pytest.mark.slow - Tests that take a long time to run
     @pytest.mark.integration - Integration tests
+    @pytest.mark.unit - Fast tests with external clients replaced by doubles
 
 Usage:
     Run all tests:
@@ -17,95 +18,255 @@ Usage:
 
     Run only integration tests:
         pytest -m integration
+
+    Run only unit tests:
+        pytest -m unit
+
+    Run in parallel, keeping each module's shared fixtures on one worker:
+        pytest -n auto --dist=loadscope
 """
 
-from typing import Any, Dict
+import logging
+import os
+import sys
+from contextlib import AbstractContextManager, contextmanager
+from types import MappingProxyType, ModuleType
+from typing import Any, Callable, Dict, Iterator, Mapping
 
 import pytest
 
+from sotaforge.utils.models import NotParsedDocument, ParsedDocument
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Provide placeholder API keys and quiet asyncio's own logger."""
+    os.environ.setdefault("OPENAI_API_KEY", "test-key")
+    os.environ.setdefault("SERPER_API_KEY", "test-key")
+    # Debug mode is already off unless PYTHONASYNCIODEBUG is set to any
+    # non-empty value, "0" included, so the environment is left alone
+    logging.getLogger("asyncio").setLevel(logging.CRITICAL)
+
+
+class DummyClient:
+    """Stand-in for AsyncOpenAI that never touches the network."""
+
+    def __init__(
+        self, api_key: str | None = None, http_client: Any = None, **kwargs: Any
+    ) -> None:
+        """Keep the API key and HTTP client; other client options are ignored."""
+        self.api_key = api_key
+        self.http_client = http_client
+
+
+@pytest.fixture(scope="session")
+def dummy_client_cls() -> type[DummyClient]:
+    """Return the DummyClient class to patch in for llm.AsyncOpenAI."""
+    return DummyClient
+
+
+@contextmanager
+def _swap_attrs(obj: Any, **attrs: Any) -> Iterator[None]:
+    """Set attributes on obj for the duration of the context, then restore them."""
+    saved = {name: getattr(obj, name) for name in attrs}
+    for name, value in attrs.items():
+        setattr(obj, name, value)
+    try:
+        yield
+    finally:
+        for name, value in saved.items():
+            setattr(obj, name, value)
+
+
+@pytest.fixture(scope="session")
+def swap_attrs() -> Callable[..., AbstractContextManager[None]]:
+    """Return a lightweight alternative to monkeypatch.setattr for module globals."""
+    return _swap_attrs
+
+
+def _reset_llm_if_cached() -> None:
+    """Clear the llm caches only when they hold a client."""
+    from sotaforge.utils import llm
+
+    if (
+        llm.get_llm.cache_info().currsize
+        or llm.get_pydantic_model.cache_info().currsize
+    ):
+        llm.reset_llm()
+
+
+@pytest.fixture(scope="session")
+def analyzer_server() -> ModuleType:
+    """Import analyzer_server once, with its LLM client built from DummyClient."""
+    from sotaforge.utils import llm
+
+    name = "sotaforge.agents.analyzer_server"
+    if name in sys.modules:
+        # Already bootstrapped; re-importing would not rebuild its agent
+        return sys.modules[name]
 
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(llm, "AsyncOpenAI", DummyClient)
+        _reset_llm_if_cached()
+        from sotaforge.agents import analyzer_server as module
+    # The module's agent keeps its model; don't leak the dummy to other tests
+    _reset_llm_if_cached()
+    return module
+
+
+@pytest.fixture(scope="session")
+def db_server() -> ModuleType:
+    """Import db_server once for the session."""
+    from sotaforge.agents import db_server
+
+    return db_server
+
+
+@pytest.fixture(scope="session")
+def filter_server() -> ModuleType:
+    """Import filter_server once for the session."""
+    from sotaforge.agents import filter_server
+
+    return filter_server
+
+
+# Documents are cheap to build and analysis mutates them in place, so every
+# test gets fresh instances
 @pytest.fixture
-def sample_not_parsed_document() -> Dict[str, Any]:
-    """Return sample NotParsedDocument data."""
-    return {
-        "title": "Sample Research Paper",
-        "url": "https://arxiv.org/abs/2024.12345",
-        "source_type": "paper",
-        "snippet": "This is a snippet",
-        "abstract": "This is a sample abstract about AI research.",
-        "authors": ["John Doe", "Jane Smith"],
-        "year": 2024,
-        "venue": "NeurIPS",
-        "metadata": {"category": "cs.AI"},
-    }
+def parsed_doc() -> ParsedDocument:
+    """Return a short ParsedDocument."""
+    return ParsedDocument(title="Doc", text="Content")
+
+
+@pytest.fixture(scope="session")
+def long_doc_text() -> str:
+    """Return 100k characters of text, built once per session."""
+    return "x" * 100_000
 
 
 @pytest.fixture
-def sample_parsed_document() -> Dict[str, Any]:
-    """Return sample ParsedDocument data."""
-    return {
+def parsed_doc_long(long_doc_text: str) -> ParsedDocument:
+    """Return a ParsedDocument holding long_doc_text."""
+    return ParsedDocument(title="Long Doc", text=long_doc_text)
+
+
+@pytest.fixture
+def not_parsed_doc() -> NotParsedDocument:
+    """Return a NotParsedDocument with only a title and URL."""
+    return NotParsedDocument(title="Not Parsed", url="http://example.com")
+
+
+@pytest.fixture
+def parsed_docs_triplet() -> list[ParsedDocument]:
+    """Return three short ParsedDocuments."""
+    return [ParsedDocument(title=f"Doc{i}", text=f"Content {i}") for i in (1, 2, 3)]
+
+
+@pytest.fixture
+def parsed_docs_many() -> list[ParsedDocument]:
+    """Return fifty short ParsedDocuments."""
+    return [ParsedDocument(title=f"D{i}", text="x") for i in range(50)]
+
+
+# Frozen so session-wide sharing is safe: nested lists are tuples, which
+# Document.from_dict copies into fresh lists for every document
+_SAMPLE_NOT_PARSED: Mapping[str, Any] = MappingProxyType(
+    {
         "title": "Sample Research Paper",
         "url": "https://arxiv.org/abs/2024.12345",
         "source_type": "paper",
         "snippet": "This is a snippet",
         "abstract": "This is a sample abstract about AI research.",
-        "authors": ["John Doe", "Jane Smith"],
+        "authors": ("John Doe", "Jane Smith"),
         "year": 2024,
         "venue": "NeurIPS",
-        "text": "Full text of the research paper goes here.",
-        "themes": ["AI", "Machine Learning"],
-        "insights": ["Novel approach to training", "Better performance"],
-        "metadata": {"category": "cs.AI"},
+        "metadata": MappingProxyType({"category": "cs.AI"}),
     }
+)
 
+_SAMPLE_PARSED: Mapping[str, Any] = MappingProxyType(
+    {
+        **_SAMPLE_NOT_PARSED,
+        "text": "Full text of the research paper goes here.",
+        "themes": ("AI", "Machine Learning"),
+        "insights": ("Novel approach to training", "Better performance"),
+    }
+)
 
-@pytest.fixture
-def sample_web_result() -> Dict[str, Any]:
-    """Return sample web search result data."""
-    return {
+_SAMPLE_WEB: Mapping[str, Any] = MappingProxyType(
+    {
         "title": "AI News Article",
         "url": "https://example.com/ai-article",
         "source_type": "web",
         "snippet": "Breaking news about AI developments.",
         "abstract": "",
-        "authors": [],
+        "authors": (),
         "year": 0,
         "venue": "",
-        "metadata": {},
+        "metadata": MappingProxyType({}),
     }
+)
 
 
-@pytest.fixture
-def mock_fastmcp_server() -> Any:
-    """Return a mock FastMCP server for testing."""
+@pytest.fixture(scope="session")
+def sample_not_parsed_document() -> Mapping[str, Any]:
+    """Return sample NotParsedDocument data."""
+    return _SAMPLE_NOT_PARSED
+
+
+@pytest.fixture(scope="session")
+def sample_parsed_document() -> Mapping[str, Any]:
+    """Return sample ParsedDocument data."""
+    return _SAMPLE_PARSED
+
+
+@pytest.fixture(scope="session")
+def sample_web_result() -> Mapping[str, Any]:
+    """Return sample web search result data."""
+    return _SAMPLE_WEB
 
-    class MockTool:
-        def __init__(
-            self,
-            name: str,
-            description: str = "",
-            parameters: Dict[str, Any] | None = None,
-        ):
-            self.name = name
-            self.description = description
-            self.parameters = parameters or {"type": "object", "properties": {}}
-
-    class MockServer:
-        async def get_tools(self) -> Dict[str, MockTool]:
-            return {
-                "search.query": MockTool(
-                    "search.query",
-                    "Search for documents",
-                    {
-                        "type": "object",
-                        "properties": {"query": {"type": "string"}},
-                        "required": ["query"],
-                    },
-                ),
-                "parse.document": MockTool(
-                    "parse.document", "Parse a document", {"type": "object"}
-                ),
-                "internal.debug": MockTool("internal.debug", "Debug tool"),
-            }
 
+class MockTool:
+    """Minimal stand-in for a FastMCP tool."""
+
+    def __init__(
+        self,
+        name: str,
+        description: str = "",
+        parameters: Dict[str, Any] | None = None,
+    ):
+        """Store the tool's name, description and JSON schema parameters."""
+        self.name = name
+        self.description = description
+        self.parameters = parameters or {"type": "object", "properties": {}}
+
+
+# Built once; tests only read the tools
+_MOCK_TOOLS = {
+    "search.query": MockTool(
+        "search.query",
+        "Search for documents",
+        {
+            "type": "object",
+            "properties": {"query": {"type": "string"}},
+            "required": ["query"],
+        },
+    ),
+    "parse.document": MockTool(
+        "parse.document", "Parse a document", {"type": "object"}
+    ),
+    "internal.debug": MockTool("internal.debug", "Debug tool"),
+}
+
+
+class MockServer:
+    """Minimal stand-in for a FastMCP server exposing _MOCK_TOOLS."""
+
+    async def get_tools(self) -> Dict[str, MockTool]:
+        """Return the precomputed tools."""
+        return _MOCK_TOOLS
+
+
+@pytest.fixture(scope="session")
+def mock_fastmcp_server() -> MockServer:
+    """Return a mock FastMCP server for testing."""
     return MockServer()
@@ -1,381 +1,162 @@
 """Tests for `analyzer_server`."""
 
-from types import SimpleNamespace
-from typing import Any
+from contextlib import AbstractContextManager
+from dataclasses import dataclass, field
+from types import ModuleType, SimpleNamespace
+from typing import Any, Awaitable, Callable, Iterator
 
 import pytest
 
+from sotaforge.utils.constants import ANALYZER_PROMPT_TEXT_LIMIT
 
-@pytest.mark.asyncio
-async def test_analyze_documents_calls_upsert_and_sets_insights(
-    monkeypatch: pytest.MonkeyPatch,
-) -> None:
-    """Test that analyze_documents calls upsert and sets insights."""
-    # Ensure llm client creation won't fail when importing analyzer_server
-    from sotaforge.utils import llm
-
-    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
-
-    class DummyClient:
-        def __init__(self, api_key: str | None = None, **kwargs: Any) -> None:
-            self.api_key = api_key
+pytestmark = pytest.mark.unit
 
-    monkeypatch.setattr(llm, "AsyncOpenAI", DummyClient)
-    llm.reset_llm()
 
-    import importlib
+# Agent results are only read, so every call can return the same object
+_RESULT_WITH_THEMES = SimpleNamespace(
+    output=SimpleNamespace(themes=["theme"], insights=["insight"])
+)
+_RESULT_EMPTY = SimpleNamespace(output=SimpleNamespace(themes=[], insights=[]))
 
-    analyzer_server = importlib.import_module("sotaforge.agents.analyzer_server")
-    from sotaforge.utils.models import ParsedDocument
 
-    doc = ParsedDocument(title="A Doc", text="Important content.")
+async def _run_with_themes(prompt: str) -> SimpleNamespace:
+    return _RESULT_WITH_THEMES
 
-    upsert_called: dict[str, Any] = {}
 
-    def fake_upsert(collection: str, docs: list[Any]) -> None:
-        upsert_called["collection"] = collection
-        upsert_called["docs"] = docs
+async def _run_without_themes(prompt: str) -> SimpleNamespace:
+    return _RESULT_EMPTY
 
-    monkeypatch.setattr(
-        analyzer_server,
-        "db_store",
-        SimpleNamespace(fetch_documents=lambda c: [doc], upsert_documents=fake_upsert),
-    )
 
-    async def fake_run(prompt: str) -> SimpleNamespace:
-        return SimpleNamespace(
-            output=SimpleNamespace(themes=["theme1"], insights=["insight1"])
-        )
+async def _run_failing(prompt: str) -> SimpleNamespace:
+    raise Exception("Analysis failed")
 
-    # Replace the whole agent with a test double that exposes `run`
-    monkeypatch.setattr(
-        analyzer_server,
-        "analyzer_agent",
-        SimpleNamespace(run=fake_run),
-    )
 
-    func = analyzer_server.analyze_documents.fn
-    res = await func("src_col", "dst_col")
-
-    assert res["count"] == 1
-    assert res["stored_count"] == 1
-    assert res["destination_collection"] == "dst_col"
-    assert res["results"][0]["title"] == "A Doc"
-    assert upsert_called["collection"] == "dst_col"
+@dataclass
+class FakeAnalyzer:
+    """Double for both the store and the agent of analyzer_server.
 
+    Serves ``docs`` from any collection, answers prompts with ``run_fn`` and
+    records the prompts and the upserted documents.
+    """
 
-@pytest.mark.asyncio
-async def test_analyze_documents_empty_collection(
-    monkeypatch: pytest.MonkeyPatch,
-) -> None:
-    """Test analyzing when source collection is empty."""
-    from sotaforge.utils import llm
+    docs: list[Any] = field(default_factory=list)
+    run_fn: Callable[[str], Awaitable[SimpleNamespace]] = _run_with_themes
+    prompts: list[str] = field(default_factory=list)
+    stored: list[Any] = field(default_factory=list)
+    collection: str | None = None
 
-    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    async def fetch_documents_async(self, collection: str) -> list[Any]:
+        """Return the configured documents."""
+        return self.docs
 
-    class DummyClient:
-        def __init__(self, api_key: str | None = None, **kwargs: Any) -> None:
-            self.api_key = api_key
+    async def upsert_documents_async(self, collection: str, docs: list[Any]) -> None:
+        """Record the documents stored and their collection."""
+        self.collection = collection
+        self.stored = docs
 
-    monkeypatch.setattr(llm, "AsyncOpenAI", DummyClient)
-    llm.reset_llm()
+    async def run(self, prompt: str) -> SimpleNamespace:
+        """Record the prompt and answer it with run_fn."""
+        self.prompts.append(prompt)
+        return await self.run_fn(prompt)
 
-    import importlib
 
-    analyzer_server = importlib.import_module("sotaforge.agents.analyzer_server")
+@pytest.fixture
+def fake_analyzer(
+    analyzer_server: ModuleType,
+    swap_attrs: Callable[..., AbstractContextManager[None]],
+) -> Iterator[FakeAnalyzer]:
+    """Install a fresh FakeAnalyzer as the module's store and agent."""
+    fake = FakeAnalyzer()
+    with swap_attrs(analyzer_server, db_store=fake, analyzer_agent=fake):
+        yield fake
 
-    monkeypatch.setattr(
-        analyzer_server,
-        "db_store",
-        SimpleNamespace(fetch_documents=lambda c: []),
-    )
-
-    func = analyzer_server.analyze_documents.fn
-    res = await func("empty_col", "dst_col")
-
-    assert res["count"] == 0
-    assert res["results"] == []
-    assert res["source_collection"] == "empty_col"
-
-
-@pytest.mark.asyncio
-async def test_analyze_documents_with_not_parsed_document(
-    monkeypatch: pytest.MonkeyPatch,
-) -> None:
-    """Test analyzing converts NotParsedDocument to ParsedDocument."""
-    from sotaforge.utils import llm
 
-    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+@pytest.fixture
+def db_store_stub(
+    request: pytest.FixtureRequest, fake_analyzer: FakeAnalyzer
+) -> FakeAnalyzer:
+    """Serve the documents of the fixture named by request.param (or none)."""
+    value = request.getfixturevalue(request.param) if request.param else []
+    fake_analyzer.docs = value if isinstance(value, list) else [value]
+    return fake_analyzer
 
-    class DummyClient:
-        def __init__(self, api_key: str | None = None, **kwargs: Any) -> None:
-            self.api_key = api_key
 
-    monkeypatch.setattr(llm, "AsyncOpenAI", DummyClient)
-    llm.reset_llm()
-
-    import importlib
-
-    analyzer_server = importlib.import_module("sotaforge.agents.analyzer_server")
-    from sotaforge.utils.models import NotParsedDocument
-
-    not_parsed = NotParsedDocument(title="Not Parsed", url="http://example.com")
-
-    upsert_called = {}
-
-    def fake_upsert(collection: str, docs: list[Any]) -> None:
-        upsert_called["docs"] = docs
-
-    monkeypatch.setattr(
-        analyzer_server,
-        "db_store",
-        SimpleNamespace(
-            fetch_documents=lambda c: [not_parsed], upsert_documents=fake_upsert
+@pytest.mark.parametrize(
+    ("db_store_stub", "run_fn", "themes", "insights"),
+    [
+        pytest.param(
+            "parsed_doc", _run_with_themes, ["theme"], ["insight"], id="upsert"
         ),
-    )
-
-    async def fake_run(prompt: str) -> SimpleNamespace:
-        return SimpleNamespace(
-            output=SimpleNamespace(themes=["theme"], insights=["insight"])
-        )
-
-    monkeypatch.setattr(
-        analyzer_server, "analyzer_agent", SimpleNamespace(run=fake_run)
-    )
-
-    func = analyzer_server.analyze_documents.fn
-    res = await func("src", "dst")
-
-    assert res["count"] == 1
-    # Check that the document was converted and has themes/insights
-    assert len(upsert_called["docs"]) == 1
-    stored_doc = upsert_called["docs"][0]
-    assert stored_doc.title == "Not Parsed"
-    assert stored_doc.themes == ["theme"]
-    assert stored_doc.insights == ["insight"]
-
-
-@pytest.mark.asyncio
-async def test_analyze_documents_handles_analysis_failure(
-    monkeypatch: pytest.MonkeyPatch,
-) -> None:
-    """Test that analysis failures are logged but don't stop processing."""
-    from sotaforge.utils import llm
-
-    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
-
-    class DummyClient:
-        def __init__(self, api_key: str | None = None, **kwargs: Any) -> None:
-            self.api_key = api_key
-
-    monkeypatch.setattr(llm, "AsyncOpenAI", DummyClient)
-    llm.reset_llm()
-
-    import importlib
-
-    analyzer_server = importlib.import_module("sotaforge.agents.analyzer_server")
-    from sotaforge.utils.models import ParsedDocument
-
-    doc = ParsedDocument(title="Doc", text="Content")
-
-    upsert_called = {}
-
-    def fake_upsert(collection: str, docs: list[Any]) -> None:
-        upsert_called["docs"] = docs
-
-    monkeypatch.setattr(
-        analyzer_server,
-        "db_store",
-        SimpleNamespace(fetch_documents=lambda c: [doc], upsert_documents=fake_upsert),
-    )
-
-    async def fake_run_error(prompt: str) -> None:
-        raise Exception("Analysis failed")
-
-    monkeypatch.setattr(
-        analyzer_server, "analyzer_agent", SimpleNamespace(run=fake_run_error)
-    )
-
-    func = analyzer_server.analyze_documents.fn
-    res = await func("src", "dst")
-
-    # Document should still be stored, just without themes/insights
-    assert res["count"] == 1
-    assert len(upsert_called["docs"]) == 1
-    stored_doc = upsert_called["docs"][0]
-    assert stored_doc.title == "Doc"
-
-
-@pytest.mark.asyncio
-async def test_analyze_documents_multiple_documents(
-    monkeypatch: pytest.MonkeyPatch,
+        pytest.param(None, _run_with_themes, [], [], id="empty"),
+        # Converted to a ParsedDocument, then enriched
+        pytest.param(
+            "not_parsed_doc", _run_with_themes, ["theme"], ["insight"], id="not_parsed"
+        ),
+        # Still stored, just without new themes/insights
+        pytest.param("parsed_doc", _run_failing, [], [], id="failure"),
+        pytest.param(
+            "parsed_docs_triplet", _run_with_themes, ["theme"], ["insight"], id="multi"
+        ),
+        pytest.param(
+            "parsed_docs_many", _run_with_themes, ["theme"], ["insight"], id="many"
+        ),
+    ],
+    indirect=["db_store_stub"],
+)
+async def test_analyze_documents(
+    analyzer_server: ModuleType,
+    db_store_stub: FakeAnalyzer,
+    run_fn: Callable[[str], Awaitable[SimpleNamespace]],
+    themes: list[str],
+    insights: list[str],
 ) -> None:
-    """Test analyzing multiple documents."""
-    from sotaforge.utils import llm
-
-    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
-
-    class DummyClient:
-        def __init__(self, api_key: str | None = None, **kwargs: Any) -> None:
-            self.api_key = api_key
-
-    monkeypatch.setattr(llm, "AsyncOpenAI", DummyClient)
-    llm.reset_llm()
-
-    import importlib
-
-    analyzer_server = importlib.import_module("sotaforge.agents.analyzer_server")
-    from sotaforge.utils.models import ParsedDocument
-
-    docs = [
-        ParsedDocument(title="Doc1", text="Content 1"),
-        ParsedDocument(title="Doc2", text="Content 2"),
-        ParsedDocument(title="Doc3", text="Content 3"),
-    ]
-
-    upsert_called: dict[str, Any] = {}
-
-    def fake_upsert(collection: str, docs: list[Any]) -> None:
-        upsert_called["collection"] = collection
-        upsert_called["docs"] = docs
-
-    monkeypatch.setattr(
-        analyzer_server,
-        "db_store",
-        SimpleNamespace(fetch_documents=lambda c: docs, upsert_documents=fake_upsert),
-    )
-
-    call_count = {"count": 0}
-
-    async def fake_run(prompt: str) -> SimpleNamespace:
-        call_count["count"] += 1
-        return SimpleNamespace(
-            output=SimpleNamespace(
-                themes=[f"theme_{call_count['count']}"],
-                insights=[f"insight_{call_count['count']}"],
-            )
-        )
-
-    monkeypatch.setattr(
-        analyzer_server, "analyzer_agent", SimpleNamespace(run=fake_run)
-    )
-
-    func = analyzer_server.analyze_documents.fn
-    res = await func("src", "dst")
-
-    assert res["count"] == 3
-    assert res["stored_count"] == 3
-    assert len(res["results"]) == 3
-    # Agent should have been called 3 times (once per doc)
-    assert call_count["count"] == 3
-    # All docs should be stored
-    assert len(upsert_called["docs"]) == 3
-
-
-@pytest.mark.asyncio
-async def test_analyze_documents_skips_unknown_type(
-    monkeypatch: pytest.MonkeyPatch,
+    """Test analyze_documents stores the analyzed documents of each scenario."""
+    docs = db_store_stub.docs
+    titles = [doc.title for doc in docs]
+    db_store_stub.run_fn = run_fn
+
+    res = await analyzer_server.analyze_documents.fn("src", "dst")
+
+    assert res["source_collection"] == "src"
+    assert res["count"] == len(docs)
+    # The agent is called once per document
+    assert len(db_store_stub.prompts) == len(docs)
+    if not docs:
+        assert res["results"] == []
+        return
+    assert res["destination_collection"] == "dst"
+    assert res["stored_count"] == len(docs)
+    assert [r["title"] for r in res["results"]] == titles
+    assert db_store_stub.collection == "dst"
+    assert [doc.title for doc in db_store_stub.stored] == titles
+    for doc in db_store_stub.stored:
+        assert doc.themes == themes
+        assert doc.insights == insights
+
+
+async def test_analyze_documents_skips_unknown_types(
+    analyzer_server: ModuleType, fake_analyzer: FakeAnalyzer, parsed_doc: Any
 ) -> None:
-    """Test that documents of unknown type are skipped."""
-    from sotaforge.utils import llm
-
-    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
-
-    class DummyClient:
-        def __init__(self, api_key: str | None = None, **kwargs: Any) -> None:
-            self.api_key = api_key
-
-    monkeypatch.setattr(llm, "AsyncOpenAI", DummyClient)
-    llm.reset_llm()
+    """Test that entries which are not documents are skipped."""
+    fake_analyzer.docs = [parsed_doc, {"not": "a document"}]
+    fake_analyzer.run_fn = _run_without_themes
 
-    import importlib
+    res = await analyzer_server.analyze_documents.fn("src", "dst")
 
-    analyzer_server = importlib.import_module("sotaforge.agents.analyzer_server")
-    from sotaforge.utils.models import ParsedDocument
-
-    docs = [
-        ParsedDocument(title="Valid", text="Content"),
-        {"not": "a document object"},  # Invalid type
-    ]
-
-    upsert_called = {}
-
-    def fake_upsert(collection: str, docs: list[Any]) -> None:
-        upsert_called["docs"] = docs
-
-    monkeypatch.setattr(
-        analyzer_server,
-        "db_store",
-        SimpleNamespace(fetch_documents=lambda c: docs, upsert_documents=fake_upsert),
-    )
-
-    async def fake_run(prompt: str) -> SimpleNamespace:
-        return SimpleNamespace(output=SimpleNamespace(themes=[], insights=[]))
-
-    monkeypatch.setattr(
-        analyzer_server, "analyzer_agent", SimpleNamespace(run=fake_run)
-    )
-
-    func = analyzer_server.analyze_documents.fn
-    res = await func("src", "dst")
-
-    # Only 1 valid document should be processed
     assert res["count"] == 1
-    assert len(upsert_called["docs"]) == 1
+    assert fake_analyzer.stored == [parsed_doc]
+    assert len(fake_analyzer.prompts) == 1
 
 
-@pytest.mark.asyncio
+@pytest.mark.parametrize("db_store_stub", ["parsed_doc_long"], indirect=True)
 async def test_analyze_documents_truncates_long_text(
-    monkeypatch: pytest.MonkeyPatch,
+    analyzer_server: ModuleType, db_store_stub: FakeAnalyzer, parsed_doc_long: Any
 ) -> None:
-    """Test that long document text is truncated in the prompt."""
-    from sotaforge.utils import llm
-
-    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
-
-    class DummyClient:
-        def __init__(self, api_key: str | None = None, **kwargs: Any) -> None:
-            self.api_key = api_key
-
-    monkeypatch.setattr(llm, "AsyncOpenAI", DummyClient)
-    llm.reset_llm()
-
-    import importlib
-
-    analyzer_server = importlib.import_module("sotaforge.agents.analyzer_server")
-    from sotaforge.utils.models import ParsedDocument
-
-    # Create a document with very long text
-    long_text = "x" * 100000
-    doc = ParsedDocument(title="Long Doc", text=long_text)
-
-    monkeypatch.setattr(
-        analyzer_server,
-        "db_store",
-        SimpleNamespace(
-            fetch_documents=lambda c: [doc], upsert_documents=lambda c, d: None
-        ),
-    )
-
-    prompts_received = []
-
-    async def fake_run(prompt: str) -> SimpleNamespace:
-        prompts_received.append(prompt)
-        return SimpleNamespace(output=SimpleNamespace(themes=[], insights=[]))
-
-    monkeypatch.setattr(
-        analyzer_server, "analyzer_agent", SimpleNamespace(run=fake_run)
-    )
-
-    func = analyzer_server.analyze_documents.fn
-    await func("src", "dst")
+    """Test that the prompt holds the truncated text, not the full document."""
+    db_store_stub.run_fn = _run_without_themes
 
-    # Check that the prompt doesn't contain the full text
-    assert len(prompts_received) == 1
-    prompt = prompts_received[0]
-    # The prompt should be much shorter than the original text
-    assert len(prompt) < len(long_text)
-    # And it should contain truncated text indicator
-    from sotaforge.utils.constants import ANALYZER_PROMPT_TEXT_LIMIT
+    await analyzer_server.analyze_documents.fn("src", "dst")
 
-    assert str(long_text[:ANALYZER_PROMPT_TEXT_LIMIT]) in prompt
+    (prompt,) = db_store_stub.prompts
+    assert len(prompt) < len(parsed_doc_long.text)
+    assert parsed_doc_long.text[:ANALYZER_PROMPT_TEXT_LIMIT] in prompt
@@ -1,24 +1,59 @@
 """Tests for the FastAPI REST API."""
 
 import asyncio
-from typing import Any, Dict
-from unittest.mock import AsyncMock, patch
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Dict, Iterator
 
+import httpx
+import orjson
 import pytest
 from fastapi.testclient import TestClient
 
+from sotaforge import api
+from sotaforge.api import (
+    _cache_task_json,
+    _cancel_abandoned_task,
+    app,
+    cancelled_tasks,
+    progress_queues,
+    run_sota_generation,
+    tasks,
+)
+from sotaforge.utils.constants import ALLOWED_ORIGINS
+from sotaforge.utils.db import ChromaStore
+
+
+@pytest.fixture(scope="module")
+def client() -> TestClient:
+    """Create one test client for the FastAPI app, shared by the module."""
+    return TestClient(app)
 
-@pytest.fixture
-def client(monkeypatch: pytest.MonkeyPatch) -> TestClient:
-    """Create a test client for the FastAPI app."""
-    # Set required environment variables
-    monkeypatch.setenv("OPENAI_API_KEY", "test-openai-key")
-    monkeypatch.setenv("SERPER_API_KEY", "test-serper-key")
 
-    # Import after setting env vars
-    from sotaforge.api import app
+@pytest.fixture(autouse=True)
+def _clear_task_state() -> Iterator[None]:
+    """Forget the tasks a test created; the app's task registries are global."""
+    yield
+    tasks.clear()
+    progress_queues.clear()
+    cancelled_tasks.clear()
 
-    return TestClient(app)
+
+class ListQueue:
+    """List-backed progress queue; the test reads it once the run is over."""
+
+    def __init__(self) -> None:
+        """Start with no messages."""
+        self.items: list[Any] = []
+
+    async def put(self, item: Any) -> None:
+        """Record a progress message."""
+        self.items.append(item)
+
+
+def _drain(queue: ListQueue) -> list[Any]:
+    """Return the recorded messages, minus end-of-stream markers."""
+    return [msg for msg in queue.items if msg is not None]
 
 
 def test_root_endpoint(client: TestClient) -> None:
@@ -48,6 +83,27 @@ def test_health_check_head(client: TestClient) -> None:
     assert response.status_code == 200
 
 
+def test_lifespan_preloads_orchestrator(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Test that app startup imports the agent stack and builds a private pool."""
+    monkeypatch.setattr(api, "CHROMA_POOL_PARENT", str(tmp_path))
+    try:
+        with TestClient(app):
+            assert app.state.orchestrator.__name__ == "sotaforge.agents.orchestrator"
+            (pool_root,) = tmp_path.iterdir()
+            assert app.state.chroma_pool_root == pool_root
+            ChromaStore(path=pool_root / "0").get_collection("leftover")
+            assert api.chroma_dir_pool.qsize() == len(list(pool_root.iterdir()))
+    finally:
+        # Other tests rely on per-call imports of a mocked orchestrator
+        del app.state.orchestrator
+
+    assert list(tmp_path.iterdir()) == []
+    assert api.chroma_dir_pool.empty()
+    assert not any(path.is_relative_to(tmp_path) for path in ChromaStore._clients)
+
+
 def test_generate_sota_valid_request(client: TestClient) -> None:
     """Test generating SOTA with valid request."""
     response = client.post(
@@ -99,6 +155,51 @@ def test_get_sota_status_existing_task(client: TestClient) -> None:
     assert "created_at" in data
 
 
+def test_get_sota_status_completed_task_served_from_cache(
+    client: TestClient,
+) -> None:
+    """Test that finished tasks are served from their cached JSON payload."""
+    task_id = "cached-task"
+    tasks[task_id] = {
+        "status": "completed",
+        "topic": "Caching",
+        "result": {"text": "Summary"},
+    }
+    _cache_task_json(task_id)
+    assert "_cached_json" in tasks[task_id]
+
+    response = client.get(f"/api/sota/status/{task_id}")
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "status": "completed",
+        "topic": "Caching",
+        "result": {"text": "Summary"},
+    }
+
+
+def test_get_sota_status_unserializable_result_skips_cache(
+    client: TestClient,
+) -> None:
+    """Test that results orjson rejects fall back to FastAPI's encoder."""
+    task_id = "uncacheable-task"
+    tasks[task_id] = {"status": "completed", "result": {1: "one", "tags": {"a"}}}
+    _cache_task_json(task_id)
+    assert "_cached_json" not in tasks[task_id]
+
+    response = client.get(f"/api/sota/status/{task_id}")
+
+    assert response.status_code == 200
+    assert response.json()["result"] == {"1": "one", "tags": ["a"]}
+
+
+def test_encode_event_falls_back_for_unserializable_values() -> None:
+    """Test that SSE frames still encode sets and non-string keys."""
+    assert orjson.loads(api._encode_event({"result": {1: {"a"}}})) == {
+        "result": {"1": ["a"]}
+    }
+
+
 def test_get_sota_status_nonexistent_task(client: TestClient) -> None:
     """Test getting status of nonexistent task."""
     response = client.get("/api/sota/status/nonexistent-task-id")
@@ -141,7 +242,6 @@ def test_stream_sota_progress_nonexistent_task(client: TestClient) -> None:
     assert "not found" in response.json()["detail"].lower()
 
 
-@pytest.mark.asyncio
 async def test_run_sota_generation_missing_api_keys(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -150,11 +250,9 @@ async def test_run_sota_generation_missing_api_keys(
     monkeypatch.delenv("OPENAI_API_KEY", raising=False)
     monkeypatch.delenv("SERPER_API_KEY", raising=False)
 
-    from sotaforge.api import progress_queues, run_sota_generation, tasks
-
     task_id = "test-task-1"
-    queue: asyncio.Queue[Any] = asyncio.Queue()
-    progress_queues[task_id] = queue
+    queue = ListQueue()
+    progress_queues[task_id] = queue  # type: ignore[assignment]
     tasks[task_id] = {"status": "pending"}
 
     await run_sota_generation(task_id, "Test topic", "")
@@ -164,276 +262,207 @@ async def test_run_sota_generation_missing_api_keys(
     assert "Missing required environment variables" in tasks[task_id]["error"]
 
     # Verify error was sent to queue
-    messages = []
-    while not queue.empty():
-        msg = await queue.get()
-        if msg is not None:
-            messages.append(msg)
+    messages = _drain(queue)
 
     error_messages = [m for m in messages if m.get("status") == "failed"]
     assert len(error_messages) > 0
     assert "Missing required environment variables" in error_messages[0]["message"]
 
 
-@pytest.mark.asyncio
-async def test_run_sota_generation_cancelled_before_start(
-    monkeypatch: pytest.MonkeyPatch,
-) -> None:
-    """Test task cancellation before it starts."""
-    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
-    monkeypatch.setenv("SERPER_API_KEY", "test-key")
-
-    from sotaforge.api import (
-        cancelled_tasks,
-        progress_queues,
-        run_sota_generation,
-        tasks,
-    )
+_SOTA_RESULT = {
+    "topic": "AI research",
+    "status": "completed",
+    "text": "This is the generated SOTA summary",
+}
 
-    task_id = "test-task-2"
-    queue: asyncio.Queue[Any] = asyncio.Queue()
-    progress_queues[task_id] = queue
-    tasks[task_id] = {"status": "pending"}
-    cancelled_tasks.add(task_id)  # Cancel before starting
 
-    await run_sota_generation(task_id, "Test topic", "")
+async def _run_llm_sota_ok(topic: str) -> Dict[str, Any]:
+    return _SOTA_RESULT
 
-    # Check that task was cancelled
-    assert tasks[task_id]["status"] == "cancelled"
-
-    # Verify cancellation was sent to queue
-    messages = []
-    while not queue.empty():
-        msg = await queue.get()
-        if msg is not None:
-            messages.append(msg)
 
-    cancelled_messages = [m for m in messages if m.get("status") == "cancelled"]
-    assert len(cancelled_messages) > 0
+async def _run_llm_sota_error(topic: str) -> Dict[str, Any]:
+    raise Exception("Orchestrator error")
 
 
-@pytest.mark.asyncio
-async def test_run_sota_generation_success(monkeypatch: pytest.MonkeyPatch) -> None:
-    """Test successful SOTA generation."""
-    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
-    monkeypatch.setenv("SERPER_API_KEY", "test-key")
+@pytest.fixture
+def patched_orchestrator(
+    request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch
+) -> ModuleType:
+    """Swap request.param in as the real orchestrator's run_llm_sota."""
+    from sotaforge.agents import orchestrator
+
+    monkeypatch.setattr(orchestrator, "run_llm_sota", request.param)
+    # run_sota_generation injects its queue here; restore it afterwards
+    monkeypatch.setattr(orchestrator, "progress_queue", None)
+    return orchestrator
+
+
+@pytest.mark.parametrize(
+    ("patched_orchestrator", "email", "cancelled", "expected_status"),
+    [
+        pytest.param(_run_llm_sota_ok, "", False, "completed", id="success"),
+        pytest.param(
+            _run_llm_sota_ok, "test@example.com", False, "completed", id="email"
+        ),
+        pytest.param(_run_llm_sota_error, "", False, "failed", id="error"),
+        pytest.param(_run_llm_sota_ok, "", True, "cancelled", id="cancelled"),
+    ],
+    indirect=["patched_orchestrator"],
+)
+async def test_run_sota_generation(
+    monkeypatch: pytest.MonkeyPatch,
+    patched_orchestrator: ModuleType,
+    email: str,
+    cancelled: bool,
+    expected_status: str,
+) -> None:
+    """Test run_sota_generation outcomes, progress events and email delivery."""
+    task_id = "test-task"
+    queue = ListQueue()
+    progress_queues[task_id] = queue  # type: ignore[assignment]
+    tasks[task_id] = {"status": "pending"}
+    if cancelled:
+        cancelled_tasks.add(task_id)  # Cancel before starting
 
-    # Mock the orchestrator's run_llm_sota function
-    mock_result = {
-        "topic": "AI research",
-        "status": "completed",
-        "text": "This is the generated SOTA summary",
-    }
+    sent: list[tuple[Any, ...]] = []
 
-    async def mock_run_llm_sota(topic: str) -> Dict[str, Any]:
-        return mock_result
-
-    # Create a mock orchestrator module
-    import importlib
-    import sys
-    from types import ModuleType
-
-    mock_orchestrator = ModuleType("sotaforge.agents.orchestrator")
-    mock_orchestrator.run_llm_sota = mock_run_llm_sota  # type: ignore[attr-defined]
-    mock_orchestrator.progress_queue = None  # type: ignore[attr-defined]
-
-    # Mock other agent modules to avoid loading them
-    mock_modules = {
-        "sotaforge.agents.orchestrator": mock_orchestrator,
-        "sotaforge.agents.db_server": ModuleType("sotaforge.agents.db_server"),
-        "sotaforge.agents.filter_server": ModuleType("sotaforge.agents.filter_server"),
-        "sotaforge.agents.parser_server": ModuleType("sotaforge.agents.parser_server"),
-        "sotaforge.agents.analyzer_server": ModuleType(
-            "sotaforge.agents.analyzer_server"
-        ),
-        "sotaforge.agents.synthesizer_server": ModuleType(
-            "sotaforge.agents.synthesizer_server"
-        ),
-    }
+    async def fake_send_email(*args: Any) -> None:
+        sent.append(args)
 
-    # Mock importlib.reload and importlib.import_module to return our mocks
-    original_import = importlib.import_module
+    monkeypatch.setattr(api, "send_email", fake_send_email)
+    await run_sota_generation(task_id, "AI research", email)
 
-    def mock_reload(module: Any) -> Any:
-        return module
+    assert tasks[task_id]["status"] == expected_status
+    if expected_status == "completed":
+        assert tasks[task_id]["result"] == _SOTA_RESULT
+    if expected_status == "failed":
+        assert "Orchestrator error" in tasks[task_id]["error"]
 
-    def mock_import_module(name: str) -> Any:
-        return mock_modules.get(name, original_import(name))
+    assert sent == ([(email, "AI research", _SOTA_RESULT)] if email else [])
 
-    with patch.dict(sys.modules, mock_modules):
-        with patch("importlib.reload", side_effect=mock_reload):
-            with patch("importlib.import_module", side_effect=mock_import_module):
-                from sotaforge.api import progress_queues, run_sota_generation, tasks
+    # Verify the outcome was sent to the queue
+    messages = _drain(queue)
 
-                task_id = "test-task-3"
-                queue: asyncio.Queue[Any] = asyncio.Queue()
-                progress_queues[task_id] = queue
-                tasks[task_id] = {"status": "pending"}
+    assert [m for m in messages if m.get("status") == expected_status]
 
-                await run_sota_generation(task_id, "AI research", "")
 
-                # Check that task completed
-                assert tasks[task_id]["status"] == "completed"
-                assert tasks[task_id]["result"] == mock_result
+async def test_cancel_abandoned_task_stops_running_task() -> None:
+    """Test that a dropped stream cancels a task nobody is waiting for."""
+    handle = asyncio.create_task(asyncio.sleep(60))
+    tasks["abandoned-task"] = {"status": "running", "email": None, "_task": handle}
 
-                # Verify completion was sent to queue
-                messages = []
-                while not queue.empty():
-                    msg = await queue.get()
-                    if msg is not None:
-                        messages.append(msg)
+    _cancel_abandoned_task("abandoned-task")
 
-                completed_messages = [
-                    m for m in messages if m.get("status") == "completed"
-                ]
-                assert len(completed_messages) > 0
+    with pytest.raises(asyncio.CancelledError):
+        await handle
 
 
-@pytest.mark.asyncio
-async def test_run_sota_generation_with_email(monkeypatch: pytest.MonkeyPatch) -> None:
-    """Test SOTA generation with email notification."""
-    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
-    monkeypatch.setenv("SERPER_API_KEY", "test-key")
+async def test_cancel_abandoned_task_keeps_email_task_running() -> None:
+    """Test that tasks delivering results by email survive a dropped stream."""
+    handle = asyncio.create_task(asyncio.sleep(60))
+    tasks["email-task"] = {
+        "status": "running",
+        "email": "test@example.com",
+        "_task": handle,
+    }
 
-    # Mock the orchestrator and email
-    mock_result = {"topic": "AI", "status": "completed", "text": "Summary"}
+    _cancel_abandoned_task("email-task")
 
-    async def mock_run_llm_sota(topic: str) -> Dict[str, Any]:
-        return mock_result
+    assert not handle.cancelled()
+    handle.cancel()
 
-    mock_send_email = AsyncMock()
 
-    # Create a mock orchestrator module
-    import importlib
-    import sys
-    from types import ModuleType
+@pytest.fixture
+def slow_orchestrator(monkeypatch: pytest.MonkeyPatch) -> asyncio.Event:
+    """Make run_llm_sota block; the returned event is set once it starts."""
+    from sotaforge.agents import orchestrator
 
-    mock_orchestrator = ModuleType("sotaforge.agents.orchestrator")
-    mock_orchestrator.run_llm_sota = mock_run_llm_sota  # type: ignore[attr-defined]
-    mock_orchestrator.progress_queue = None  # type: ignore[attr-defined]
+    started = asyncio.Event()
 
-    # Mock other agent modules to avoid loading them
-    mock_modules = {
-        "sotaforge.agents.orchestrator": mock_orchestrator,
-        "sotaforge.agents.db_server": ModuleType("sotaforge.agents.db_server"),
-        "sotaforge.agents.filter_server": ModuleType("sotaforge.agents.filter_server"),
-        "sotaforge.agents.parser_server": ModuleType("sotaforge.agents.parser_server"),
-        "sotaforge.agents.analyzer_server": ModuleType(
-            "sotaforge.agents.analyzer_server"
-        ),
-        "sotaforge.agents.synthesizer_server": ModuleType(
-            "sotaforge.agents.synthesizer_server"
-        ),
-    }
+    async def _run_llm_sota_slow(topic: str) -> Dict[str, Any]:
+        started.set()
+        await asyncio.sleep(60)
+        return _SOTA_RESULT
 
-    # Mock importlib.reload and importlib.import_module to return our mocks
-    original_import = importlib.import_module
+    monkeypatch.setattr(orchestrator, "run_llm_sota", _run_llm_sota_slow)
+    monkeypatch.setattr(orchestrator, "progress_queue", None)
+    return started
 
-    def mock_reload(module: Any) -> Any:
-        return module
 
-    def mock_import_module(name: str) -> Any:
-        return mock_modules.get(name, original_import(name))
+async def test_run_sota_generation_abandoned_stream_cancels_pipeline_only(
+    slow_orchestrator: asyncio.Event,
+) -> None:
+    """Test that cancelling the pipeline handle leaves the caller running."""
+    task_id = "abandoned-task"
+    queue = ListQueue()
+    progress_queues[task_id] = queue  # type: ignore[assignment]
+    tasks[task_id] = {"status": "pending", "email": None}
+
+    runner = asyncio.create_task(run_sota_generation(task_id, "AI research", ""))
+    await slow_orchestrator.wait()
+    _cancel_abandoned_task(task_id)
+    await runner
+
+    assert not runner.cancelled()
+    assert tasks[task_id]["status"] == "cancelled"
+    assert queue.items[-1] is None
 
-    # Patch both the orchestrator module and send_email
-    with patch.dict(sys.modules, mock_modules):
-        with patch("importlib.reload", side_effect=mock_reload):
-            with patch("importlib.import_module", side_effect=mock_import_module):
-                with patch("sotaforge.api.send_email", mock_send_email):
-                    from sotaforge.api import (
-                        progress_queues,
-                        run_sota_generation,
-                        tasks,
-                    )
 
-                    task_id = "test-task-4"
-                    queue: asyncio.Queue[Any] = asyncio.Queue()
-                    progress_queues[task_id] = queue
-                    tasks[task_id] = {"status": "pending"}
+async def test_run_sota_generation_propagates_outer_cancellation(
+    slow_orchestrator: asyncio.Event,
+) -> None:
+    """Test that cancelling the request task is re-raised, not swallowed."""
+    task_id = "shutdown-task"
+    progress_queues[task_id] = ListQueue()  # type: ignore[assignment]
+    tasks[task_id] = {"status": "pending", "email": None}
 
-                    await run_sota_generation(task_id, "AI", "test@example.com")
+    runner = asyncio.create_task(run_sota_generation(task_id, "AI research", ""))
+    await slow_orchestrator.wait()
+    runner.cancel()
 
-                    # Verify email was sent
-                    mock_send_email.assert_called_once_with(
-                        "test@example.com", "AI", mock_result
-                    )
+    with pytest.raises(asyncio.CancelledError):
+        await runner
+    assert tasks[task_id]["status"] == "cancelled"
 
 
-@pytest.mark.asyncio
-async def test_run_sota_generation_error_handling(
-    monkeypatch: pytest.MonkeyPatch,
+async def test_release_chroma_dir_resets_and_pools_directory(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
 ) -> None:
-    """Test error handling in SOTA generation."""
-    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
-    monkeypatch.setenv("SERPER_API_KEY", "test-key")
-
-    # Mock orchestrator to raise error
-    async def mock_run_llm_sota(topic: str) -> Dict[str, Any]:
-        raise Exception("Orchestrator error")
-
-    # Create a mock orchestrator module
-    import importlib
-    import sys
-    from types import ModuleType
-
-    mock_orchestrator = ModuleType("sotaforge.agents.orchestrator")
-    mock_orchestrator.run_llm_sota = mock_run_llm_sota  # type: ignore[attr-defined]
-    mock_orchestrator.progress_queue = None  # type: ignore[attr-defined]
-
-    # Mock other agent modules to avoid loading them
-    mock_modules = {
-        "sotaforge.agents.orchestrator": mock_orchestrator,
-        "sotaforge.agents.db_server": ModuleType("sotaforge.agents.db_server"),
-        "sotaforge.agents.filter_server": ModuleType("sotaforge.agents.filter_server"),
-        "sotaforge.agents.parser_server": ModuleType("sotaforge.agents.parser_server"),
-        "sotaforge.agents.analyzer_server": ModuleType(
-            "sotaforge.agents.analyzer_server"
-        ),
-        "sotaforge.agents.synthesizer_server": ModuleType(
-            "sotaforge.agents.synthesizer_server"
-        ),
-    }
-
-    # Mock importlib.reload and importlib.import_module to return our mocks
-    original_import = importlib.import_module
+    """Test that pooled Chroma directories are emptied and reused."""
+    monkeypatch.setattr(app.state, "chroma_pool_root", tmp_path, raising=False)
+    pool_dir = str(tmp_path / "0")
+    ChromaStore(path=pool_dir).get_collection("leftover")
 
-    def mock_reload(module: Any) -> Any:
-        return module
+    await api._release_chroma_dir(pool_dir)
 
-    def mock_import_module(name: str) -> Any:
-        return mock_modules.get(name, original_import(name))
+    assert api._acquire_chroma_dir() == pool_dir
+    assert (tmp_path / "0").exists()
+    assert ChromaStore(path=pool_dir).client.list_collections() == []
 
-    # Patch the orchestrator module
-    with patch.dict(sys.modules, mock_modules):
-        with patch("importlib.reload", side_effect=mock_reload):
-            with patch("importlib.import_module", side_effect=mock_import_module):
-                from sotaforge.api import progress_queues, run_sota_generation, tasks
 
-                task_id = "test-task-5"
-                queue: asyncio.Queue[Any] = asyncio.Queue()
-                progress_queues[task_id] = queue
-                tasks[task_id] = {"status": "pending"}
+async def test_release_chroma_dir_removes_temporary_directory(tmp_path: Path) -> None:
+    """Test that non-pooled directories are closed and deleted on release."""
+    temp_dir = tmp_path / "sotaforge_sota_x"
+    ChromaStore(path=temp_dir).get_collection("leftover")
 
-                await run_sota_generation(task_id, "Test", "")
+    await api._release_chroma_dir(str(temp_dir))
 
-                # Check that task failed
-                assert tasks[task_id]["status"] == "failed"
-                assert "error" in tasks[task_id]
-                assert "Orchestrator error" in tasks[task_id]["error"]
+    assert not temp_dir.exists()
+    assert temp_dir not in ChromaStore._clients
 
 
-def test_cors_configuration(client: TestClient) -> None:
-    """Test that CORS headers are properly configured."""
+@pytest.mark.parametrize("origin", sorted(set(ALLOWED_ORIGINS)))
+def test_cors_configuration(client: TestClient, origin: str) -> None:
+    """Test that CORS preflights from allowed origins are accepted."""
     response = client.options(
         "/api/sota",
         headers={
-            "Origin": "http://localhost:3000",
+            "Origin": origin,
             "Access-Control-Request-Method": "POST",
         },
     )
 
-    # CORS should be configured
-    assert "access-control-allow-origin" in response.headers
+    assert response.headers["access-control-allow-origin"] == origin
 
 
 def test_api_validates_request_schema(client: TestClient) -> None:
@@ -447,20 +476,24 @@ def test_api_validates_request_schema(client: TestClient) -> None:
     assert response.status_code == 422
 
 
-def test_multiple_concurrent_tasks(client: TestClient) -> None:
+async def test_multiple_concurrent_tasks() -> None:
     """Test creating multiple tasks concurrently."""
     topics = ["AI", "ML", "Deep Learning", "NLP"]
-    task_ids = []
-
-    for topic in topics:
-        response = client.post("/api/sota", json={"topic": topic})
-        assert response.status_code == 200
-        task_ids.append(response.json()["task_id"])
-
-    # All task IDs should be unique
-    assert len(task_ids) == len(set(task_ids))
 
-    # All tasks should be retrievable
-    for task_id in task_ids:
-        response = client.get(f"/api/sota/status/{task_id}")
-        assert response.status_code == 200
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://test"
+    ) as async_client:
+        responses = await asyncio.gather(
+            *(async_client.post("/api/sota", json={"topic": t}) for t in topics)
+        )
+        assert all(response.status_code == 200 for response in responses)
+        task_ids = [response.json()["task_id"] for response in responses]
+
+        # All task IDs should be unique
+        assert len(task_ids) == len(set(task_ids))
+
+        # All tasks should be retrievable
+        statuses = await asyncio.gather(
+            *(async_client.get(f"/api/sota/status/{t}") for t in task_ids)
+        )
+        assert all(response.status_code == 200 for response in statuses)
@@ -1,12 +1,15 @@
 """Unit tests for db.py ChromaDB utilities."""
 
-import tempfile
+import gc
+import shutil
 from pathlib import Path
-from typing import Any, Dict, Generator
+from typing import Any, Generator, Mapping
+from unittest.mock import MagicMock
 
+import numpy as np
 import pytest
 
-from sotaforge.utils.db import ChromaStore, NullEmbeddingFunction
+from sotaforge.utils.db import CHROMA_PATH_CTX, ChromaStore, NullEmbeddingFunction
 from sotaforge.utils.models import NotParsedDocument, ParsedDocument
 
 
@@ -32,47 +35,51 @@ class TestNullEmbeddingFunction:
 
         embeddings = embedder(texts)
 
-        assert len(embeddings) == 3
-        assert all(len(emb) == 64 for emb in embeddings)
-        assert all(all(val == 0.0 for val in emb) for emb in embeddings)
+        # Chroma hands the vectors back as numpy arrays
+        vectors = np.asarray(embeddings)
+        assert vectors.shape == (3, 64)
+        assert not vectors.any()
 
 
 class TestChromaStore:
     """Tests for ChromaStore class."""
 
     @pytest.fixture
-    def temp_chroma_path(self) -> Generator[Path, None, None]:
-        """Create a temporary directory for ChromaDB."""
-        tmpdir = tempfile.mkdtemp()
-        yield Path(tmpdir)
-        # Cleanup is handled by chroma_store fixture
+    def temp_chroma_path(self, tmp_path: Path) -> Generator[Path, None, None]:
+        """Yield a temporary directory for ChromaDB, removed by pytest."""
+        yield tmp_path
+        # Close the clients opened under it before pytest deletes it
+        for path in list(ChromaStore._clients):
+            if path.is_relative_to(tmp_path):
+                ChromaStore.release(path)
+
+    @pytest.fixture(scope="class")
+    def shared_chroma_store(
+        self, tmp_path_factory: pytest.TempPathFactory
+    ) -> Generator[ChromaStore, None, None]:
+        """Create one ChromaStore for the whole class."""
+        chroma_path = tmp_path_factory.mktemp("chroma")
+        store = ChromaStore(path=chroma_path)
+        yield store
+        # Close the client so sqlite releases its files
+        ChromaStore.release(chroma_path)
+        gc.collect()
+        shutil.rmtree(chroma_path, ignore_errors=True)
+
+    @pytest.fixture(scope="class")
+    def sample_parsed_doc(
+        self, sample_parsed_document: Mapping[str, Any]
+    ) -> ParsedDocument:
+        """Return the sample ParsedDocument, built once for the class."""
+        return ParsedDocument.from_dict(sample_parsed_document)
 
     @pytest.fixture
     def chroma_store(
-        self, temp_chroma_path: Path
+        self, shared_chroma_store: ChromaStore
     ) -> Generator[ChromaStore, None, None]:
-        """Create a ChromaStore instance with temp path."""
-        store = ChromaStore(path=temp_chroma_path)
-        yield store
-        # Close client connections before cleanup
-        try:
-            if hasattr(store.client, "_producer"):
-                store.client._producer.stop()
-            if hasattr(store.client, "clear_system_cache"):
-                store.client.clear_system_cache()
-        except Exception:
-            pass
-        # Give Windows time to release file handles
-        import time
-
-        time.sleep(0.1)
-        # Cleanup temp directory
-        import shutil
-
-        try:
-            shutil.rmtree(temp_chroma_path, ignore_errors=True)
-        except Exception:
-            pass
+        """Return the shared ChromaStore, emptied again after the test."""
+        yield shared_chroma_store
+        shared_chroma_store.reset()
 
     def test_chroma_store_initialization(self, temp_chroma_path: Path) -> None:
         """Test ChromaStore initialization creates path and client."""
@@ -83,6 +90,46 @@ class TestChromaStore:
         assert store.client is not None
         assert isinstance(store.embedder, NullEmbeddingFunction)
 
+    def test_chroma_store_follows_env_path(
+        self, temp_chroma_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a store without explicit path resolves it at call time."""
+        store = ChromaStore()
+        monkeypatch.setenv("SOTAFORGE_CHROMA_PATH", str(temp_chroma_path / "a"))
+        assert store.path == temp_chroma_path / "a"
+        client_a = store.client
+
+        monkeypatch.setenv("SOTAFORGE_CHROMA_PATH", str(temp_chroma_path / "b"))
+        assert store.path == temp_chroma_path / "b"
+        assert store.client is not client_a
+        assert (temp_chroma_path / "b").exists()
+
+    def test_chroma_store_context_path_overrides_env(
+        self, temp_chroma_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that the context-local path wins over the environment."""
+        store = ChromaStore()
+        monkeypatch.setenv("SOTAFORGE_CHROMA_PATH", str(temp_chroma_path / "env"))
+        token = CHROMA_PATH_CTX.set(str(temp_chroma_path / "ctx"))
+        try:
+            assert store.path == temp_chroma_path / "ctx"
+        finally:
+            CHROMA_PATH_CTX.reset(token)
+        assert store.path == temp_chroma_path / "env"
+
+    def test_release_drops_client_for_path(self, temp_chroma_path: Path) -> None:
+        """Test that releasing a path closes its client for every store."""
+        store = ChromaStore(path=temp_chroma_path)
+        store.get_collection("docs")
+        client = store.client
+
+        ChromaStore.release(temp_chroma_path)
+
+        assert temp_chroma_path not in ChromaStore._clients
+        # A fresh client reopens the persisted data
+        assert store.client is not client
+        assert [c.name for c in store.client.list_collections()] == ["docs"]
+
     def test_chroma_store_get_collection(self, chroma_store: ChromaStore) -> None:
         """Test getting or creating a collection."""
         collection = chroma_store.get_collection("test_collection")
@@ -99,14 +146,24 @@ class TestChromaStore:
 
         assert col1.name == col2.name
 
+    def test_get_collection_cached_until_reset(self, chroma_store: ChromaStore) -> None:
+        """Test that handles are reused but dropped after any store resets."""
+        col1 = chroma_store.get_collection("test")
+        assert chroma_store.get_collection("test") is col1
+
+        ChromaStore(path=chroma_store.path).reset()
+        col2 = chroma_store.get_collection("test")
+
+        assert col2 is not col1
+        assert col2.count() == 0
+
     def test_upsert_parsed_documents(
         self,
         chroma_store: ChromaStore,
-        sample_parsed_document: Dict[str, Any],
+        sample_parsed_doc: ParsedDocument,
     ) -> None:
         """Test upserting ParsedDocument objects."""
-        doc = ParsedDocument.from_dict(sample_parsed_document)
-        docs = [doc]
+        docs = [sample_parsed_doc]
 
         ids = chroma_store.upsert_documents("test_collection", docs)
 
@@ -121,7 +178,7 @@ class TestChromaStore:
     def test_upsert_not_parsed_documents(
         self,
         chroma_store: ChromaStore,
-        sample_not_parsed_document: Dict[str, Any],
+        sample_not_parsed_document: Mapping[str, Any],
     ) -> None:
         """Test upserting NotParsedDocument objects."""
         doc = NotParsedDocument.from_dict(sample_not_parsed_document)
@@ -144,10 +201,10 @@ class TestChromaStore:
     def test_upsert_multiple_documents(
         self,
         chroma_store: ChromaStore,
-        sample_parsed_document: Dict[str, Any],
+        sample_parsed_doc: ParsedDocument,
     ) -> None:
         """Test upserting multiple documents at once."""
-        doc1 = ParsedDocument.from_dict(sample_parsed_document)
+        doc1 = sample_parsed_doc
         doc2 = ParsedDocument(
             title="Second Document",
             url="https://example.com/2",
@@ -159,13 +216,92 @@ class TestChromaStore:
         assert len(ids) == 2
         assert len(set(ids)) == 2  # All IDs are unique
 
+    def test_upsert_documents_in_batches(
+        self, chroma_store: ChromaStore, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that large upserts are split into bounded Chroma calls."""
+        monkeypatch.setattr("sotaforge.utils.db.CHROMA_UPSERT_BATCH_SIZE", 2)
+        docs = [ParsedDocument(title=f"Doc {i}", text="text") for i in range(5)]
+
+        collection = MagicMock()
+        monkeypatch.setattr(chroma_store, "get_collection", lambda name: collection)
+
+        ids = chroma_store.upsert_documents("test_collection", docs)
+
+        assert len(ids) == 5
+        batches = [call.kwargs["ids"] for call in collection.upsert.call_args_list]
+        assert [len(batch) for batch in batches] == [2, 2, 1]
+        assert [i for batch in batches for i in batch] == ids
+
+    @pytest.fixture(scope="class")
+    def bulk_docs(self) -> list[ParsedDocument]:
+        """Return a hundred small documents, below one upsert batch."""
+        return [ParsedDocument(title=f"Doc {i}", text="text") for i in range(100)]
+
+    def test_upsert_bulk_documents_in_one_call(
+        self,
+        chroma_store: ChromaStore,
+        bulk_docs: list[ParsedDocument],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that a batch under the size limit reaches Chroma in one upsert."""
+        collection = chroma_store.get_collection("test_collection")
+        spy = MagicMock(wraps=collection.upsert)
+        monkeypatch.setattr(collection, "upsert", spy)
+
+        ids = chroma_store.upsert_documents("test_collection", bulk_docs)
+
+        assert spy.call_count == 1
+        assert len(ids) == 100
+        assert collection.count() == 100
+
+    def test_upsert_fetch_round_trips_unicode_metadata(
+        self, chroma_store: ChromaStore
+    ) -> None:
+        """Test that non-ASCII list and dict fields survive serialization."""
+        doc = ParsedDocument(
+            title="Étude",
+            text="text",
+            authors=["José Núñez", "李雷"],
+            metadata={"lang": "français"},
+        )
+
+        chroma_store.upsert_documents("test_collection", [doc])
+        fetched = chroma_store.fetch_documents("test_collection")
+
+        assert fetched[0].authors == ["José Núñez", "李雷"]
+        assert fetched[0].metadata == {"lang": "français"}
+
+    def test_fetch_documents_keeps_invalid_json_metadata_raw(
+        self, chroma_store: ChromaStore
+    ) -> None:
+        """Test that bracketed strings that are not JSON are kept verbatim."""
+        collection = chroma_store.get_collection("test_collection")
+        collection.upsert(
+            ids=["1"], documents=[""], metadatas=[{"title": "T", "venue": "[draft"}]
+        )
+
+        fetched = chroma_store.fetch_documents("test_collection")
+
+        assert fetched[0].venue == "[draft"
+
+    async def test_async_upsert_and_fetch(self, chroma_store: ChromaStore) -> None:
+        """Test the throttled async wrappers round-trip documents."""
+        doc = ParsedDocument(title="Async", text="text")
+
+        ids = await chroma_store.upsert_documents_async("test_collection", [doc])
+        fetched = await chroma_store.fetch_documents_async("test_collection")
+
+        assert len(ids) == 1
+        assert [d.title for d in fetched] == ["Async"]
+
     def test_fetch_documents(
         self,
         chroma_store: ChromaStore,
-        sample_parsed_document: Dict[str, Any],
+        sample_parsed_doc: ParsedDocument,
     ) -> None:
         """Test fetching all documents from a collection."""
-        doc1 = ParsedDocument.from_dict(sample_parsed_document)
+        doc1 = sample_parsed_doc
         doc2 = ParsedDocument(title="Second", url="https://test.com", text="Text")
 
         chroma_store.upsert_documents("test_collection", [doc1, doc2])
@@ -181,10 +317,10 @@ class TestChromaStore:
     def test_fetch_documents_with_limit(
         self,
         chroma_store: ChromaStore,
-        sample_parsed_document: Dict[str, Any],
+        sample_parsed_doc: ParsedDocument,
     ) -> None:
         """Test fetching documents with a limit."""
-        doc1 = ParsedDocument.from_dict(sample_parsed_document)
+        doc1 = sample_parsed_doc
         doc2 = ParsedDocument(title="Second", url="https://test.com", text="Text")
         doc3 = ParsedDocument(title="Third", url="https://test3.com", text="More")
 
@@ -196,11 +332,10 @@ class TestChromaStore:
     def test_fetch_documents_returns_parsed_documents(
         self,
         chroma_store: ChromaStore,
-        sample_parsed_document: Dict[str, Any],
+        sample_parsed_doc: ParsedDocument,
     ) -> None:
         """Test that fetch_documents returns ParsedDocument instances."""
-        doc = ParsedDocument.from_dict(sample_parsed_document)
-        chroma_store.upsert_documents("test_collection", [doc])
+        chroma_store.upsert_documents("test_collection", [sample_parsed_doc])
 
         docs = chroma_store.fetch_documents("test_collection")
 
@@ -230,3 +365,47 @@ class TestChromaStore:
         metadata = metadatas[0]
         assert "title" in metadata
         assert metadata["title"] == "Test"
+
+    def test_complex_fields_packed_into_one_blob(
+        self, chroma_store: ChromaStore
+    ) -> None:
+        """Test that list/dict fields are stored together and restored."""
+        doc = ParsedDocument(
+            title="Test", text="Content", authors=["A"], themes=["AI"], year=2024
+        )
+
+        ids = chroma_store.upsert_documents("test_collection", [doc])
+        metadatas = chroma_store.get_collection("test_collection").get(ids=ids)[
+            "metadatas"
+        ]
+        assert metadatas is not None
+        assert "authors" not in metadatas[0]
+        assert "_complex" in metadatas[0]
+
+        fetched = chroma_store.fetch_documents("test_collection")
+        assert fetched == [doc]
+
+    def test_fetch_documents_reads_legacy_per_field_json(
+        self, chroma_store: ChromaStore
+    ) -> None:
+        """Test that rows with per-field JSON metadata are still decoded."""
+        chroma_store.get_collection("test_collection").upsert(
+            ids=["1"],
+            documents=["Content"],
+            metadatas=[{"title": "Old", "authors": '["A", "B"]'}],
+        )
+
+        fetched = chroma_store.fetch_documents("test_collection")
+
+        assert fetched[0].authors == ["A", "B"]
+
+    def test_fetch_documents_keeps_json_like_titles(
+        self, chroma_store: ChromaStore
+    ) -> None:
+        """Test that scalar fields of packed rows are never JSON-decoded."""
+        doc = ParsedDocument(title="[1]", text="Content")
+        chroma_store.upsert_documents("test_collection", [doc])
+
+        fetched = chroma_store.fetch_documents("test_collection")
+
+        assert fetched[0].title == "[1]"
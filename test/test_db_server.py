@@ -1,21 +1,19 @@
 """Tests for `db_server`."""
 
+from types import ModuleType
 from typing import Any
 
 import pytest
 
 from sotaforge.utils.errors import DatabaseError
+from sotaforge.utils.models import ParsedDocument
 
 
-@pytest.mark.asyncio
 async def test_store_records_with_parsed_documents(
+    db_server: ModuleType,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     """Test storing parsed documents with text field."""
-    import importlib
-
-    db_server = importlib.import_module("sotaforge.agents.db_server")
-
     stored_data: dict[str, Any] = {}
 
     def fake_upsert(collection: str, docs: list[Any]) -> list[str]:
@@ -44,15 +42,11 @@ async def test_store_records_with_parsed_documents(
     assert len(stored_data["docs"]) == 2
 
 
-@pytest.mark.asyncio
 async def test_store_records_with_not_parsed_documents(
+    db_server: ModuleType,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     """Test storing not parsed documents without text field."""
-    import importlib
-
-    db_server = importlib.import_module("sotaforge.agents.db_server")
-
     stored_data: dict[str, Any] = {}
 
     def fake_upsert(collection: str, docs: list[Any]) -> list[str]:
@@ -79,15 +73,11 @@ async def test_store_records_with_not_parsed_documents(
     assert res["ids"] == ["id_0", "id_1"]
 
 
-@pytest.mark.asyncio
 async def test_store_records_mixed_documents_raises_error(
+    db_server: ModuleType,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     """Test that mixing parsed and not parsed documents raises an error."""
-    import importlib
-
-    db_server = importlib.import_module("sotaforge.agents.db_server")
-
     items = [
         {"title": "Doc1", "text": "Content 1"},  # ParsedDocument
         {"title": "Doc2", "url": "http://example.com/2"},  # NotParsedDocument
@@ -99,15 +89,11 @@ async def test_store_records_mixed_documents_raises_error(
         await func("test_collection", items)
 
 
-@pytest.mark.asyncio
 async def test_store_records_invalid_items_raises_error(
+    db_server: ModuleType,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     """Test that non-dict items raise an error."""
-    import importlib
-
-    db_server = importlib.import_module("sotaforge.agents.db_server")
-
     items = ["not a dict", {"title": "Doc1"}]
 
     func = db_server.store_records.fn
@@ -116,16 +102,11 @@ async def test_store_records_invalid_items_raises_error(
         await func("test_collection", items)
 
 
-@pytest.mark.asyncio
 async def test_fetch_documents_returns_all_documents(
+    db_server: ModuleType,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     """Test fetching all documents from a collection."""
-    import importlib
-
-    db_server = importlib.import_module("sotaforge.agents.db_server")
-    from sotaforge.utils.models import ParsedDocument
-
     docs = [
         ParsedDocument(title="Doc1", text="Content 1"),
         ParsedDocument(title="Doc2", text="Content 2"),
@@ -147,14 +128,10 @@ async def test_fetch_documents_returns_all_documents(
     assert res["documents"][1]["title"] == "Doc2"
 
 
-@pytest.mark.asyncio
-async def test_fetch_documents_with_limit(monkeypatch: pytest.MonkeyPatch) -> None:
+async def test_fetch_documents_with_limit(
+    db_server: ModuleType, monkeypatch: pytest.MonkeyPatch
+) -> None:
     """Test fetching documents with a limit."""
-    import importlib
-
-    db_server = importlib.import_module("sotaforge.agents.db_server")
-    from sotaforge.utils.models import ParsedDocument
-
     docs = [ParsedDocument(title="Doc1", text="Content 1")]
 
     fetch_calls: dict[str, Any] = {}
@@ -173,15 +150,11 @@ async def test_fetch_documents_with_limit(monkeypatch: pytest.MonkeyPatch) -> No
     assert fetch_calls["limit"] == 5
 
 
-@pytest.mark.asyncio
 async def test_fetch_documents_empty_collection(
+    db_server: ModuleType,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     """Test fetching from an empty collection."""
-    import importlib
-
-    db_server = importlib.import_module("sotaforge.agents.db_server")
-
     monkeypatch.setattr(
         db_server.store,
         "fetch_documents",
@@ -196,13 +169,10 @@ async def test_fetch_documents_empty_collection(
     assert res["documents"] == []
 
 
-@pytest.mark.asyncio
-async def test_store_tool_results_no_messages(monkeypatch: pytest.MonkeyPatch) -> None:
+async def test_store_tool_results_no_messages(
+    db_server: ModuleType, monkeypatch: pytest.MonkeyPatch
+) -> None:
     """Test store_tool_results when no messages are provided."""
-    import importlib
-
-    db_server = importlib.import_module("sotaforge.agents.db_server")
-
     func = db_server.store_tool_results.fn
     res = await func("test_collection", ["tool_id_1"], messages=None)
 
@@ -210,15 +180,11 @@ async def test_store_tool_results_no_messages(monkeypatch: pytest.MonkeyPatch) -
     assert res["count"] == 0
 
 
-@pytest.mark.asyncio
 async def test_store_tool_results_with_results_field(
+    db_server: ModuleType,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     """Test storing tool results with 'results' field in response."""
-    import importlib
-
-    db_server = importlib.import_module("sotaforge.agents.db_server")
-
     stored_data: dict[str, Any] = {}
 
     def fake_upsert(collection: str, docs: list[Any]) -> list[str]:
@@ -244,15 +210,11 @@ async def test_store_tool_results_with_results_field(
     assert len(stored_data["docs"]) == 1
 
 
-@pytest.mark.asyncio
 async def test_store_tool_results_with_result_wrapper(
+    db_server: ModuleType,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     """Test storing tool results with orchestrator 'result' wrapper."""
-    import importlib
-
-    db_server = importlib.import_module("sotaforge.agents.db_server")
-
     stored_data: dict[str, Any] = {}
 
     def fake_upsert(collection: str, docs: list[Any]) -> list[str]:
@@ -276,15 +238,11 @@ async def test_store_tool_results_with_result_wrapper(
     assert len(stored_data["docs"]) == 1
 
 
-@pytest.mark.asyncio
 async def test_store_tool_results_with_list_directly(
+    db_server: ModuleType,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     """Test storing tool results when content is a direct list."""
-    import importlib
-
-    db_server = importlib.import_module("sotaforge.agents.db_server")
-
     stored_data: dict[str, Any] = {}
 
     def fake_upsert(collection: str, docs: list[Any]) -> list[str]:
@@ -311,15 +269,11 @@ async def test_store_tool_results_with_list_directly(
     assert len(stored_data["docs"]) == 2
 
 
-@pytest.mark.asyncio
 async def test_store_tool_results_with_single_dict(
+    db_server: ModuleType,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     """Test storing tool results when content is a single dict."""
-    import importlib
-
-    db_server = importlib.import_module("sotaforge.agents.db_server")
-
     stored_data: dict[str, Any] = {}
 
     def fake_upsert(collection: str, docs: list[Any]) -> list[str]:
@@ -343,15 +297,11 @@ async def test_store_tool_results_with_single_dict(
     assert len(stored_data["docs"]) == 1
 
 
-@pytest.mark.asyncio
 async def test_store_tool_results_no_matching_tool_call_id(
+    db_server: ModuleType,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     """Test store_tool_results when tool_call_id doesn't match any message."""
-    import importlib
-
-    db_server = importlib.import_module("sotaforge.agents.db_server")
-
     messages = [
         {
             "role": "tool",
@@ -367,15 +317,11 @@ async def test_store_tool_results_no_matching_tool_call_id(
     assert "message" in res
 
 
-@pytest.mark.asyncio
 async def test_store_tool_results_multiple_tool_calls(
+    db_server: ModuleType,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     """Test storing results from multiple tool calls."""
-    import importlib
-
-    db_server = importlib.import_module("sotaforge.agents.db_server")
-
     stored_data: dict[str, Any] = {}
 
     def fake_upsert(collection: str, docs: list[Any]) -> list[str]:
@@ -404,15 +350,11 @@ async def test_store_tool_results_multiple_tool_calls(
     assert len(stored_data["docs"]) == 2
 
 
-@pytest.mark.asyncio
 async def test_store_tool_results_filters_non_dict_items(
+    db_server: ModuleType,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     """Test that non-dict items in results are filtered out."""
-    import importlib
-
-    db_server = importlib.import_module("sotaforge.agents.db_server")
-
     stored_data: dict[str, Any] = {}
 
     def fake_upsert(collection: str, docs: list[Any]) -> list[str]:
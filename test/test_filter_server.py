@@ -1,65 +1,60 @@
 """Tests for `filter_server`."""
 
-from types import SimpleNamespace
-from typing import Any
+from types import ModuleType, SimpleNamespace
+from typing import Callable
+from unittest.mock import AsyncMock
 
 import pytest
 
+from sotaforge.utils.models import ParsedDocument
 
-async def _fake_run_filter(prompt: str, good_title: str) -> SimpleNamespace:
-    if good_title in prompt:
-        out = SimpleNamespace(
-            criterion_1=5,
-            criterion_2=4,
-            criterion_3=4,
-            criterion_4=5,
-            criterion_5=4,
-        )
-    else:
-        out = SimpleNamespace(
-            criterion_1=1,
-            criterion_2=1,
-            criterion_3=1,
-            criterion_4=1,
-            criterion_5=1,
-        )
-    return SimpleNamespace(output=out)
 
+def make_score_agent(score_fn: Callable[[str], tuple[int, ...]]) -> AsyncMock:
+    """Return an agent double whose run() scores each prompt with score_fn."""
+    # One result object per distinct score tuple; the server only reads it
+    results: dict[tuple[int, ...], SimpleNamespace] = {}
 
-class FakeAgent:
-    """Fake agent for testing filter functionality."""
+    def run(prompt: str) -> SimpleNamespace:
+        scores = score_fn(prompt)
+        result = results.get(scores)
+        if result is None:
+            result = results[scores] = SimpleNamespace(
+                output=SimpleNamespace(
+                    **{f"criterion_{i}": score for i, score in enumerate(scores, 1)}
+                )
+            )
+        return result
 
-    def __init__(self, *args: Any, **kwargs: Any) -> None:
-        """Initialize fake agent."""
-        self._good_title = kwargs.get("good_title", "Doc1")
+    agent = AsyncMock()
+    agent.run = AsyncMock(side_effect=run)
+    return agent
 
-    async def run(self, prompt: str) -> SimpleNamespace:
-        """Run fake scoring."""
-        return await _fake_run_filter(prompt, self._good_title)
+
+def _prompts(agent: AsyncMock) -> list[str]:
+    """Return the prompts the agent double was run with."""
+    return [call.args[0] for call in agent.run.await_args_list]
 
 
-@pytest.mark.asyncio
 async def test_filter_results_keeps_and_filters(
+    filter_server: ModuleType,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     """Test that documents are correctly kept or filtered based on scores."""
-    import importlib
-
-    filter_server = importlib.import_module("sotaforge.agents.filter_server")
-
     docs = [
         {"title": "Doc1", "text": "Content about topic."},
         {"title": "Doc2", "text": "Other content."},
     ]
 
     monkeypatch.setattr(
-        filter_server, "db_store", SimpleNamespace(fetch_documents=lambda c: docs)
+        filter_server,
+        "db_store",
+        SimpleNamespace(fetch_documents_async=AsyncMock(return_value=docs)),
     )
 
-    def make_agent(*args: Any, **kwargs: Any) -> FakeAgent:
-        return FakeAgent(*args, **{**kwargs, "good_title": "Doc1"})
-
-    monkeypatch.setattr(filter_server, "Agent", make_agent)
+    agent = make_score_agent(
+        lambda prompt: (5, 4, 4, 5, 4) if "Doc1" in prompt else (1, 1, 1, 1, 1)
+    )
+    monkeypatch.setattr(filter_server, "Agent", lambda *a, **k: agent)
 
     criteria = ["relevance", "novelty", "impact", "clarity", "timeliness"]
 
@@ -71,15 +66,14 @@ async def test_filter_results_keeps_and_filters(
     assert "Doc1" in titles and "Doc2" not in titles
 
 
-@pytest.mark.asyncio
-async def test_filter_results_no_documents(monkeypatch: pytest.MonkeyPatch) -> None:
+async def test_filter_results_no_documents(
+    filter_server: ModuleType, monkeypatch: pytest.MonkeyPatch
+) -> None:
     """Test filtering when collection is empty."""
-    import importlib
-
-    filter_server = importlib.import_module("sotaforge.agents.filter_server")
-
     monkeypatch.setattr(
-        filter_server, "db_store", SimpleNamespace(fetch_documents=lambda c: [])
+        filter_server,
+        "db_store",
+        SimpleNamespace(fetch_documents_async=AsyncMock(return_value=[])),
     )
 
     func = filter_server.filter_results.fn
@@ -92,15 +86,11 @@ async def test_filter_results_no_documents(monkeypatch: pytest.MonkeyPatch) -> N
     assert res["collection"] == "col"
 
 
-@pytest.mark.asyncio
 async def test_filter_results_all_documents_pass(
+    filter_server: ModuleType,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     """Test when all documents score high and pass the filter."""
-    import importlib
-
-    filter_server = importlib.import_module("sotaforge.agents.filter_server")
-
     docs = [
         {"title": "Doc1", "text": "Content"},
         {"title": "Doc2", "text": "Content"},
@@ -108,25 +98,13 @@ async def test_filter_results_all_documents_pass(
     ]
 
     monkeypatch.setattr(
-        filter_server, "db_store", SimpleNamespace(fetch_documents=lambda c: docs)
+        filter_server,
+        "db_store",
+        SimpleNamespace(fetch_documents_async=AsyncMock(return_value=docs)),
     )
 
-    class HighScoreAgent:
-        def __init__(self, *args: Any, **kwargs: Any) -> None:
-            pass
-
-        async def run(self, prompt: str) -> SimpleNamespace:
-            return SimpleNamespace(
-                output=SimpleNamespace(
-                    criterion_1=5,
-                    criterion_2=5,
-                    criterion_3=5,
-                    criterion_4=5,
-                    criterion_5=5,
-                )
-            )
-
-    monkeypatch.setattr(filter_server, "Agent", lambda *a, **k: HighScoreAgent())
+    agent = make_score_agent(lambda prompt: (5, 5, 5, 5, 5))
+    monkeypatch.setattr(filter_server, "Agent", lambda *a, **k: agent)
 
     criteria = ["relevance", "novelty", "impact", "clarity", "timeliness"]
 
@@ -142,40 +120,24 @@ async def test_filter_results_all_documents_pass(
         assert scored_doc["keep"] is True
 
 
-@pytest.mark.asyncio
 async def test_filter_results_all_documents_fail(
+    filter_server: ModuleType,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     """Test when all documents score low and fail the filter."""
-    import importlib
-
-    filter_server = importlib.import_module("sotaforge.agents.filter_server")
-
     docs = [
         {"title": "Doc1", "text": "Content"},
         {"title": "Doc2", "text": "Content"},
     ]
 
     monkeypatch.setattr(
-        filter_server, "db_store", SimpleNamespace(fetch_documents=lambda c: docs)
+        filter_server,
+        "db_store",
+        SimpleNamespace(fetch_documents_async=AsyncMock(return_value=docs)),
     )
 
-    class LowScoreAgent:
-        def __init__(self, *args: Any, **kwargs: Any) -> None:
-            pass
-
-        async def run(self, prompt: str) -> SimpleNamespace:
-            return SimpleNamespace(
-                output=SimpleNamespace(
-                    criterion_1=1,
-                    criterion_2=1,
-                    criterion_3=1,
-                    criterion_4=1,
-                    criterion_5=1,
-                )
-            )
-
-    monkeypatch.setattr(filter_server, "Agent", lambda *a, **k: LowScoreAgent())
+    agent = make_score_agent(lambda prompt: (1, 1, 1, 1, 1))
+    monkeypatch.setattr(filter_server, "Agent", lambda *a, **k: agent)
 
     criteria = ["relevance", "novelty", "impact", "clarity", "timeliness"]
 
@@ -191,38 +153,23 @@ async def test_filter_results_all_documents_fail(
         assert scored_doc["keep"] is False
 
 
-@pytest.mark.asyncio
-async def test_filter_results_boundary_score(monkeypatch: pytest.MonkeyPatch) -> None:
+async def test_filter_results_boundary_score(
+    filter_server: ModuleType, monkeypatch: pytest.MonkeyPatch
+) -> None:
     """Test filtering with score exactly at threshold (mean = 2)."""
-    import importlib
-
-    filter_server = importlib.import_module("sotaforge.agents.filter_server")
-
     docs = [
         {"title": "Doc1", "text": "Content"},
     ]
 
     monkeypatch.setattr(
-        filter_server, "db_store", SimpleNamespace(fetch_documents=lambda c: docs)
+        filter_server,
+        "db_store",
+        SimpleNamespace(fetch_documents_async=AsyncMock(return_value=docs)),
     )
 
-    class BoundaryScoreAgent:
-        def __init__(self, *args: Any, **kwargs: Any) -> None:
-            pass
-
-        async def run(self, prompt: str) -> SimpleNamespace:
-            # Mean of 2.0 exactly
-            return SimpleNamespace(
-                output=SimpleNamespace(
-                    criterion_1=2,
-                    criterion_2=2,
-                    criterion_3=2,
-                    criterion_4=2,
-                    criterion_5=2,
-                )
-            )
-
-    monkeypatch.setattr(filter_server, "Agent", lambda *a, **k: BoundaryScoreAgent())
+    # Mean of 2.0 exactly
+    agent = make_score_agent(lambda prompt: (2, 2, 2, 2, 2))
+    monkeypatch.setattr(filter_server, "Agent", lambda *a, **k: agent)
 
     criteria = ["relevance", "novelty", "impact", "clarity", "timeliness"]
 
@@ -235,13 +182,10 @@ async def test_filter_results_boundary_score(monkeypatch: pytest.MonkeyPatch) ->
     assert res["scored_documents"][0]["keep"] is False
 
 
-@pytest.mark.asyncio
-async def test_filter_results_mixed_scores(monkeypatch: pytest.MonkeyPatch) -> None:
+async def test_filter_results_mixed_scores(
+    filter_server: ModuleType, monkeypatch: pytest.MonkeyPatch
+) -> None:
     """Test filtering with documents having different scores."""
-    import importlib
-
-    filter_server = importlib.import_module("sotaforge.agents.filter_server")
-
     docs = [
         {"title": "High", "text": "Content"},
         {"title": "Medium", "text": "Content"},
@@ -249,32 +193,20 @@ async def test_filter_results_mixed_scores(monkeypatch: pytest.MonkeyPatch) -> N
     ]
 
     monkeypatch.setattr(
-        filter_server, "db_store", SimpleNamespace(fetch_documents=lambda c: docs)
+        filter_server,
+        "db_store",
+        SimpleNamespace(fetch_documents_async=AsyncMock(return_value=docs)),
     )
 
-    class VariableScoreAgent:
-        def __init__(self, *args: Any, **kwargs: Any) -> None:
-            self.call_count = 0
-
-        async def run(self, prompt: str) -> SimpleNamespace:
-            self.call_count += 1
-            if "High" in prompt:
-                scores = (4, 5, 4, 5, 4)  # mean = 4.4
-            elif "Medium" in prompt:
-                scores = (3, 3, 2, 3, 2)  # mean = 2.6
-            else:
-                scores = (1, 2, 1, 2, 1)  # mean = 1.4
-            return SimpleNamespace(
-                output=SimpleNamespace(
-                    criterion_1=scores[0],
-                    criterion_2=scores[1],
-                    criterion_3=scores[2],
-                    criterion_4=scores[3],
-                    criterion_5=scores[4],
-                )
-            )
+    def score(prompt: str) -> tuple[int, ...]:
+        if "High" in prompt:
+            return (4, 5, 4, 5, 4)  # mean = 4.4
+        if "Medium" in prompt:
+            return (3, 3, 2, 3, 2)  # mean = 2.6
+        return (1, 2, 1, 2, 1)  # mean = 1.4
 
-    monkeypatch.setattr(filter_server, "Agent", lambda *a, **k: VariableScoreAgent())
+    agent = make_score_agent(score)
+    monkeypatch.setattr(filter_server, "Agent", lambda *a, **k: agent)
 
     criteria = ["relevance", "novelty", "impact", "clarity", "timeliness"]
 
@@ -289,44 +221,33 @@ async def test_filter_results_mixed_scores(monkeypatch: pytest.MonkeyPatch) -> N
     assert "Low" not in result_titles
 
 
-@pytest.mark.asyncio
 async def test_filter_results_handles_scoring_exception(
+    filter_server: ModuleType,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     """Test that scoring exceptions are handled gracefully."""
-    import importlib
-
-    filter_server = importlib.import_module("sotaforge.agents.filter_server")
-
     docs = [
         {"title": "Doc1", "text": "Content"},
         {"title": "Doc2", "text": "Content"},
     ]
 
     monkeypatch.setattr(
-        filter_server, "db_store", SimpleNamespace(fetch_documents=lambda c: docs)
+        filter_server,
+        "db_store",
+        SimpleNamespace(fetch_documents_async=AsyncMock(return_value=docs)),
     )
 
-    class ErrorAgent:
-        def __init__(self, *args: Any, **kwargs: Any) -> None:
-            self.call_count = 0
+    attempts: list[str] = []
 
-        async def run(self, prompt: str) -> SimpleNamespace:
-            self.call_count += 1
-            if self.call_count == 1:
-                raise Exception("Scoring failed")
-            # Second call succeeds
-            return SimpleNamespace(
-                output=SimpleNamespace(
-                    criterion_1=4,
-                    criterion_2=4,
-                    criterion_3=4,
-                    criterion_4=4,
-                    criterion_5=4,
-                )
-            )
+    def fail_first(prompt: str) -> tuple[int, ...]:
+        attempts.append(prompt)
+        if len(attempts) == 1:
+            raise Exception("Scoring failed")
+        # Second call succeeds
+        return (4, 4, 4, 4, 4)
 
-    monkeypatch.setattr(filter_server, "Agent", lambda *a, **k: ErrorAgent())
+    agent = make_score_agent(fail_first)
+    monkeypatch.setattr(filter_server, "Agent", lambda *a, **k: agent)
 
     criteria = ["relevance", "novelty", "impact", "clarity", "timeliness"]
 
@@ -338,132 +259,79 @@ async def test_filter_results_handles_scoring_exception(
     assert len(res["scored_documents"]) == 1
 
 
-@pytest.mark.asyncio
 async def test_filter_results_uses_snippet_field(
+    filter_server: ModuleType,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     """Test that filter uses snippet when available."""
-    import importlib
-
-    filter_server = importlib.import_module("sotaforge.agents.filter_server")
-
     docs = [
         {"title": "Doc1", "snippet": "Important snippet content"},
     ]
 
     monkeypatch.setattr(
-        filter_server, "db_store", SimpleNamespace(fetch_documents=lambda c: docs)
+        filter_server,
+        "db_store",
+        SimpleNamespace(fetch_documents_async=AsyncMock(return_value=docs)),
     )
 
-    prompts_received = []
-
-    class TrackingAgent:
-        def __init__(self, *args: Any, **kwargs: Any) -> None:
-            pass
-
-        async def run(self, prompt: str) -> SimpleNamespace:
-            prompts_received.append(prompt)
-            return SimpleNamespace(
-                output=SimpleNamespace(
-                    criterion_1=3,
-                    criterion_2=3,
-                    criterion_3=3,
-                    criterion_4=3,
-                    criterion_5=3,
-                )
-            )
-
-    monkeypatch.setattr(filter_server, "Agent", lambda *a, **k: TrackingAgent())
+    agent = make_score_agent(lambda prompt: (3, 3, 3, 3, 3))
+    monkeypatch.setattr(filter_server, "Agent", lambda *a, **k: agent)
 
     criteria = ["relevance", "novelty", "impact", "clarity", "timeliness"]
 
     func = filter_server.filter_results.fn
     await func("query", "collection", criteria)
 
+    prompts_received = _prompts(agent)
     assert len(prompts_received) == 1
     assert "Important snippet content" in prompts_received[0]
 
 
-@pytest.mark.asyncio
 async def test_filter_results_uses_abstract_field(
+    filter_server: ModuleType,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     """Test that filter uses abstract when snippet is not available."""
-    import importlib
-
-    filter_server = importlib.import_module("sotaforge.agents.filter_server")
-
     docs = [
         {"title": "Doc1", "abstract": "Important abstract content"},
     ]
 
     monkeypatch.setattr(
-        filter_server, "db_store", SimpleNamespace(fetch_documents=lambda c: docs)
+        filter_server,
+        "db_store",
+        SimpleNamespace(fetch_documents_async=AsyncMock(return_value=docs)),
     )
 
-    prompts_received = []
-
-    class TrackingAgent:
-        def __init__(self, *args: Any, **kwargs: Any) -> None:
-            pass
-
-        async def run(self, prompt: str) -> SimpleNamespace:
-            prompts_received.append(prompt)
-            return SimpleNamespace(
-                output=SimpleNamespace(
-                    criterion_1=3,
-                    criterion_2=3,
-                    criterion_3=3,
-                    criterion_4=3,
-                    criterion_5=3,
-                )
-            )
-
-    monkeypatch.setattr(filter_server, "Agent", lambda *a, **k: TrackingAgent())
+    agent = make_score_agent(lambda prompt: (3, 3, 3, 3, 3))
+    monkeypatch.setattr(filter_server, "Agent", lambda *a, **k: agent)
 
     criteria = ["relevance", "novelty", "impact", "clarity", "timeliness"]
 
     func = filter_server.filter_results.fn
     await func("query", "collection", criteria)
 
+    prompts_received = _prompts(agent)
     assert len(prompts_received) == 1
     assert "Important abstract content" in prompts_received[0]
 
 
-@pytest.mark.asyncio
 async def test_filter_results_handles_parsed_document_objects(
+    filter_server: ModuleType,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     """Test that filter works with ParsedDocument objects, not just dicts."""
-    import importlib
-
-    filter_server = importlib.import_module("sotaforge.agents.filter_server")
-    from sotaforge.utils.models import ParsedDocument
-
     docs = [
         ParsedDocument(title="Doc1", text="Content"),
     ]
 
     monkeypatch.setattr(
-        filter_server, "db_store", SimpleNamespace(fetch_documents=lambda c: docs)
+        filter_server,
+        "db_store",
+        SimpleNamespace(fetch_documents_async=AsyncMock(return_value=docs)),
     )
 
-    class SimpleAgent:
-        def __init__(self, *args: Any, **kwargs: Any) -> None:
-            pass
-
-        async def run(self, prompt: str) -> SimpleNamespace:
-            return SimpleNamespace(
-                output=SimpleNamespace(
-                    criterion_1=4,
-                    criterion_2=4,
-                    criterion_3=4,
-                    criterion_4=4,
-                    criterion_5=4,
-                )
-            )
-
-    monkeypatch.setattr(filter_server, "Agent", lambda *a, **k: SimpleAgent())
+    agent = make_score_agent(lambda prompt: (4, 4, 4, 4, 4))
+    monkeypatch.setattr(filter_server, "Agent", lambda *a, **k: agent)
 
     criteria = ["relevance", "novelty", "impact", "clarity", "timeliness"]
 
@@ -474,49 +342,31 @@ async def test_filter_results_handles_parsed_document_objects(
     assert res["results"][0]["title"] == "Doc1"
 
 
-@pytest.mark.asyncio
 async def test_filter_results_truncates_long_excerpts(
+    filter_server: ModuleType,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     """Test that long excerpts are truncated in prompts."""
-    import importlib
-
-    filter_server = importlib.import_module("sotaforge.agents.filter_server")
-
     long_text = "x" * 1000
     docs = [
         {"title": "Doc1", "text": long_text},
     ]
 
     monkeypatch.setattr(
-        filter_server, "db_store", SimpleNamespace(fetch_documents=lambda c: docs)
+        filter_server,
+        "db_store",
+        SimpleNamespace(fetch_documents_async=AsyncMock(return_value=docs)),
     )
 
-    prompts_received = []
-
-    class TrackingAgent:
-        def __init__(self, *args: Any, **kwargs: Any) -> None:
-            pass
-
-        async def run(self, prompt: str) -> SimpleNamespace:
-            prompts_received.append(prompt)
-            return SimpleNamespace(
-                output=SimpleNamespace(
-                    criterion_1=3,
-                    criterion_2=3,
-                    criterion_3=3,
-                    criterion_4=3,
-                    criterion_5=3,
-                )
-            )
-
-    monkeypatch.setattr(filter_server, "Agent", lambda *a, **k: TrackingAgent())
+    agent = make_score_agent(lambda prompt: (3, 3, 3, 3, 3))
+    monkeypatch.setattr(filter_server, "Agent", lambda *a, **k: agent)
 
     criteria = ["relevance", "novelty", "impact", "clarity", "timeliness"]
 
     func = filter_server.filter_results.fn
     await func("query", "collection", criteria)
 
+    prompts_received = _prompts(agent)
     assert len(prompts_received) == 1
     # Should be truncated to 600 characters
     assert long_text[:600] in prompts_received[0]
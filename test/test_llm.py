@@ -15,20 +15,18 @@ def test_get_llm_raises_when_no_key(monkeypatch: pytest.MonkeyPatch) -> None:
         llm.get_llm()
 
 
-def test_get_llm_returns_client_when_key_set(monkeypatch: pytest.MonkeyPatch) -> None:
+def test_get_llm_returns_client_when_key_set(
+    monkeypatch: pytest.MonkeyPatch, dummy_client_cls: type[Any]
+) -> None:
     """Test that get_llm returns client when API key is set."""
     monkeypatch.setenv("OPENAI_API_KEY", "test-key")
-
-    class DummyClient:
-        def __init__(self, api_key: str | None = None) -> None:
-            self.api_key = api_key
-
-    monkeypatch.setattr(llm, "AsyncOpenAI", DummyClient)
+    monkeypatch.setattr(llm, "AsyncOpenAI", dummy_client_cls)
     llm.reset_llm()
 
     client = llm.get_llm()
-    assert isinstance(client, DummyClient)
+    assert isinstance(client, dummy_client_cls)
     assert client.api_key == "test-key"
+    assert client.http_client is not None
 
     # Ensure cached instance is returned
     client2 = llm.get_llm()
@@ -36,17 +34,13 @@ def test_get_llm_returns_client_when_key_set(monkeypatch: pytest.MonkeyPatch) ->
 
 
 def test_get_pydantic_model_uses_provider_and_model(
-    monkeypatch: pytest.MonkeyPatch,
+    monkeypatch: pytest.MonkeyPatch, dummy_client_cls: type[Any]
 ) -> None:
     """Test that get_pydantic_model uses the configured provider and model."""
     monkeypatch.setenv("OPENAI_API_KEY", "test-key")
 
-    class DummyClient:
-        def __init__(self, api_key: str | None = None, **kwargs: Any) -> None:
-            self.api_key = api_key
-
     # Patch the AsyncOpenAI class so the cached `get_llm` creates a DummyClient
-    monkeypatch.setattr(llm, "AsyncOpenAI", DummyClient)
+    monkeypatch.setattr(llm, "AsyncOpenAI", dummy_client_cls)
 
     captured = {}
 
@@ -16,7 +16,6 @@ def test_generate_pdf_starts_with_pdf() -> None:
     assert pdf[:4] == b"%PDF"
 
 
-@pytest.mark.asyncio
 async def test_send_email_skips_when_no_api_key(
     monkeypatch: pytest.MonkeyPatch, caplog: Any
 ) -> None:
@@ -30,7 +29,6 @@ async def test_send_email_skips_when_no_api_key(
     assert "RESEND_API_KEY not configured" in caplog.text
 
 
-@pytest.mark.asyncio
 async def test_send_email_calls_resend_when_api_key_set(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
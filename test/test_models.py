@@ -1,6 +1,7 @@
 """Unit tests for models.py data classes."""
 
-from typing import Any, Dict
+from dataclasses import fields
+from typing import Any, Mapping
 
 from sotaforge.utils.models import (
     Document,
@@ -152,7 +153,7 @@ class TestParsedDocument:
         assert doc.insights == ["Insight 1", "Insight 2"]
 
     def test_parsed_document_from_dict(
-        self, sample_parsed_document: Dict[str, Any]
+        self, sample_parsed_document: Mapping[str, Any]
     ) -> None:
         """Test creating ParsedDocument from dictionary."""
         doc = ParsedDocument.from_dict(sample_parsed_document)
@@ -162,6 +163,37 @@ class TestParsedDocument:
         assert doc.themes == ["AI", "Machine Learning"]
         assert doc.insights == ["Novel approach to training", "Better performance"]
 
+    def test_parsed_document_to_dict(self) -> None:
+        """Test that to_dict covers all fields and does not alias containers."""
+        doc = ParsedDocument(
+            title="Test", text="Body", themes=["AI"], metadata={"k": "v"}
+        )
+
+        doc_dict = doc.to_dict()
+        doc_dict["themes"].append("ML")
+        doc_dict["metadata"]["k"] = "changed"
+
+        assert set(doc_dict) == {f.name for f in fields(ParsedDocument)}
+        assert doc_dict["text"] == "Body"
+        assert doc.themes == ["AI"]
+        assert doc.metadata == {"k": "v"}
+
+    def test_parsed_document_has_no_instance_dict(self) -> None:
+        """Test that documents are slotted to keep per-instance memory low."""
+        doc = ParsedDocument(title="Test")
+
+        assert not hasattr(doc, "__dict__")
+
+    def test_parsed_document_from_dict_defaults_and_coercion(self) -> None:
+        """Test that from_dict fills defaults and normalizes field types."""
+        doc = ParsedDocument.from_dict(
+            {"title": "T", "year": "2024", "themes": ("AI",), "source_type": "bad"}
+        )
+
+        assert doc == ParsedDocument(
+            title="T", year=2024, themes=["AI"], source_type=SourceType.UNKNOWN
+        )
+
     def test_parsed_document_to_dict_with_text_limit(self) -> None:
         """Test converting to dict with text length limit."""
         long_text = "A" * 1000
@@ -183,7 +215,7 @@ class TestParsedDocument:
         assert "truncated" not in doc_dict["text"]
 
     def test_parsed_document_from_not_parsed(
-        self, sample_not_parsed_document: Dict[str, Any]
+        self, sample_not_parsed_document: Mapping[str, Any]
     ) -> None:
         """Test creating ParsedDocument from NotParsedDocument."""
         not_parsed = NotParsedDocument.from_dict(sample_not_parsed_document)
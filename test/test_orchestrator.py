@@ -7,7 +7,6 @@ from typing import Any
 import pytest
 
 
-@pytest.mark.asyncio
 async def test_emit_progress(monkeypatch: pytest.MonkeyPatch) -> None:
     """Test that emit_progress correctly pushes to the queue."""
     import importlib
@@ -32,7 +31,6 @@ async def test_emit_progress(monkeypatch: pytest.MonkeyPatch) -> None:
     orchestrator.progress_queue = None  # type: ignore[attr-defined]
 
 
-@pytest.mark.asyncio
 async def test_emit_progress_no_queue() -> None:
     """Test that emit_progress handles missing queue gracefully."""
     import importlib
@@ -46,7 +44,6 @@ async def test_emit_progress_no_queue() -> None:
     await orchestrator.emit_progress("test", "message", "step")
 
 
-@pytest.mark.asyncio
 async def test_normalize_tool_result_with_sdk_result() -> None:
     """Test normalizing SDK-style tool results."""
     import importlib
@@ -60,7 +57,6 @@ async def test_normalize_tool_result_with_sdk_result() -> None:
     assert normalized == {"key": "value"}
 
 
-@pytest.mark.asyncio
 async def test_normalize_tool_result_with_dict() -> None:
     """Test normalizing dict results."""
     import importlib
@@ -72,7 +68,6 @@ async def test_normalize_tool_result_with_dict() -> None:
     assert normalized == {"key": "value"}
 
 
-@pytest.mark.asyncio
 async def test_normalize_tool_result_with_json_string() -> None:
     """Test normalizing JSON string results."""
     import importlib
@@ -84,7 +79,6 @@ async def test_normalize_tool_result_with_json_string() -> None:
     assert normalized == {"key": "value"}
 
 
-@pytest.mark.asyncio
 async def test_normalize_tool_result_with_plain_string() -> None:
     """Test normalizing plain string results."""
     import importlib
@@ -96,7 +90,6 @@ async def test_normalize_tool_result_with_plain_string() -> None:
     assert normalized == "plain text"
 
 
-@pytest.mark.asyncio
 async def test_trim_message_history_under_limit() -> None:
     """Test that message history under limit is not trimmed."""
     import importlib
@@ -111,7 +104,6 @@ async def test_trim_message_history_under_limit() -> None:
     assert trimmed == messages
 
 
-@pytest.mark.asyncio
 async def test_trim_message_history_over_limit() -> None:
     """Test that message history over limit is trimmed."""
     import importlib
@@ -126,7 +118,6 @@ async def test_trim_message_history_over_limit() -> None:
     assert trimmed == messages[-10:]
 
 
-@pytest.mark.asyncio
 async def test_trim_message_history_preserves_tool_pairs() -> None:
     """Test that trimming preserves tool_call/tool pairs."""
     import importlib
@@ -147,7 +138,6 @@ async def test_trim_message_history_preserves_tool_pairs() -> None:
     assert any(msg.get("role") == "tool" for msg in trimmed)
 
 
-@pytest.mark.asyncio
 async def test_get_last_messages() -> None:
     """Test getting last N messages."""
     import importlib
@@ -162,7 +152,6 @@ async def test_get_last_messages() -> None:
     assert last_5 == messages[-5:]
 
 
-@pytest.mark.asyncio
 async def test_get_last_messages_less_than_n() -> None:
     """Test getting last messages when fewer than N exist."""
     import importlib
@@ -177,7 +166,6 @@ async def test_get_last_messages_less_than_n() -> None:
     assert last_5 == messages
 
 
-@pytest.mark.asyncio
 async def test_extract_synthesized_sota_text_found() -> None:
     """Test extracting SOTA text from messages."""
     import importlib
@@ -207,7 +195,6 @@ async def test_extract_synthesized_sota_text_found() -> None:
     assert sota_text == "This is the SOTA summary"
 
 
-@pytest.mark.asyncio
 async def test_extract_synthesized_sota_text_not_found() -> None:
     """Test extracting SOTA text when not present."""
     import importlib
@@ -224,7 +211,6 @@ async def test_extract_synthesized_sota_text_not_found() -> None:
     assert sota_text == ""
 
 
-@pytest.mark.asyncio
 async def test_extract_synthesized_sota_text_unprefixed_tool() -> None:
     """Test extracting SOTA text with unprefixed tool name."""
     import importlib
@@ -247,7 +233,6 @@ async def test_extract_synthesized_sota_text_unprefixed_tool() -> None:
     assert sota_text == "SOTA content"
 
 
-@pytest.mark.asyncio
 async def test_extract_synthesized_sota_text_alternative_key() -> None:
     """Test extracting SOTA text with 'sota' key instead of 'text'."""
     import importlib
@@ -273,7 +258,6 @@ async def test_extract_synthesized_sota_text_alternative_key() -> None:
     assert sota_text == "SOTA via sota key"
 
 
-@pytest.mark.asyncio
 async def test_execute_tool_calls_no_calls() -> None:
     """Test execute_tool_calls with no tool calls."""
     import importlib
@@ -291,13 +275,10 @@ async def test_execute_tool_calls_no_calls() -> None:
     assert result == messages
 
 
-@pytest.mark.asyncio
 async def test_validate_step_approved(monkeypatch: pytest.MonkeyPatch) -> None:
     """Test that validation step returns approved response."""
     from sotaforge.utils import llm
 
-    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
-
     class DummyClient:
         def __init__(self, api_key: str | None = None, **kwargs: Any) -> None:
             self.api_key = api_key
@@ -338,13 +319,10 @@ async def test_validate_step_approved(monkeypatch: pytest.MonkeyPatch) -> None:
     assert updated_messages is messages  # Same list reference
 
 
-@pytest.mark.asyncio
 async def test_validate_step_rejected(monkeypatch: pytest.MonkeyPatch) -> None:
     """Test that validation step returns rejected response."""
     from sotaforge.utils import llm
 
-    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
-
     class DummyClient:
         def __init__(self, api_key: str | None = None, **kwargs: Any) -> None:
             self.api_key = api_key
@@ -385,13 +363,10 @@ async def test_validate_step_rejected(monkeypatch: pytest.MonkeyPatch) -> None:
     assert updated_messages is messages  # Same list reference
 
 
-@pytest.mark.asyncio
 async def test_validate_step_case_insensitive(monkeypatch: pytest.MonkeyPatch) -> None:
     """Test that validation is case-insensitive."""
     from sotaforge.utils import llm
 
-    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
-
     class DummyClient:
         def __init__(self, api_key: str | None = None, **kwargs: Any) -> None:
             self.api_key = api_key
@@ -427,7 +402,6 @@ async def test_validate_step_case_insensitive(monkeypatch: pytest.MonkeyPatch) -
     assert approved is True
 
 
-@pytest.mark.asyncio
 async def test_emit_tool_progress_search_web(monkeypatch: pytest.MonkeyPatch) -> None:
     """Test progress emission for search_web tool."""
     import importlib
@@ -446,7 +420,6 @@ async def test_emit_tool_progress_search_web(monkeypatch: pytest.MonkeyPatch) ->
     orchestrator.progress_queue = None  # type: ignore[attr-defined]
 
 
-@pytest.mark.asyncio
 async def test_emit_tool_progress_search_papers(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -469,7 +442,6 @@ async def test_emit_tool_progress_search_papers(
     orchestrator.progress_queue = None  # type: ignore[attr-defined]
 
 
-@pytest.mark.asyncio
 async def test_emit_tool_progress_no_queue() -> None:
     """Test that emit_tool_progress handles missing queue gracefully."""
     import importlib
@@ -4,6 +4,8 @@ from typing import Any
 
 import pytest
 
+from sotaforge.utils.models import NotParsedDocument, ParsedDocument, SourceType
+
 
 class FakeChromaStore:
     """Fake ChromaStore for testing parser functionality."""
@@ -12,19 +14,19 @@ class FakeChromaStore:
         """Initialize fake store with documents."""
         self._documents = documents or []
 
-    def fetch_documents(self, collection: str) -> list[Any]:
+    async def fetch_documents_async(self, collection: str) -> list[Any]:
         """Return stored documents."""
         return self._documents
 
-    def upsert_documents(self, collection: str, documents: list[Any]) -> None:
+    async def upsert_documents_async(
+        self, collection: str, documents: list[Any]
+    ) -> None:
         """Store documents (no-op for testing)."""
         pass
 
 
 async def fake_parse_paper_result(not_parsed: Any) -> Any:
     """Fake parser for paper documents."""
-    from sotaforge.utils.models import ParsedDocument
-
     return ParsedDocument.from_not_parsed(
         not_parsed,
         text=f"Parsed text for {not_parsed.title}",
@@ -35,8 +37,6 @@ async def fake_parse_paper_result(not_parsed: Any) -> Any:
 
 async def fake_parse_web_result(not_parsed: Any) -> Any:
     """Fake parser for web documents."""
-    from sotaforge.utils.models import ParsedDocument
-
     return ParsedDocument.from_not_parsed(
         not_parsed,
         text=f"Parsed web content for {not_parsed.title}",
@@ -45,7 +45,6 @@ async def fake_parse_web_result(not_parsed: Any) -> Any:
     )
 
 
-@pytest.mark.asyncio
 async def test_parse_documents_empty_collection(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -66,13 +65,10 @@ async def test_parse_documents_empty_collection(
     assert result["parsed_documents"] == []
 
 
-@pytest.mark.asyncio
 async def test_parse_documents_paper_documents(monkeypatch: pytest.MonkeyPatch) -> None:
     """Test parsing paper documents."""
     import importlib
 
-    from sotaforge.utils.models import NotParsedDocument, SourceType
-
     parser_server = importlib.import_module("sotaforge.agents.parser_server")
 
     # Create sample paper documents
@@ -109,13 +105,10 @@ async def test_parse_documents_paper_documents(monkeypatch: pytest.MonkeyPatch)
     assert all("text" in doc for doc in result["results"])
 
 
-@pytest.mark.asyncio
 async def test_parse_documents_web_documents(monkeypatch: pytest.MonkeyPatch) -> None:
     """Test parsing web documents."""
     import importlib
 
-    from sotaforge.utils.models import NotParsedDocument, SourceType
-
     parser_server = importlib.import_module("sotaforge.agents.parser_server")
 
     # Create sample web documents
@@ -147,13 +140,10 @@ async def test_parse_documents_web_documents(monkeypatch: pytest.MonkeyPatch) ->
     assert len(result["results"]) == 2
 
 
-@pytest.mark.asyncio
 async def test_parse_documents_mixed_types(monkeypatch: pytest.MonkeyPatch) -> None:
     """Test parsing mixed document types (papers and web)."""
     import importlib
 
-    from sotaforge.utils.models import NotParsedDocument, SourceType
-
     parser_server = importlib.import_module("sotaforge.agents.parser_server")
 
     # Create mixed documents
@@ -184,7 +174,6 @@ async def test_parse_documents_mixed_types(monkeypatch: pytest.MonkeyPatch) -> N
     assert len(result["results"]) == 2
 
 
-@pytest.mark.asyncio
 async def test_parse_documents_with_dict_input(monkeypatch: pytest.MonkeyPatch) -> None:
     """Test parsing when documents are dicts instead of NotParsedDocument objects."""
     import importlib
@@ -215,15 +204,12 @@ async def test_parse_documents_with_dict_input(monkeypatch: pytest.MonkeyPatch)
     assert len(result["results"]) == 1
 
 
-@pytest.mark.asyncio
 async def test_parse_documents_handles_parsing_errors(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     """Test that parsing errors are handled gracefully."""
     import importlib
 
-    from sotaforge.utils.models import NotParsedDocument, SourceType
-
     parser_server = importlib.import_module("sotaforge.agents.parser_server")
 
     async def failing_parser(not_parsed: Any) -> None:
@@ -252,13 +238,10 @@ async def test_parse_documents_handles_parsing_errors(
     assert "Failed to parse content" in result["results"][0]["text"]
 
 
-@pytest.mark.asyncio
 async def test_parse_documents_already_parsed(monkeypatch: pytest.MonkeyPatch) -> None:
     """Test that already-parsed documents are returned as-is."""
     import importlib
 
-    from sotaforge.utils.models import NotParsedDocument, ParsedDocument, SourceType
-
     parser_server = importlib.import_module("sotaforge.agents.parser_server")
 
     # Create a parsed document
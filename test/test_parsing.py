@@ -1,15 +1,25 @@
 """Tests for parsing module."""
 
+import asyncio
 import base64
+import mmap
 import tempfile
 from pathlib import Path
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
+import fitz
+import httpx
+import lxml.html
+import orjson
 import pytest
-import requests
 
+from sotaforge.utils import parsing
 from sotaforge.utils.models import NotParsedDocument, ParsedDocument
 from sotaforge.utils.parsing import (
+    _get_http_client,
+    close_http_client,
+    parse_pages_with_vlm,
     parse_paper_result,
     parse_pdf_with_vlm,
     parse_single_page_with_vlm,
@@ -17,10 +27,145 @@ from sotaforge.utils.parsing import (
 )
 
 
+@pytest.fixture(autouse=True)
+def clear_parse_cache() -> None:
+    """Start every test with an empty parse cache."""
+    parsing._parse_cache.clear()
+
+
+def mock_http_get(**kwargs: Any) -> Any:
+    """Patch the shared HTTP client so ``get`` is an AsyncMock with kwargs."""
+    client = MagicMock()
+    client.get = AsyncMock(**kwargs)
+    return patch("sotaforge.utils.parsing._get_http_client", return_value=client)
+
+
+def mock_pdf_download(**kwargs: Any) -> Any:
+    """Patch the PDF download helper with an AsyncMock built from kwargs."""
+    return patch("sotaforge.utils.parsing._fetch_pdf", new=AsyncMock(**kwargs))
+
+
+def mock_arxiv_html(**kwargs: Any) -> Any:
+    """Patch the arXiv HTML-version lookup with an AsyncMock built from kwargs."""
+    return patch(
+        "sotaforge.utils.parsing._fetch_arxiv_html_text", new=AsyncMock(**kwargs)
+    )
+
+
+def mock_transport(handler: Any) -> Any:
+    """Patch the shared HTTP client with one served by an httpx handler."""
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return patch("sotaforge.utils.parsing._get_http_client", return_value=client)
+
+
+class TestHttpClient:
+    """Tests for the shared HTTP client."""
+
+    async def test_client_reused_until_closed(self) -> None:
+        """Test that fetches share one client and closing resets it."""
+        client = _get_http_client()
+        assert _get_http_client() is client
+
+        await close_http_client()
+
+        assert client.is_closed
+        new_client = _get_http_client()
+        assert new_client is not client
+        await close_http_client()
+
+    async def test_fetch_limits_concurrency_per_host(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that downloads from one host never exceed the per-host limit."""
+        monkeypatch.setattr(parsing, "MAX_CONCURRENT_REQUESTS_PER_HOST", 2)
+        in_flight = peak = 0
+
+        async def slow_get(url: str, timeout: float) -> str:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return url
+
+        client = MagicMock()
+        client.get = slow_get
+        with patch("sotaforge.utils.parsing._get_http_client", return_value=client):
+            await asyncio.gather(
+                *(parsing._fetch(f"https://arxiv.org/{i}", 1) for i in range(6))
+            )
+
+        assert peak == 2
+        assert parsing._host_semaphores == {}
+
+    async def test_busy_host_leaves_global_slots_to_other_hosts(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that downloads queued on one host don't block other hosts."""
+        monkeypatch.setattr(parsing, "_http_semaphore", asyncio.Semaphore(2))
+        monkeypatch.setattr(parsing, "MAX_CONCURRENT_REQUESTS_PER_HOST", 1)
+        release = asyncio.Event()
+
+        async def get(url: str, timeout: float) -> str:
+            if "arxiv.org" in url:
+                await release.wait()
+            return url
+
+        client = MagicMock()
+        client.get = get
+        with patch("sotaforge.utils.parsing._get_http_client", return_value=client):
+            busy = [
+                asyncio.create_task(parsing._fetch(f"https://arxiv.org/{i}", 1))
+                for i in range(4)
+            ]
+            await asyncio.sleep(0)
+
+            other = await asyncio.wait_for(
+                parsing._fetch("https://example.com/a", 1), timeout=1
+            )
+
+            release.set()
+            await asyncio.gather(*busy)
+
+        assert other == "https://example.com/a"
+
+    async def test_fetch_pdf_skips_non_pdf_body(self) -> None:
+        """Test that a non-PDF response is dropped without reading its body."""
+
+        async def body() -> Any:
+            raise AssertionError("body should not be read")
+            yield b""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(
+                200, headers={"content-type": "text/html"}, content=body()
+            )
+
+        with mock_transport(handler):
+            assert await parsing._fetch_pdf("https://example.com/page", 1) is None
+
+    async def test_fetch_pdf_caps_body_size(self) -> None:
+        """Test that PDFs are returned whole and oversized ones are aborted."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(
+                200, headers={"content-type": "application/pdf"}, content=b"%PDF-1"
+            )
+
+        with mock_transport(handler):
+            assert await parsing._fetch_pdf("https://example.com/a.pdf", 1) == (
+                b"%PDF-1"
+            )
+            with (
+                patch("sotaforge.utils.parsing.MAX_PDF_BYTES", 4),
+                pytest.raises(ValueError, match="exceeds 4 bytes"),
+            ):
+                await parsing._fetch_pdf("https://example.com/a.pdf", 1)
+
+
 class TestParseSinglePageWithVLM:
     """Tests for parse_single_page_with_vlm function."""
 
-    @pytest.mark.asyncio
     async def test_parse_single_page_success(self) -> None:
         """Test successful page parsing with VLM."""
         # Create a simple base64 image
@@ -34,16 +179,15 @@ class TestParseSinglePageWithVLM:
         with patch("sotaforge.utils.parsing.get_llm") as mock_get_llm:
             mock_llm = MagicMock()
             mock_get_llm.return_value = mock_llm
-            mock_llm.chat.completions.create = AsyncMock(return_value=mock_response)
+            mock_llm.post = AsyncMock(return_value=mock_response)
 
             result = await parse_single_page_with_vlm(
                 test_image, page_num=1, pdf_path="test.pdf"
             )
 
             assert result == "Extracted text from page"
-            mock_llm.chat.completions.create.assert_called_once()
+            mock_llm.post.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_parse_single_page_empty_response(self) -> None:
         """Test handling of empty VLM response."""
         test_image = base64.b64encode(b"fake_image_data").decode("utf-8")
@@ -55,13 +199,12 @@ class TestParseSinglePageWithVLM:
         with patch("sotaforge.utils.parsing.get_llm") as mock_get_llm:
             mock_llm = MagicMock()
             mock_get_llm.return_value = mock_llm
-            mock_llm.chat.completions.create = AsyncMock(return_value=mock_response)
+            mock_llm.post = AsyncMock(return_value=mock_response)
 
             result = await parse_single_page_with_vlm(test_image)
 
             assert result == ""
 
-    @pytest.mark.asyncio
     async def test_parse_single_page_strips_whitespace(self) -> None:
         """Test that extracted text is stripped of whitespace."""
         test_image = base64.b64encode(b"fake_image_data").decode("utf-8")
@@ -73,13 +216,43 @@ class TestParseSinglePageWithVLM:
         with patch("sotaforge.utils.parsing.get_llm") as mock_get_llm:
             mock_llm = MagicMock()
             mock_get_llm.return_value = mock_llm
-            mock_llm.chat.completions.create = AsyncMock(return_value=mock_response)
+            mock_llm.post = AsyncMock(return_value=mock_response)
 
             result = await parse_single_page_with_vlm(test_image)
 
             assert result == "Text with spaces"
 
 
+class TestParsePagesWithVLM:
+    """Tests for parse_pages_with_vlm function."""
+
+    async def test_parse_pages_sends_all_images_in_one_request(self) -> None:
+        """Test that every page image goes into a single VLM request."""
+        mock_response = MagicMock()
+        mock_response.choices = [MagicMock()]
+        mock_response.choices[0].message.content = "Text of both pages"
+
+        with patch("sotaforge.utils.parsing.get_llm") as mock_get_llm:
+            post = AsyncMock(return_value=mock_response)
+            mock_get_llm.return_value.post = post
+
+            result = await parse_pages_with_vlm([b"aW1nMQ==", b"aW1nMg=="])
+
+        assert result == "Text of both pages"
+        # The body is posted pre-serialized, with the images spliced in
+        payload = orjson.loads(post.call_args.kwargs["body"])
+        content = payload["messages"][0]["content"]
+        assert [part["type"] for part in content] == [
+            "text",
+            "image_url",
+            "image_url",
+        ]
+        assert [part["image_url"]["url"] for part in content[1:]] == [
+            "data:image/png;base64,aW1nMQ==",
+            "data:image/png;base64,aW1nMg==",
+        ]
+
+
 class TestParsePDFWithVLM:
     """Tests for parse_pdf_with_vlm function."""
 
@@ -91,13 +264,12 @@ class TestParsePDFWithVLM:
             tmp.write(b"%PDF-1.4\n%%EOF")
             return Path(tmp.name)
 
-    @pytest.mark.asyncio
     async def test_parse_pdf_with_mocked_fitz(self, mock_pdf_file: Path) -> None:
         """Test PDF parsing with mocked fitz library."""
         # Mock fitz.open
         mock_page = MagicMock()
         mock_pixmap = MagicMock()
-        mock_pixmap.pil_tobytes.return_value = b"fake_png_data"
+        mock_pixmap.tobytes.return_value = b"fake_png_data"
         mock_page.get_pixmap.return_value = mock_pixmap
 
         mock_document = MagicMock()
@@ -108,7 +280,7 @@ class TestParsePDFWithVLM:
         with (
             patch("sotaforge.utils.parsing.fitz.open", return_value=mock_document),
             patch(
-                "sotaforge.utils.parsing.parse_single_page_with_vlm",
+                "sotaforge.utils.parsing.parse_pages_with_vlm",
                 new=AsyncMock(return_value="Page text"),
             ),
         ):
@@ -120,11 +292,124 @@ class TestParsePDFWithVLM:
         # Cleanup
         mock_pdf_file.unlink(missing_ok=True)
 
+    async def test_parse_pdf_batches_pages_in_order(self, mock_pdf_file: Path) -> None:
+        """Test that pages are sent in batches and joined in page order."""
+        mock_document = MagicMock()
+        mock_document.__len__.return_value = 6
+        batches: list[tuple[int, str]] = []
+
+        async def fake_vlm(page_imgs: list[bytes], page_num: str, **kwargs: Any) -> str:
+            batches.append((len(page_imgs), page_num))
+            # the first batch finishes last
+            await asyncio.sleep(0.02 if page_num == "1-4" else 0)
+            return f"Pages {page_num}"
+
+        with (
+            patch("sotaforge.utils.parsing.fitz.open", return_value=mock_document),
+            patch("sotaforge.utils.parsing._render_page", return_value=b"img"),
+            patch("sotaforge.utils.parsing.parse_pages_with_vlm", new=fake_vlm),
+            patch("sotaforge.utils.parsing.PDF_PAGES_PER_VLM_REQUEST", 4),
+        ):
+            result = await parse_pdf_with_vlm(mock_pdf_file)
+
+        assert sorted(batches) == [(2, "5-6"), (4, "1-4")]
+        assert result == "Pages 1-4\n\nPages 5-6"
+        mock_document.close.assert_called_once()
+        mock_pdf_file.unlink(missing_ok=True)
+
+    async def test_parse_pdf_keeps_head_and_tail_of_long_pdf(
+        self, mock_pdf_file: Path
+    ) -> None:
+        """Test that long PDFs are read from both ends, never batching a gap."""
+        mock_document = MagicMock()
+        mock_document.__len__.return_value = 30
+        batches: list[str] = []
+
+        async def fake_vlm(page_imgs: list[bytes], page_num: str, **kwargs: Any) -> str:
+            batches.append(page_num)
+            return f"Pages {page_num}"
+
+        with (
+            patch("sotaforge.utils.parsing.fitz.open", return_value=mock_document),
+            patch("sotaforge.utils.parsing._render_page", return_value=b"img"),
+            patch("sotaforge.utils.parsing.parse_pages_with_vlm", new=fake_vlm),
+            patch("sotaforge.utils.parsing.PDF_PAGES_PER_VLM_REQUEST", 4),
+            patch("sotaforge.utils.parsing.MAX_PARSED_PDF_PAGES", 6),
+            patch("sotaforge.utils.parsing.PDF_TAIL_PAGES", 2),
+        ):
+            result = await parse_pdf_with_vlm(mock_pdf_file)
+
+        assert batches == ["1-4", "29-30"]
+        assert result == "Pages 1-4\n\nPages 29-30"
+        mock_pdf_file.unlink(missing_ok=True)
+
+    async def test_parse_pdf_from_bytes(self) -> None:
+        """Test that an in-memory PDF is rendered without a file on disk."""
+        source = fitz.open()
+        source.new_page()
+        pdf_bytes = source.tobytes()
+        source.close()
+
+        with patch(
+            "sotaforge.utils.parsing.parse_pages_with_vlm",
+            new=AsyncMock(return_value="Page text"),
+        ) as mock_vlm:
+            result = await parse_pdf_with_vlm(
+                "https://example.com/paper.pdf", pdf_bytes=pdf_bytes
+            )
+
+        assert result == "Page text"
+        mock_vlm.assert_awaited_once()
+
+    async def test_parse_pdf_from_mapped_file(self, tmp_path: Path) -> None:
+        """Test that a PDF on disk is opened through a memory map."""
+        pdf_path = tmp_path / "paper.pdf"
+        source = fitz.open()
+        source.new_page()
+        source.save(pdf_path)
+        source.close()
+
+        with (
+            patch("sotaforge.utils.parsing.mmap.mmap", wraps=mmap.mmap) as mock_mmap,
+            patch(
+                "sotaforge.utils.parsing.parse_pages_with_vlm",
+                new=AsyncMock(return_value="Page text"),
+            ),
+        ):
+            result = await parse_pdf_with_vlm(pdf_path)
+
+        assert result == "Page text"
+        mock_mmap.assert_called_once()
+
+    async def test_parse_pdf_uses_native_text_layer(self) -> None:
+        """Test that text pages skip the VLM and reference pages are dropped."""
+        source = fitz.open()
+        body = "\n".join(f"Sentence {i} describes the method." for i in range(30))
+        source.new_page().insert_text((50, 50), body, fontsize=8)
+        source.new_page()  # no text layer, as in a scanned page
+        references = "\n".join(f"[{i}] A. Author. Title {i}." for i in range(30))
+        source.new_page().insert_text((50, 50), references, fontsize=8)
+        pdf_bytes = source.tobytes()
+        source.close()
+
+        with patch(
+            "sotaforge.utils.parsing.parse_pages_with_vlm",
+            new=AsyncMock(return_value="Scanned text"),
+        ) as mock_vlm:
+            result = await parse_pdf_with_vlm(
+                "https://example.com/paper.pdf", pdf_bytes=pdf_bytes
+            )
+
+        mock_vlm.assert_awaited_once()
+        assert mock_vlm.call_args.kwargs["page_num"] == "2-2"
+        assert result.startswith("Sentence 0 describes the method.")
+        assert result.endswith("Sentence 29 describes the method.\n\nScanned text")
+        assert "A. Author" not in result
+
 
 class TestParseWebResult:
     """Tests for parse_web_result function."""
 
-    @pytest.mark.asyncio
     async def test_parse_web_result_success(self) -> None:
         """Test successful web result parsing."""
         doc = NotParsedDocument(
@@ -135,11 +420,12 @@ class TestParseWebResult:
 
         # Mock successful HTTP request
         mock_response = Mock()
-        mock_response.text = "<html><body><p>Full article content</p></body></html>"
+        mock_response.content = b"<html><body><p>Full article content</p></body></html>"
+        mock_response.charset_encoding = None
         mock_response.raise_for_status = Mock()
 
         with (
-            patch("sotaforge.utils.parsing.requests.get", return_value=mock_response),
+            mock_http_get(return_value=mock_response),
             patch(
                 "sotaforge.utils.parsing.trafilatura.extract",
                 return_value="Full article content here",
@@ -153,7 +439,99 @@ class TestParseWebResult:
             assert result.text == "Full article content here"
             assert result.snippet == "Short snippet"
 
-    @pytest.mark.asyncio
+    async def test_parse_web_result_article_fast_path(self) -> None:
+        """Test that a long <article> is used without running trafilatura."""
+        doc = NotParsedDocument(title="T", url="https://example.com/a", snippet="S")
+        paragraphs = "".join(f"<p>Paragraph {i} of the article.</p>" for i in range(40))
+        mock_response = Mock()
+        mock_response.content = (
+            f"<html><body><nav>Menu</nav><article>{paragraphs}"
+            "<script>track()</script></article></body></html>"
+        ).encode()
+        mock_response.charset_encoding = None
+
+        with (
+            mock_http_get(return_value=mock_response),
+            patch("sotaforge.utils.parsing.trafilatura.extract") as mock_extract,
+        ):
+            result = await parse_web_result(doc)
+
+        mock_extract.assert_not_called()
+        assert result.text.startswith("Paragraph 0 of the article.\nParagraph 1")
+        assert "Menu" not in result.text
+        assert "track()" not in result.text
+
+    async def test_parse_web_result_short_article_left_intact(self) -> None:
+        """Test that a rejected fast path hands trafilatura the unmodified tree."""
+        doc = NotParsedDocument(title="T", url="https://example.com/a", snippet="S")
+        mock_response = Mock()
+        mock_response.content = (
+            b"<html><body><article><p>Short</p><script>x()</script>tail"
+            b"</article></body></html>"
+        )
+        mock_response.charset_encoding = None
+
+        with (
+            mock_http_get(return_value=mock_response),
+            patch(
+                "sotaforge.utils.parsing.trafilatura.extract", return_value="Short"
+            ) as mock_extract,
+        ):
+            await parse_web_result(doc)
+
+        tree = mock_extract.call_args.args[0]
+        assert tree.find(".//script") is not None
+        assert tree.find(".//p").tail is None
+
+    async def test_parse_web_result_decodes_declared_charset(self) -> None:
+        """Test that raw bytes are decoded with the header's charset."""
+        doc = NotParsedDocument(title="T", url="https://example.com/a", snippet="S")
+        mock_response = Mock()
+        mock_response.content = "<html><body><p>Café résumé</p></body></html>".encode(
+            "latin-1"
+        )
+        mock_response.charset_encoding = "iso-8859-1"
+
+        with (
+            mock_http_get(return_value=mock_response),
+            patch("sotaforge.utils.parsing.trafilatura.extract") as mock_extract,
+        ):
+            await parse_web_result(doc)
+
+        tree = mock_extract.call_args.args[0]
+        assert tree.text_content() == "Café résumé"
+
+    @pytest.mark.parametrize("charset", [None, "no-such-charset"])
+    async def test_parse_web_result_sniffs_missing_or_unknown_charset(
+        self, charset: str | None
+    ) -> None:
+        """Test that pages without a usable header charset use <meta charset>."""
+        doc = NotParsedDocument(title="T", url="https://example.com/a", snippet="S")
+        mock_response = Mock()
+        mock_response.content = (
+            '<html><head><meta charset="iso-8859-1"></head>'
+            "<body><p>Café résumé</p></body></html>"
+        ).encode("latin-1")
+        mock_response.charset_encoding = charset
+
+        with (
+            mock_http_get(return_value=mock_response),
+            patch("sotaforge.utils.parsing.trafilatura.extract") as mock_extract,
+        ):
+            await parse_web_result(doc)
+
+        tree = mock_extract.call_args.args[0]
+        assert tree.find(".//p").text_content() == "Café résumé"
+
+    def test_html_parser_cache_is_bounded(self) -> None:
+        """Test that parsers are cached per normalized charset, within a bound."""
+        assert parsing._html_parser.cache_info().maxsize == 16
+        assert parsing._charset_name("Latin-1") == parsing._charset_name("ISO-8859-1")
+        # Python names the codec euc_jp; libxml2 only knows euc-jp
+        parser = parsing._html_parser(parsing._charset_name("EUC-JP"))
+        page = lxml.html.fromstring("<p>日本語</p>".encode("euc-jp"), parser=parser)
+        assert page.text_content() == "日本語"
+
     async def test_parse_web_result_trafilatura_fails(self) -> None:
         """Test web parsing fallback when trafilatura returns None."""
         doc = NotParsedDocument(
@@ -163,18 +541,18 @@ class TestParseWebResult:
         )
 
         mock_response = Mock()
-        mock_response.text = "<html><body>Content</body></html>"
+        mock_response.content = b"<html><body>Content</body></html>"
+        mock_response.charset_encoding = None
         mock_response.raise_for_status = Mock()
 
         with (
-            patch("sotaforge.utils.parsing.requests.get", return_value=mock_response),
+            mock_http_get(return_value=mock_response),
             patch("sotaforge.utils.parsing.trafilatura.extract", return_value=None),
         ):
             result = await parse_web_result(doc)
 
             assert result.text == "Short snippet"  # Fallback to snippet
 
-    @pytest.mark.asyncio
     async def test_parse_web_result_network_error(self) -> None:
         """Test web parsing handles network errors gracefully."""
         doc = NotParsedDocument(
@@ -183,16 +561,12 @@ class TestParseWebResult:
             snippet="Short snippet",
         )
 
-        with patch(
-            "sotaforge.utils.parsing.requests.get",
-            side_effect=requests.RequestException("Network error"),
-        ):
+        with mock_http_get(side_effect=httpx.ConnectError("Network error")):
             result = await parse_web_result(doc)
 
             # Should fall back to snippet
             assert result.text == "Short snippet"
 
-    @pytest.mark.asyncio
     async def test_parse_web_result_timeout(self) -> None:
         """Test web parsing handles timeout errors."""
         doc = NotParsedDocument(
@@ -201,19 +575,63 @@ class TestParseWebResult:
             snippet="Short snippet",
         )
 
-        with patch(
-            "sotaforge.utils.parsing.requests.get",
-            side_effect=requests.Timeout("Request timeout"),
-        ):
+        with mock_http_get(side_effect=httpx.ReadTimeout("Request timeout")):
             result = await parse_web_result(doc)
 
             assert result.text == "Short snippet"
 
 
+class TestParseCache:
+    """Tests for the parsed-text cache."""
+
+    def test_arxiv_versions_share_a_key(self) -> None:
+        """Test that arXiv abs/pdf URLs and versions map to one key."""
+        assert parsing._parse_cache_key(
+            "https://arxiv.org/abs/2401.12345v2"
+        ) == parsing._parse_cache_key("https://arxiv.org/pdf/2401.12345.pdf")
+
+    @pytest.mark.parametrize(
+        ("url", "key"),
+        [
+            ("https://arxiv.org/abs/2401.12345/", "arxiv:2401.12345"),
+            ("http://arxiv.org/abs/2401.12345v3?context=cs", "arxiv:2401.12345"),
+            ("https://arxiv.org/pdf/hep-th/9901001v1", "arxiv:hep-th/9901001"),
+            ("https://arxiv.org/abs/math.GT/0309136v2", "arxiv:math.GT/0309136"),
+            ("https://arxiv.org/pdf/cs.AI/0101001", "arxiv:cs.AI/0101001"),
+            (
+                "https://arxiv.org/list/cs.AI/recent",
+                "https://arxiv.org/list/cs.AI/recent",
+            ),
+        ],
+    )
+    def test_arxiv_key_from_url_variants(self, url: str, key: str) -> None:
+        """Test arXiv ids are found despite slashes, queries and old-style ids."""
+        assert parsing._parse_cache_key(url) == key
+
+    async def test_parse_web_result_uses_cache(self) -> None:
+        """Test that a second parse of the same URL skips the fetch."""
+        doc = NotParsedDocument(title="T", url="https://example.com/a", snippet="S")
+        mock_response = Mock()
+        mock_response.content = b"<html></html>"
+        mock_response.charset_encoding = None
+
+        with (
+            mock_http_get(return_value=mock_response) as get_client,
+            patch(
+                "sotaforge.utils.parsing.trafilatura.extract",
+                return_value="Full text",
+            ),
+        ):
+            first = await parse_web_result(doc)
+            second = await parse_web_result(doc)
+
+        assert first.text == second.text == "Full text"
+        get_client.return_value.get.assert_awaited_once()
+
+
 class TestParsePaperResult:
     """Tests for parse_paper_result function."""
 
-    @pytest.mark.asyncio
     async def test_parse_paper_result_abstract_only(self) -> None:
         """Test paper parsing with abstract only (no PDF fetch)."""
         doc = NotParsedDocument(
@@ -223,10 +641,7 @@ class TestParsePaperResult:
             abstract="This is the abstract of the paper.",
         )
 
-        with patch(
-            "sotaforge.utils.parsing.requests.get",
-            side_effect=requests.RequestException("Cannot fetch"),
-        ):
+        with mock_pdf_download(side_effect=httpx.ConnectError("Cannot fetch")):
             result = await parse_paper_result(doc)
 
             assert isinstance(result, ParsedDocument)
@@ -234,7 +649,6 @@ class TestParsePaperResult:
             assert result.text == "This is the abstract of the paper."
             assert result.snippet == "Paper snippet"
 
-    @pytest.mark.asyncio
     async def test_parse_paper_arxiv_url(self) -> None:
         """Test parsing arXiv paper URL."""
         doc = NotParsedDocument(
@@ -244,15 +658,10 @@ class TestParsePaperResult:
             abstract="Short abstract",
         )
 
-        # Mock PDF response
-        mock_pdf_response = Mock()
-        mock_pdf_response.content = b"%PDF-1.4\n%%EOF"
-        mock_pdf_response.raise_for_status = Mock()
-
         # Mock fitz
         mock_page = MagicMock()
         mock_pixmap = MagicMock()
-        mock_pixmap.pil_tobytes.return_value = b"fake_png_data"
+        mock_pixmap.tobytes.return_value = b"fake_png_data"
         mock_page.get_pixmap.return_value = mock_pixmap
 
         mock_document = MagicMock()
@@ -261,20 +670,64 @@ class TestParsePaperResult:
         mock_document.close = MagicMock()
 
         with (
-            patch(
-                "sotaforge.utils.parsing.requests.get", return_value=mock_pdf_response
-            ),
+            mock_arxiv_html(return_value=None),
+            mock_pdf_download(return_value=b"%PDF-1.4\n%%EOF") as mock_download,
             patch("sotaforge.utils.parsing.fitz.open", return_value=mock_document),
             patch(
-                "sotaforge.utils.parsing.parse_single_page_with_vlm",
+                "sotaforge.utils.parsing.parse_pages_with_vlm",
                 new=AsyncMock(return_value="Full paper text from VLM"),
             ),
         ):
             result = await parse_paper_result(doc)
 
             assert result.text == "Full paper text from VLM"
+            assert mock_download.call_args.args[0] == (
+                "https://arxiv.org/pdf/2401.12345.pdf"
+            )
+
+    async def test_parse_paper_arxiv_html_version_skips_pdf(self) -> None:
+        """Test that an arXiv HTML version is used without the PDF or VLM."""
+        doc = NotParsedDocument(
+            title="arXiv Paper",
+            url="https://arxiv.org/abs/2401.12345v2",
+            abstract="Short abstract",
+        )
+        paragraphs = "".join(f"<p>Section {i} of the paper.</p>" for i in range(40))
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert str(request.url) == "https://arxiv.org/html/2401.12345v2"
+            return httpx.Response(
+                200,
+                headers={"content-type": "text/html; charset=utf-8"},
+                content=f"<html><body><article>{paragraphs}</article></body></html>",
+            )
+
+        with (
+            mock_transport(handler),
+            mock_pdf_download() as mock_download,
+        ):
+            result = await parse_paper_result(doc)
+
+        mock_download.assert_not_called()
+        assert result.text.startswith("Section 0 of the paper.\nSection 1")
+
+    async def test_parse_paper_arxiv_without_html_uses_pdf(self) -> None:
+        """Test that a missing arXiv HTML version falls back to the PDF."""
+        doc = NotParsedDocument(
+            title="arXiv Paper",
+            url="https://arxiv.org/abs/2401.12345",
+            abstract="Short abstract",
+        )
+
+        with (
+            mock_transport(lambda request: httpx.Response(404)),
+            mock_pdf_download(return_value=None) as mock_download,
+        ):
+            result = await parse_paper_result(doc)
+
+        mock_download.assert_awaited_once()
+        assert result.text == "Short abstract"
 
-    @pytest.mark.asyncio
     async def test_parse_paper_pdf_content_type(self) -> None:
         """Test parsing non-arXiv paper with PDF content type."""
         doc = NotParsedDocument(
@@ -284,14 +737,9 @@ class TestParsePaperResult:
             abstract="Short abstract",
         )
 
-        mock_response = Mock()
-        mock_response.content = b"%PDF-1.4\n%%EOF"
-        mock_response.headers = {"content-type": "application/pdf"}
-        mock_response.raise_for_status = Mock()
-
         mock_page = MagicMock()
         mock_pixmap = MagicMock()
-        mock_pixmap.pil_tobytes.return_value = b"fake_png_data"
+        mock_pixmap.tobytes.return_value = b"fake_png_data"
         mock_page.get_pixmap.return_value = mock_pixmap
 
         mock_document = MagicMock()
@@ -300,10 +748,10 @@ class TestParsePaperResult:
         mock_document.close = MagicMock()
 
         with (
-            patch("sotaforge.utils.parsing.requests.get", return_value=mock_response),
+            mock_pdf_download(return_value=b"%PDF-1.4\n%%EOF"),
             patch("sotaforge.utils.parsing.fitz.open", return_value=mock_document),
             patch(
-                "sotaforge.utils.parsing.parse_single_page_with_vlm",
+                "sotaforge.utils.parsing.parse_pages_with_vlm",
                 new=AsyncMock(return_value="Extracted PDF text"),
             ),
         ):
@@ -311,7 +759,6 @@ class TestParsePaperResult:
 
             assert result.text == "Extracted PDF text"
 
-    @pytest.mark.asyncio
     async def test_parse_paper_non_pdf_content(self) -> None:
         """Test parsing paper with non-PDF content type."""
         doc = NotParsedDocument(
@@ -321,17 +768,12 @@ class TestParsePaperResult:
             abstract="This is the abstract",
         )
 
-        mock_response = Mock()
-        mock_response.headers = {"content-type": "text/html"}
-        mock_response.raise_for_status = Mock()
-
-        with patch("sotaforge.utils.parsing.requests.get", return_value=mock_response):
+        with mock_pdf_download(return_value=None):
             result = await parse_paper_result(doc)
 
             # Should fall back to abstract
             assert result.text == "This is the abstract"
 
-    @pytest.mark.asyncio
     async def test_parse_paper_vlm_extraction_shorter_than_abstract(self) -> None:
         """Test that abstract is used if VLM extraction is shorter."""
         doc = NotParsedDocument(
@@ -341,13 +783,9 @@ class TestParsePaperResult:
             abstract="This is a longer abstract with more content than VLM extract",
         )
 
-        mock_pdf_response = Mock()
-        mock_pdf_response.content = b"%PDF-1.4\n%%EOF"
-        mock_pdf_response.raise_for_status = Mock()
-
         mock_page = MagicMock()
         mock_pixmap = MagicMock()
-        mock_pixmap.pil_tobytes.return_value = b"fake_png_data"
+        mock_pixmap.tobytes.return_value = b"fake_png_data"
         mock_page.get_pixmap.return_value = mock_pixmap
 
         mock_document = MagicMock()
@@ -356,12 +794,11 @@ class TestParsePaperResult:
         mock_document.close = MagicMock()
 
         with (
-            patch(
-                "sotaforge.utils.parsing.requests.get", return_value=mock_pdf_response
-            ),
+            mock_arxiv_html(return_value=None),
+            mock_pdf_download(return_value=b"%PDF-1.4\n%%EOF"),
             patch("sotaforge.utils.parsing.fitz.open", return_value=mock_document),
             patch(
-                "sotaforge.utils.parsing.parse_single_page_with_vlm",
+                "sotaforge.utils.parsing.parse_pages_with_vlm",
                 new=AsyncMock(return_value="Short"),
             ),
         ):
@@ -8,7 +8,6 @@ import pytest
 from sotaforge.utils.errors import ConfigurationError, SearchError
 
 
-@pytest.mark.asyncio
 async def test_search_web_success(monkeypatch: pytest.MonkeyPatch) -> None:
     """Test successful web search."""
     import importlib
@@ -33,8 +32,8 @@ async def test_search_web_success(monkeypatch: pytest.MonkeyPatch) -> None:
     }
     mock_response.raise_for_status = MagicMock()
 
-    # Mock requests.post
-    with patch("requests.post", return_value=mock_response):
+    # Mock the Serper API call
+    with patch("httpx.AsyncClient.post", return_value=mock_response):
         monkeypatch.setenv("SERPER_API_KEY", "test_api_key")
 
         func = search_server.search_web.fn
@@ -48,7 +47,6 @@ async def test_search_web_success(monkeypatch: pytest.MonkeyPatch) -> None:
         assert result["results"][1]["title"] == "Result 2"
 
 
-@pytest.mark.asyncio
 async def test_search_web_empty_query(monkeypatch: pytest.MonkeyPatch) -> None:
     """Test web search with empty query raises error."""
     import importlib
@@ -66,7 +64,6 @@ async def test_search_web_empty_query(monkeypatch: pytest.MonkeyPatch) -> None:
         await func("   ", 10)
 
 
-@pytest.mark.asyncio
 async def test_search_web_invalid_max_results(monkeypatch: pytest.MonkeyPatch) -> None:
     """Test web search with invalid max_results raises error."""
     import importlib
@@ -84,7 +81,6 @@ async def test_search_web_invalid_max_results(monkeypatch: pytest.MonkeyPatch) -
         await func("query", 101)
 
 
-@pytest.mark.asyncio
 async def test_search_web_missing_api_key() -> None:
     """Test web search without API key raises error."""
     import importlib
@@ -106,7 +102,6 @@ async def test_search_web_missing_api_key() -> None:
             os.environ["SERPER_API_KEY"] = old_key
 
 
-@pytest.mark.asyncio
 async def test_search_web_pagination(monkeypatch: pytest.MonkeyPatch) -> None:
     """Test web search handles pagination correctly."""
     import importlib
@@ -135,7 +130,7 @@ async def test_search_web_pagination(monkeypatch: pytest.MonkeyPatch) -> None:
         mock_response.raise_for_status = MagicMock()
         return mock_response
 
-    with patch("requests.post", side_effect=mock_post):
+    with patch("httpx.AsyncClient.post", side_effect=mock_post):
         monkeypatch.setenv("SERPER_API_KEY", "test_api_key")
 
         func = search_server.search_web.fn
@@ -148,7 +143,6 @@ async def test_search_web_pagination(monkeypatch: pytest.MonkeyPatch) -> None:
         assert len(result["results"]) == 25
 
 
-@pytest.mark.asyncio
 async def test_search_web_api_error_handling(monkeypatch: pytest.MonkeyPatch) -> None:
     """Test web search handles API errors gracefully."""
     import importlib
@@ -156,7 +150,7 @@ async def test_search_web_api_error_handling(monkeypatch: pytest.MonkeyPatch) ->
     search_server = importlib.import_module("sotaforge.agents.search_server")
 
     # Mock failing request
-    with patch("requests.post", side_effect=Exception("API Error")):
+    with patch("httpx.AsyncClient.post", side_effect=Exception("API Error")):
         monkeypatch.setenv("SERPER_API_KEY", "test_api_key")
 
         func = search_server.search_web.fn
@@ -167,7 +161,6 @@ async def test_search_web_api_error_handling(monkeypatch: pytest.MonkeyPatch) ->
         assert result["results"] == []
 
 
-@pytest.mark.asyncio
 async def test_search_papers_success() -> None:
     """Test successful arXiv paper search."""
     import importlib
@@ -209,7 +202,6 @@ async def test_search_papers_success() -> None:
         assert result["results"][1]["venue"] == "cs.AI"
 
 
-@pytest.mark.asyncio
 async def test_search_papers_empty_query() -> None:
     """Test paper search with empty query raises error."""
     import importlib
@@ -225,7 +217,6 @@ async def test_search_papers_empty_query() -> None:
         await func("   ", 10)
 
 
-@pytest.mark.asyncio
 async def test_search_papers_invalid_max_results() -> None:
     """Test paper search with invalid max_results raises error."""
     import importlib
@@ -241,7 +232,6 @@ async def test_search_papers_invalid_max_results() -> None:
         await func("query", 101)
 
 
-@pytest.mark.asyncio
 async def test_search_papers_parsing_error() -> None:
     """Test paper search handles parsing errors gracefully."""
     import importlib
@@ -258,7 +248,6 @@ async def test_search_papers_parsing_error() -> None:
         assert result["results"] == []
 
 
-@pytest.mark.asyncio
 async def test_search_papers_missing_fields() -> None:
     """Test paper search handles missing/incomplete entry fields."""
     import importlib
@@ -288,7 +277,6 @@ async def test_search_papers_missing_fields() -> None:
         assert result["results"][0]["venue"] == ""
 
 
-@pytest.mark.asyncio
 async def test_search_papers_max_results_limit() -> None:
     """Test that search_papers respects max_results limit."""
     import importlib
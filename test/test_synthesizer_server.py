@@ -2,17 +2,18 @@
 
 from types import SimpleNamespace
 from typing import Any
+from unittest.mock import AsyncMock
 
 import pytest
 
+from sotaforge.utils.constants import SYNTHESIZER_PROMPT_TEXT_LIMIT
+from sotaforge.utils.models import NotParsedDocument, ParsedDocument, SourceType
+
 
-@pytest.mark.asyncio
 async def test_write_sota_success(monkeypatch: pytest.MonkeyPatch) -> None:
     """Test successful SOTA generation from documents."""
     from sotaforge.utils import llm
 
-    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
-
     class DummyClient:
         def __init__(self, api_key: str | None = None, **kwargs: Any) -> None:
             self.api_key = api_key
@@ -38,8 +39,6 @@ async def test_write_sota_success(monkeypatch: pytest.MonkeyPatch) -> None:
 
     import importlib
 
-    from sotaforge.utils.models import ParsedDocument
-
     synthesizer_server = importlib.import_module("sotaforge.agents.synthesizer_server")
 
     # Create mock documents
@@ -63,7 +62,7 @@ async def test_write_sota_success(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setattr(
         synthesizer_server,
         "db_store",
-        SimpleNamespace(fetch_documents=lambda c: docs),
+        SimpleNamespace(fetch_documents_async=AsyncMock(return_value=docs)),
     )
 
     func = synthesizer_server.write_sota.fn
@@ -74,7 +73,6 @@ async def test_write_sota_success(monkeypatch: pytest.MonkeyPatch) -> None:
     assert len(result["text"]) > 0
 
 
-@pytest.mark.asyncio
 async def test_write_sota_empty_collection(monkeypatch: pytest.MonkeyPatch) -> None:
     """Test SOTA generation with empty collection."""
     import importlib
@@ -84,7 +82,7 @@ async def test_write_sota_empty_collection(monkeypatch: pytest.MonkeyPatch) -> N
     monkeypatch.setattr(
         synthesizer_server,
         "db_store",
-        SimpleNamespace(fetch_documents=lambda c: []),
+        SimpleNamespace(fetch_documents_async=AsyncMock(return_value=[])),
     )
 
     func = synthesizer_server.write_sota.fn
@@ -94,13 +92,9 @@ async def test_write_sota_empty_collection(monkeypatch: pytest.MonkeyPatch) -> N
     assert "No documents found" in result["text"]
 
 
-@pytest.mark.asyncio
 async def test_write_sota_with_long_text(monkeypatch: pytest.MonkeyPatch) -> None:
     """Test SOTA generation handles long document text by using snippets."""
     from sotaforge.utils import llm
-    from sotaforge.utils.constants import SYNTHESIZER_PROMPT_TEXT_LIMIT
-
-    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
 
     # Track what content was sent to LLM
     sent_content = []
@@ -131,8 +125,6 @@ async def test_write_sota_with_long_text(monkeypatch: pytest.MonkeyPatch) -> Non
 
     import importlib
 
-    from sotaforge.utils.models import ParsedDocument
-
     synthesizer_server = importlib.import_module("sotaforge.agents.synthesizer_server")
 
     # Create document with very long text (longer than the limit)
@@ -152,7 +144,7 @@ async def test_write_sota_with_long_text(monkeypatch: pytest.MonkeyPatch) -> Non
     monkeypatch.setattr(
         synthesizer_server,
         "db_store",
-        SimpleNamespace(fetch_documents=lambda c: docs),
+        SimpleNamespace(fetch_documents_async=AsyncMock(return_value=docs)),
     )
 
     func = synthesizer_server.write_sota.fn
@@ -164,13 +156,10 @@ async def test_write_sota_with_long_text(monkeypatch: pytest.MonkeyPatch) -> Non
     assert not any(long_text in content for content in sent_content)
 
 
-@pytest.mark.asyncio
 async def test_write_sota_with_short_text(monkeypatch: pytest.MonkeyPatch) -> None:
     """Test SOTA generation uses full text when it's short enough."""
     from sotaforge.utils import llm
 
-    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
-
     sent_content = []
 
     class DummyClient:
@@ -198,8 +187,6 @@ async def test_write_sota_with_short_text(monkeypatch: pytest.MonkeyPatch) -> No
 
     import importlib
 
-    from sotaforge.utils.models import ParsedDocument
-
     synthesizer_server = importlib.import_module("sotaforge.agents.synthesizer_server")
 
     short_text = "Short content about AI research"
@@ -216,7 +203,7 @@ async def test_write_sota_with_short_text(monkeypatch: pytest.MonkeyPatch) -> No
     monkeypatch.setattr(
         synthesizer_server,
         "db_store",
-        SimpleNamespace(fetch_documents=lambda c: docs),
+        SimpleNamespace(fetch_documents_async=AsyncMock(return_value=docs)),
     )
 
     func = synthesizer_server.write_sota.fn
@@ -227,15 +214,12 @@ async def test_write_sota_with_short_text(monkeypatch: pytest.MonkeyPatch) -> No
     assert any(short_text in content for content in sent_content)
 
 
-@pytest.mark.asyncio
 async def test_write_sota_filters_not_parsed_documents(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     """Test that not-parsed documents are filtered out."""
     from sotaforge.utils import llm
 
-    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
-
     class DummyClient:
         def __init__(self, api_key: str | None = None, **kwargs: Any) -> None:
             self.api_key = api_key
@@ -254,8 +238,6 @@ async def test_write_sota_filters_not_parsed_documents(
 
     import importlib
 
-    from sotaforge.utils.models import NotParsedDocument, ParsedDocument
-
     synthesizer_server = importlib.import_module("sotaforge.agents.synthesizer_server")
 
     # Mix of parsed and not parsed documents
@@ -276,7 +258,7 @@ async def test_write_sota_filters_not_parsed_documents(
     monkeypatch.setattr(
         synthesizer_server,
         "db_store",
-        SimpleNamespace(fetch_documents=lambda c: docs),
+        SimpleNamespace(fetch_documents_async=AsyncMock(return_value=docs)),
     )
 
     func = synthesizer_server.write_sota.fn
@@ -286,15 +268,12 @@ async def test_write_sota_filters_not_parsed_documents(
     # Should still work, only using parsed documents
 
 
-@pytest.mark.asyncio
 async def test_write_sota_empty_llm_response_none(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     """Test SOTA generation with empty LLM response (None content)."""
     from sotaforge.utils import llm
 
-    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
-
     class DummyClient:
         def __init__(self, api_key: str | None = None, **kwargs: Any) -> None:
             self.api_key = api_key
@@ -311,8 +290,6 @@ async def test_write_sota_empty_llm_response_none(
 
     import importlib
 
-    from sotaforge.utils.models import ParsedDocument
-
     synthesizer_server = importlib.import_module("sotaforge.agents.synthesizer_server")
 
     docs = [
@@ -328,7 +305,7 @@ async def test_write_sota_empty_llm_response_none(
     monkeypatch.setattr(
         synthesizer_server,
         "db_store",
-        SimpleNamespace(fetch_documents=lambda c: docs),
+        SimpleNamespace(fetch_documents_async=AsyncMock(return_value=docs)),
     )
 
     func = synthesizer_server.write_sota.fn
@@ -338,15 +315,12 @@ async def test_write_sota_empty_llm_response_none(
     assert result["text"] == "No summary generated."
 
 
-@pytest.mark.asyncio
 async def test_write_sota_includes_document_metadata(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     """Test that SOTA generation includes document metadata in prompts."""
     from sotaforge.utils import llm
 
-    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
-
     sent_content = []
 
     class DummyClient:
@@ -372,12 +346,8 @@ async def test_write_sota_includes_document_metadata(
 
     import importlib
 
-    from sotaforge.utils.models import ParsedDocument
-
     synthesizer_server = importlib.import_module("sotaforge.agents.synthesizer_server")
 
-    from sotaforge.utils.models import SourceType
-
     docs = [
         ParsedDocument(
             title="Test Paper",
@@ -392,7 +362,7 @@ async def test_write_sota_includes_document_metadata(
     monkeypatch.setattr(
         synthesizer_server,
         "db_store",
-        SimpleNamespace(fetch_documents=lambda c: docs),
+        SimpleNamespace(fetch_documents_async=AsyncMock(return_value=docs)),
     )
 
     func = synthesizer_server.write_sota.fn
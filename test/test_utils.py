@@ -2,15 +2,44 @@
 
 from typing import Any
 
-import pytest
+from sotaforge.utils.utils import ProgressQueue, get_tools_for_openai
 
-from sotaforge.utils.utils import get_tools_for_openai
+
+class TestProgressQueue:
+    """Tests for ProgressQueue."""
+
+    async def test_put_drops_oldest_when_full(self) -> None:
+        """Test that a full queue evicts the oldest event instead of blocking."""
+        queue = ProgressQueue(maxsize=2)
+
+        await queue.put(1)
+        await queue.put(2)
+        await queue.put(None)
+
+        assert queue.qsize() == 2
+        assert await queue.get() == 2
+        assert await queue.get() is None
+
+    async def test_put_never_drops_terminal_events(self) -> None:
+        """Test that the result-carrying event survives a full queue."""
+        queue = ProgressQueue(maxsize=3)
+        completed = {"status": "completed", "result": {"text": "SOTA"}}
+
+        await queue.put({"status": "running", "message": "step 1"})
+        await queue.put(completed)
+        await queue.put({"status": "running", "message": "step 2"})
+        await queue.put(None)
+
+        assert [await queue.get() for _ in range(3)] == [
+            completed,
+            {"status": "running", "message": "step 2"},
+            None,
+        ]
 
 
 class TestGetToolsForOpenAI:
     """Tests for get_tools_for_openai function."""
 
-    @pytest.mark.asyncio
     async def test_get_tools_for_openai_all_tools(
         self, mock_fastmcp_server: Any
     ) -> None:
@@ -26,7 +55,6 @@ class TestGetToolsForOpenAI:
         assert "parse_document" in tool_names
         assert "internal_debug" in tool_names
 
-    @pytest.mark.asyncio
     async def test_get_tools_for_openai_with_prefix_filter(
         self, mock_fastmcp_server: Any
     ) -> None:
@@ -38,7 +66,6 @@ class TestGetToolsForOpenAI:
         assert len(tools) == 1
         assert tools[0]["function"]["name"] == "search_query"
 
-    @pytest.mark.asyncio
     async def test_get_tools_for_openai_multiple_prefixes(
         self, mock_fastmcp_server: Any
     ) -> None:
@@ -53,7 +80,6 @@ class TestGetToolsForOpenAI:
         assert "parse_document" in tool_names
         assert "internal_debug" not in tool_names
 
-    @pytest.mark.asyncio
     async def test_get_tools_for_openai_structure(
         self, mock_fastmcp_server: Any
     ) -> None:
@@ -76,7 +102,6 @@ class TestGetToolsForOpenAI:
         assert params["type"] == "object"
         assert "properties" in params
 
-    @pytest.mark.asyncio
     async def test_get_tools_for_openai_empty_prefix_filter(
         self, mock_fastmcp_server: Any
     ) -> None:
@@ -86,7 +111,6 @@ class TestGetToolsForOpenAI:
         # Empty prefix list means no filtering - returns all tools
         assert len(tools) == 3
 
-    @pytest.mark.asyncio
     async def test_get_tools_for_openai_nonexistent_prefix(
         self, mock_fastmcp_server: Any
     ) -> None:
@@ -97,7 +121,6 @@ class TestGetToolsForOpenAI:
 
         assert len(tools) == 0
 
-    @pytest.mark.asyncio
     async def test_get_tools_for_openai_default_parameters(
         self, mock_fastmcp_server: Any
     ) -> None:
@@ -110,3 +133,13 @@ class TestGetToolsForOpenAI:
         params = tools[0]["function"]["parameters"]
         assert params["type"] == "object"
         # The actual implementation may not include empty properties/required
+
+    async def test_get_tools_for_openai_returns_fresh_dicts(
+        self, mock_fastmcp_server: Any
+    ) -> None:
+        """Test that callers never share the converted tool dicts."""
+        first = await get_tools_for_openai(mock_fastmcp_server)
+        second = await get_tools_for_openai(mock_fastmcp_server)
+
+        assert first == second
+        assert first[0] is not second[0]